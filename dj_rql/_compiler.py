@@ -0,0 +1,211 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from django.db.migrations.serializer import serializer_factory
+from django.db.models import Field, ForeignObjectRel, Model, Prefetch
+
+from dj_rql._dataclasses import CompiledFilterSchema, FilterItem, SelectNode
+from dj_rql.qs import Annotation, DBOptimization
+
+
+HEADER = """#
+#  Generated by the `compile_rql_class` command for `{source}`.
+#  Don't edit this module manually, regenerate it after filter class or models changes.
+#
+# flake8: noqa
+"""
+
+
+class FilterSchemaCompilationError(Exception):
+    pass
+
+
+class FilterSchemaCompiler:
+    """Renderer of a compiled filter class schema into the source code of a Python module.
+
+    Module can be loaded without traversal of models and filter declarations.
+    Shared optimization objects (f.e. annotations, that are extended to nested filters)
+    are rendered as module level variables to keep their identity.
+    """
+
+    INDENT = '    '
+
+    def __init__(self, filter_cls):
+        self.filter_cls = filter_cls
+
+        self._imports = {
+            'from dj_rql._dataclasses import CompiledFilterSchema, FilterItem, SelectNode',
+        }
+        self._definitions = []
+        self._optimization_names = {}
+
+    def render(self):
+        schema = self._build_schema()
+
+        schema_code = self._render_call(
+            'CompiledFilterSchema',
+            (
+                (attr, getattr(schema, attr))
+                for attr in CompiledFilterSchema.__slots__
+                if attr != 'select_plans'
+            ),
+            0,
+        )
+
+        imports = sorted(self._imports, key=lambda i: (i.startswith('from '), i.split()[1]))
+        definitions = ''.join('{0} = {1}\n'.format(*d) for d in self._definitions)
+        return '{header}\n{imports}\n\n{definitions}SCHEMA = {schema}\n'.format(
+            header=HEADER.format(source=self._get_qual_name(self.filter_cls)),
+            imports='\n'.join(imports),
+            definitions=(definitions + '\n') if definitions else '',
+            schema=schema_code,
+        )
+
+    def _build_schema(self):
+        # Schema is always built from declarations, even if the class is already compiled
+        filter_cls = type(self.filter_cls.__name__, (self.filter_cls,), {'COMPILED_SCHEMA': None})
+        filter_cls.__module__ = self.filter_cls.__module__
+
+        instance = filter_cls(None)
+        instance.compile_filters()
+        return instance.schema
+
+    def _render(self, value, depth):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return repr(value)
+
+        if isinstance(value, FilterItem):
+            return self._render_call('FilterItem', value.items(), depth)
+
+        if isinstance(value, SelectNode):
+            return self._render_call('SelectNode', value.items(), depth)
+
+        if isinstance(value, DBOptimization):
+            return self._render_optimization(value)
+
+        if isinstance(value, (Field, ForeignObjectRel)) and hasattr(value, 'model'):
+            return self._render_model_field(value)
+
+        if isinstance(value, type) and issubclass(value, Model):
+            return self._render_serialized(value)
+
+        if type(value) is dict:
+            items = (
+                '{0}: {1}'.format(self._render(k, depth + 1), self._render(v, depth + 1))
+                for k, v in value.items()
+            )
+            return self._render_items('{', '}', items, depth)
+
+        if type(value) is list:
+            return self._render_items('[', ']', (self._render(v, depth + 1) for v in value), depth)
+
+        if type(value) is tuple:
+            items = [self._render(v, depth + 1) for v in value]
+            if len(items) == 1:
+                return '({0},)'.format(items[0])
+
+            return self._render_items('(', ')', items, depth)
+
+        if type(value) in (set, frozenset):
+            if not value:
+                return '{0}()'.format(type(value).__name__)
+
+            items = sorted(self._render(v, depth + 1) for v in value)
+            code = self._render_items('{', '}', items, depth)
+            return code if type(value) is set else 'frozenset({0})'.format(code)
+
+        return self._render_serialized(value)
+
+    def _render_items(self, opening, closing, items, depth):
+        items = list(items)
+        if not items:
+            return opening + closing
+
+        if depth > 1:
+            return '{0}{1}{2}'.format(opening, ', '.join(items), closing)
+
+        indent = self.INDENT * (depth + 1)
+        return '{0}\n{1}{2}\n{3}{4}'.format(
+            opening,
+            ''.join('{0}{1},\n'.format(indent, item) for item in items[:-1]),
+            '{0}{1},'.format(indent, items[-1]),
+            self.INDENT * depth,
+            closing,
+        )
+
+    def _render_call(self, name, kwargs, depth):
+        items = ('{0}={1}'.format(k, self._render(v, depth + 1)) for k, v in kwargs)
+        return name + self._render_items('(', ')', items, depth)
+
+    def _render_optimization(self, optimization):
+        name = self._optimization_names.get(id(optimization))
+        if name:
+            return name
+
+        relations = []
+        for relation in () if isinstance(optimization, Annotation) else optimization.relations:
+            if isinstance(relation, Prefetch):
+                relation = self._render_prefetch(relation)
+            else:
+                relation = self._render(relation, 2)
+
+            relations.append(relation)
+
+        extensions = [
+            '{0}={1}'.format(k, self._render(v, 2)) for k, v in optimization.extensions.items()
+        ]
+
+        name = '_OPTIMIZATION_{0}'.format(len(self._optimization_names) + 1)
+        self._optimization_names[id(optimization)] = name
+        self._definitions.append(
+            (
+                name,
+                '{0}({1})'.format(
+                    self._render_serialized(type(optimization)),
+                    ', '.join(relations + extensions),
+                ),
+            ),
+        )
+        return name
+
+    def _render_prefetch(self, prefetch):
+        if prefetch.queryset is not None:
+            raise FilterSchemaCompilationError(
+                "Prefetch with a queryset can't be compiled: {0}.".format(prefetch.prefetch_to),
+            )
+
+        self._imports.add('from django.db.models import Prefetch')
+        return 'Prefetch({0}, to_attr={1})'.format(
+            repr(prefetch.prefetch_through),
+            repr(prefetch.to_attr),
+        )
+
+    def _render_model_field(self, field):
+        model = field.model
+        model_code = self._render_serialized(model)
+
+        attname = getattr(field, 'attname', None)
+        descriptor = model.__dict__.get(attname) if attname else None
+        if getattr(descriptor, 'field', None) is field:
+            return '{0}.{1}.field'.format(model_code, attname)
+
+        if model._meta.get_field(field.name) is not field:
+            raise FilterSchemaCompilationError(
+                "Field can't be compiled: {0}.{1}.".format(model._meta.label, field.name),
+            )
+
+        return '{0}._meta.get_field({1})'.format(model_code, repr(field.name))
+
+    def _render_serialized(self, value):
+        try:
+            code, imports = serializer_factory(value).serialize()
+        except ValueError as e:
+            raise FilterSchemaCompilationError(str(e))
+
+        self._imports.update(imports)
+        return code
+
+    @staticmethod
+    def _get_qual_name(cls):
+        return '{0}.{1}'.format(cls.__module__, cls.__qualname__)
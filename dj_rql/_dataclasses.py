@@ -2,6 +2,9 @@
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
 
+from collections.abc import MutableMapping
+from copy import deepcopy
+
 
 class OptimizationArgs:
     def __init__(self, queryset, select_data, filter_tree, filter_node=None, filter_path=None):
@@ -42,3 +45,252 @@ class FilterArgs:
         self.filter_lookup = kwargs.get('filter_lookup')
         self.django_lookup = kwargs.get('django_lookup')
         self.distinct = kwargs.get('distinct')
+
+
+class CompiledFilterSchema:
+    """Result of filter class compilation, that is shared between requests.
+
+    Attributes can't be reassigned and sets are frozen. Dicts are not copied on purpose:
+    they are shared between threads and must never be mutated after compilation. Subclasses
+    extend sets per instance by reassignment (f.e. `self.ordering_filters |= {'name'}`).
+    """
+
+    __slots__ = (
+        'filters',
+        'ordering_filters',
+        'search_filters',
+        'select_tree',
+        'default_exclusions',
+        'annotations',
+        'allowed_ordering_permutations',
+        'lazy_namespaces',
+        'select_plans',
+    )
+
+    def __init__(
+        self,
+        filters,
+        ordering_filters,
+        search_filters,
+        select_tree,
+        default_exclusions,
+        annotations,
+        allowed_ordering_permutations=None,
+        lazy_namespaces=None,
+    ):
+        """
+        :param dict filters: Linear mapping of full filter names to filter items
+        :param set ordering_filters: Names of filters, that can be used for ordering
+        :param set search_filters: Names of filters, that are used for searching
+        :param dict select_tree: Detailed tree structure of filter items
+        :param set default_exclusions: Names of filters, that are deselected by default
+        :param dict annotations: Mapping of full filter names to lists of annotations
+        :param set or None allowed_ordering_permutations: Allowed ordering permutations
+        :param dict or None lazy_namespaces: Not compiled namespaces data by filter routes
+        """
+        if allowed_ordering_permutations is not None:
+            allowed_ordering_permutations = frozenset(allowed_ordering_permutations)
+
+        set_attr = super().__setattr__
+        set_attr('filters', filters)
+        set_attr('ordering_filters', frozenset(ordering_filters))
+        set_attr('search_filters', frozenset(search_filters))
+        set_attr('select_tree', select_tree)
+        set_attr('default_exclusions', frozenset(default_exclusions))
+        set_attr('annotations', annotations)
+        set_attr('allowed_ordering_permutations', allowed_ordering_permutations)
+        set_attr('lazy_namespaces', lazy_namespaces or {})
+
+        # The only mutable part of the schema: select plans cache, that is filled on demand
+        set_attr('select_plans', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Compiled filter schema is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Compiled filter schema is immutable.')
+
+
+class QueryPlan:
+    """Picklable result of RQL query compilation, that can be applied without query parsing.
+
+    Plans don't depend on querysets, so they can be shared between processes.
+    """
+
+    __slots__ = (
+        'rql_ast',
+        'filter_names',
+        'q',
+        'ordering',
+        'distinct',
+        'select',
+        'usage',
+        'ordering_properties',
+    )
+
+    def __init__(
+        self,
+        rql_ast,
+        filter_names,
+        q,
+        ordering,
+        distinct,
+        select,
+        usage=(),
+        ordering_properties=(),
+    ):
+        """
+        :param lark.Tree or None rql_ast: Parsed RQL query
+        :param frozenset filter_names: Names of filters, that are used in the query
+        :param django.db.models.Q or None q: Filtering expression
+        :param tuple or None ordering: Ordering ORM expressions
+        :param bool distinct: If True, distinct must be applied to the queryset
+        :param tuple select: Select properties from the query
+        :param tuple usage: Usage keys of filters, ordering and select for `UsageStats`
+        :param tuple ordering_properties: Ordering properties from the query (f.e. `-author.email`)
+        """
+        self.rql_ast = rql_ast
+        self.filter_names = filter_names
+        self.q = q
+        self.ordering = ordering
+        self.distinct = distinct
+        self.select = select
+        self.usage = usage
+        self.ordering_properties = ordering_properties
+
+
+_INTERNED_SETS = {}
+
+
+def intern_set(values):
+    """Frozen set, that is shared between all filter items with the same values."""
+    values = frozenset(values)
+    return _INTERNED_SETS.setdefault(values, values)
+
+
+def _restore_slots_mapping(cls, items):
+    return _SlotsMapping.__new__(cls)._set_items(items)
+
+
+class _SlotsMapping(MutableMapping):
+    """Dict-compatible view on `__slots__` attributes.
+
+    Only keys from `__slots__` can be set by item assignment, attributes can't be set directly.
+    Copies (`copy()`, `copy.copy()` and `copy.deepcopy()`) are plain dicts, so they can be
+    extended by callers (f.e. in OpenAPI generation). Pickling keeps the type.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        self._set_items(kwargs)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        object.__setattr__(self, key, value)
+
+    def __delitem__(self, key):
+        try:
+            object.__delattr__(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} attributes are set by keys.'.format(type(self).__name__))
+
+    def copy(self):
+        return dict(self.items())
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = {}
+        for key, value in self.items():
+            result[key] = deepcopy(value, memo)
+
+        return result
+
+    def __reduce__(self):
+        return _restore_slots_mapping, (type(self), self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def _set_items(self, items):
+        for key, value in items.items():
+            object.__setattr__(self, key, value)
+
+        return self
+
+
+class FilterItem(_SlotsMapping):
+    __slots__ = (
+        'field',
+        'orm_route',
+        'lookups',
+        'null_values',
+        'distinct',
+        'hidden',
+        'use_repr',
+        'openapi',
+        'index_restricted',
+        'prefix_lookups',
+    )
+
+    def __init__(self, field, orm_route, lookups, null_values, distinct, hidden, **kwargs):
+        """
+        :param django.db.models.Field field: Filtered model field
+        :param str orm_route: Django ORM route to the field
+        :param set lookups: Supported RQL lookups (interned)
+        :param set null_values: Values, that are treated as NULL (interned)
+        :param bool distinct: If queryset must be DISTINCT after filtering
+        :param bool hidden: If filter is deselected by default
+        :param dict kwargs: Optional `use_repr` and `openapi` settings and `index_restricted`
+            and `prefix_lookups` sets of the index policy
+        """
+        super().__init__(
+            field=field,
+            orm_route=orm_route,
+            lookups=intern_set(lookups),
+            null_values=intern_set(null_values),
+            distinct=distinct,
+            hidden=hidden,
+            **kwargs,
+        )
+
+
+class SelectNode(_SlotsMapping):
+    __slots__ = ('hidden', 'fields', 'namespace', 'qs', 'path', 'prefetch')
+
+    def __init__(self, hidden, fields, namespace, qs, path, prefetch=None):
+        """
+        :param bool hidden: If node is deselected by default
+        :param dict fields: Child select nodes
+        :param bool namespace: If node is a namespace
+        :param dj_rql.qs.DBOptimization or None qs: Node queryset optimization
+        :param str path: Full RQL field path
+        :param dict or None prefetch: Select-aware prefetch settings of the namespace
+        """
+        super().__init__(
+            hidden=hidden,
+            fields=fields,
+            namespace=namespace,
+            qs=qs,
+            path=path,
+            prefetch=prefetch,
+        )
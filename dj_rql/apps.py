@@ -0,0 +1,57 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class DjRQLConfig(AppConfig):
+    """
+    Django RQL application configuration.
+
+    Filter classes of DRF views are built on application start (except management commands),
+    if the `RQL_WARM_UP` setting is enabled, or on the first request of the process, if it's
+    set to `'first_request'`. Query caches are filled with common queries from the
+    `RQL_WARM_UP_QUERIES_FILE`.
+    Slow queries are logged, if the `RQL_SLOW_QUERY_LOG` setting is set to a dict
+    of `SlowQueryLog` options. Usage stats are collected, if the `RQL_USAGE_STATS` setting
+    is set to a dict of `UsageStats.enable()` options. Sampled queries are recorded, if the
+    `RQL_QUERY_RECORDER` setting is set to a dict of `QueryRecorder` options.
+    """
+
+    name = 'dj_rql'
+    verbose_name = 'Django RQL'
+
+    def ready(self):
+        warm_up_mode = getattr(settings, 'RQL_WARM_UP', False)
+        if warm_up_mode:
+            from dj_rql.drf.warm_up import (
+                WARM_UP_FIRST_REQUEST,
+                warm_up_on_first_request,
+                warm_up_on_start,
+            )
+
+            queries_file = getattr(settings, 'RQL_WARM_UP_QUERIES_FILE', None)
+            if warm_up_mode == WARM_UP_FIRST_REQUEST:
+                warm_up_on_first_request(queries_file=queries_file)
+            else:
+                warm_up_on_start(queries_file=queries_file)
+
+        slow_query_log_options = getattr(settings, 'RQL_SLOW_QUERY_LOG', None)
+        if slow_query_log_options is not None:
+            from dj_rql.drf.slow_queries import SlowQueryLog
+
+            SlowQueryLog(**slow_query_log_options).connect()
+
+        usage_stats_options = getattr(settings, 'RQL_USAGE_STATS', None)
+        if usage_stats_options is not None:
+            from dj_rql.stats import usage_stats
+
+            usage_stats.enable(**usage_stats_options)
+
+        query_recorder_options = getattr(settings, 'RQL_QUERY_RECORDER', None)
+        if query_recorder_options is not None:
+            from dj_rql.drf.query_recorder import QueryRecorder
+
+            QueryRecorder(**query_recorder_options).connect()
@@ -0,0 +1,442 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import pickle
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from hashlib import sha1
+from contextlib import nullcontext
+from threading import Lock, RLock
+from weakref import WeakSet
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models import Field, Prefetch, QuerySet
+from lark import Tree
+
+from dj_rql.qs import DBOptimization
+
+
+class QueryPlansCache:
+    """Queries cache, that stores query plans in the Django cache framework.
+
+    Unlike in-process caches (f.e. `cachetools.LRUCache`), plans are shared between processes,
+    if a shared cache store (f.e. Redis or Memcached) is used. Cached plans are applied
+    without query parsing. Set the class as `QUERIES_CACHE_BACKEND` of a filter class and
+    subclass it to change the cache alias, timeout or version:
+
+    ``` py3
+
+        class SharedQueryPlansCache(QueryPlansCache):
+            CACHE_ALIAS = 'rql'
+            TIMEOUT = 3600
+
+        class BooksFilterClass(RQLFilterClass):
+            QUERIES_CACHE_BACKEND = SharedQueryPlansCache
+    ```
+
+    Plans are keyed by filter class version and the query. The version is calculated from
+    filter class attributes and compiled filters, ordering, search, select tree and annotations
+    (only from filter declarations for classes with lazy namespaces). Cached ordering is
+    validated against current filters. Increase `VERSION` to invalidate plans, that depend
+    on changed custom filtering logic or, for lazy namespaces, on changed model fields.
+    """
+
+    CACHE_ALIAS = 'default'
+    """Alias of the Django cache (default `'default'`)."""
+
+    TIMEOUT = DEFAULT_TIMEOUT
+    """Timeout of cached plans in seconds (default timeout of the Django cache)."""
+
+    KEY_PREFIX = 'dj_rql'
+    """Prefix of cache keys (default `'dj_rql'`)."""
+
+    VERSION = 1
+    """Version of cached plans (default 1)."""
+
+    VERSION_ATTRIBUTES = (
+        'MODEL',
+        'DISTINCT',
+        'SELECT',
+        'EXTENDED_SEARCH_ORM_ROUTES',
+        'MAX_ORDERING_LENGTH_IN_QUERY',
+        'ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY',
+        'INDEX_POLICY',
+        'INDEX_POLICY_OVERRIDES',
+    )
+    """Filter class attributes, that are a part of the filter class version."""
+
+    def __init__(self, maxsize=None):
+        # Number of plans is limited by the Django cache store, not by this instance
+        self.maxsize = maxsize
+        self._filter_class_versions = {}
+
+    @property
+    def cache(self):
+        return caches[self.CACHE_ALIAS]
+
+    def get(self, filter_instance, key):
+        """
+        Get a cached query plan.
+
+        Args:
+            filter_instance (RQLFilterClass): filter class instance.
+            key (str): queryset and query key.
+
+        Returns:
+            QueryPlan: query plan or None, if the plan is not cached.
+        """
+        try:
+            return self.cache.get(self.make_key(filter_instance, key))
+        except (pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+            # Plans of incompatible library versions are considered as missing
+            return None
+
+    def set(self, filter_instance, key, query_plan):
+        """
+        Cache a query plan.
+
+        Args:
+            filter_instance (RQLFilterClass): filter class instance.
+            key (str): queryset and query key.
+            query_plan (QueryPlan): query plan to cache.
+        """
+        try:
+            self.cache.set(self.make_key(filter_instance, key), query_plan, self.TIMEOUT)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Plans with unpicklable values (f.e. from custom filters) are not cached
+            pass
+
+    def make_key(self, filter_instance, key):
+        digest = sha1(
+            '{0}\n{1}'.format(self._get_filter_class_version(filter_instance), key).encode(),
+        ).hexdigest()
+        return '{0}:{1}'.format(self.KEY_PREFIX, digest)
+
+    def _get_filter_class_version(self, filter_instance):
+        filter_class = type(filter_instance)
+        qual_name = '{0}.{1}'.format(filter_class.__module__, filter_class.__qualname__)
+
+        version = self._filter_class_versions.get(qual_name)
+        if version is None:
+            version = self._build_filter_class_version(filter_instance, qual_name)
+            self._filter_class_versions[qual_name] = version
+
+        return version
+
+    def _build_filter_class_version(self, filter_instance, qual_name):
+        filter_class = type(filter_instance)
+        describe = _ConfigDescriber().describe
+
+        parts = [self.VERSION, qual_name]
+        parts.extend(describe(getattr(filter_class, attr)) for attr in self.VERSION_ATTRIBUTES)
+
+        # Lazy namespaces are compiled on demand, so only declarations can be a part of the version
+        if filter_instance.LAZY_NAMESPACES:
+            parts.append(describe(filter_instance._get_init_filters()))
+        else:
+            schema = filter_instance.schema
+            parts.extend(
+                describe(getattr(schema, attr))
+                for attr in (
+                    'filters',
+                    'ordering_filters',
+                    'search_filters',
+                    'select_tree',
+                    'default_exclusions',
+                    'annotations',
+                    'allowed_ordering_permutations',
+                )
+            )
+
+        return sha1(repr(parts).encode()).hexdigest()
+
+
+class _ConfigDescriber:
+    """Stable between processes description of filter class configuration for hashing.
+
+    Object addresses are removed from representations, so objects without own representation
+    are described only by their types.
+    """
+
+    _ADDRESS_RE = re.compile(r' at 0x[0-9a-fA-F]+')
+
+    def __init__(self):
+        self._descriptions = {}
+
+    def describe(self, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+
+        # Equal subtrees are shared in filter declarations, so they are described once
+        description = self._descriptions.get(id(value))
+        if description is None:
+            description = self._descriptions[id(value)] = (value, self._describe(value))
+
+        return description[1]
+
+    def _describe(self, value):
+        if isinstance(value, Mapping):
+            return tuple(sorted(((repr(k), self.describe(v)) for k, v in value.items())))
+
+        if isinstance(value, (list, tuple)):
+            return tuple(self.describe(v) for v in value)
+
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted((self.describe(v) for v in value), key=repr))
+
+        if isinstance(value, type):
+            return '{0}.{1}'.format(value.__module__, value.__qualname__)
+
+        if isinstance(value, Field):
+            model = getattr(value, 'model', None)
+            if model is None:
+                # Output fields of expressions
+                return self.describe(value.deconstruct()[1:])
+
+            return 'field:{0}.{1}'.format(self.describe(model), value.name)
+
+        if isinstance(value, Prefetch):
+            queryset = value.queryset
+            return (
+                'Prefetch',
+                value.prefetch_through,
+                value.to_attr,
+                None if queryset is None else self.describe(queryset.model),
+            )
+
+        if isinstance(value, QuerySet):
+            # Representation of a queryset is evaluated
+            return 'QuerySet', self.describe(value.model)
+
+        if isinstance(value, DBOptimization):
+            return (
+                self.describe(type(value)),
+                self.describe(value.relations),
+                self.describe(value.extensions),
+            )
+
+        deconstruct = getattr(value, 'deconstruct', None)
+        if callable(deconstruct):
+            # Django expressions and Q objects
+            return self.describe(deconstruct())
+
+        return self._ADDRESS_RE.sub('', repr(value))
+
+
+class MemoryBoundedCache:
+    """LRU queries cache, that is bounded by the approximate size of cached results in bytes.
+
+    Set the class as `QUERIES_CACHE_BACKEND` of a filter class, `QUERIES_CACHE_SIZE` is treated
+    as the byte budget of the cache. Results, that are larger than a `MAX_ITEM_SIZE_RATIO`
+    part of the budget (f.e. queries with huge `in()` lists), are not cached, so they can't
+    evict small hot queries. If `GLOBAL_MAXSIZE` is set, the total size of all instances
+    in the process is bounded too: each instance gets a fair share of the global budget,
+    and shares, that are not used by smaller instances, are split between larger ones.
+    If a write exceeds the global budget, items of instances, that exceed their shares most,
+    are evicted, so a full cache can't starve others:
+
+    ``` py3
+
+        class QueriesCache(MemoryBoundedCache):
+            GLOBAL_MAXSIZE = 256 * 1024 * 1024
+
+        class BooksFilterClass(RQLFilterClass):
+            QUERIES_CACHE_BACKEND = QueriesCache
+            QUERIES_CACHE_SIZE = 16 * 1024 * 1024
+    ```
+    """
+
+    MAX_ITEM_SIZE_RATIO = 0.25
+    """Max size of a cached result as a part of the cache budget (default 0.25)."""
+
+    GLOBAL_MAXSIZE = None
+    """Max total size of all cache instances in the process in bytes (default `None`)."""
+
+    # Approximate sizes of a filtered queryset and of a filtering lookup of its query,
+    #  that are calibrated with `tracemalloc`
+    QUERYSET_SIZE = 2560
+    LOOKUP_SIZE = 720
+
+    _INSTANCES = WeakSet()
+    _INSTANCES_LOCK = Lock()
+
+    # Sizes of globally bounded instances are changed only under this lock
+    _GLOBAL_LOCK = RLock()
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.currsize = 0
+
+        self._data = OrderedDict()
+        self._sizes = {}
+
+        with self._INSTANCES_LOCK:
+            self._INSTANCES.add(self)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        with self._get_global_lock():
+            if key in self._data:
+                self.pop(key)
+
+            budget = self._get_budget()
+            while self._data and self.currsize > budget:
+                self.popitem()
+
+            size = self.getsizeof(value)
+            if size > budget * self.MAX_ITEM_SIZE_RATIO:
+                return
+
+            while self._data and self.currsize + size > budget:
+                self.popitem()
+
+            if not self._evict_global(size):
+                return
+
+            self._data[key] = value
+            self._sizes[key] = size
+            self.currsize += size
+
+    def __delitem__(self, key):
+        with self._get_global_lock():
+            del self._data[key]
+            self.currsize -= self._sizes.pop(key)
+
+    def pop(self, key, *args):
+        if key not in self._data:
+            if args:
+                return args[0]
+
+            raise KeyError(key)
+
+        value = self._data[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        key = next(iter(self._data))
+        return key, self.pop(key)
+
+    def clear(self):
+        with self._get_global_lock():
+            self._data.clear()
+            self._sizes.clear()
+            self.currsize = 0
+
+    def getsizeof(self, value):
+        """
+        Approximate size of a cached filtering result.
+
+        Args:
+            value (tuple): RQL AST and filtered queryset.
+
+        Returns:
+            int: size in bytes.
+        """
+        rql_ast, queryset = value
+        return self._get_ast_size(rql_ast) + self._get_queryset_size(queryset)
+
+    def _get_budget(self):
+        """Max size of the instance, that is limited by its fair share of `GLOBAL_MAXSIZE`."""
+        if self.GLOBAL_MAXSIZE is None:
+            return self.maxsize
+
+        maxsizes = sorted(instance.maxsize for instance in self._get_global_instances())
+
+        budget = self.GLOBAL_MAXSIZE
+        for index, maxsize in enumerate(maxsizes):
+            share = budget // (len(maxsizes) - index)
+            if maxsize >= share:
+                return min(self.maxsize, share)
+
+            budget -= maxsize
+
+        return self.maxsize
+
+    def _get_global_lock(self):
+        return nullcontext() if self.GLOBAL_MAXSIZE is None else self._GLOBAL_LOCK
+
+    def _evict_global(self, size):
+        """Evicts items of instances, that exceed their shares most, until the size fits.
+
+        Returns:
+            bool: True, if the size fits into `GLOBAL_MAXSIZE`.
+        """
+        if self.GLOBAL_MAXSIZE is None:
+            return True
+
+        instances = self._get_global_instances()
+        budgets = {instance: instance._get_budget() for instance in instances}
+        while self._get_global_size(instances) + size > self.GLOBAL_MAXSIZE:
+            instance = max(
+                (instance for instance in instances if instance._data),
+                key=lambda instance: instance.currsize - budgets[instance],
+                default=None,
+            )
+            if instance is None:
+                return False
+
+            # Readers of other instances treat concurrently evicted keys as cache misses
+            instance.popitem()
+
+        return True
+
+    @classmethod
+    def _get_global_instances(cls):
+        with cls._INSTANCES_LOCK:
+            return [instance for instance in cls._INSTANCES if instance.GLOBAL_MAXSIZE is not None]
+
+    @classmethod
+    def _get_global_size(cls, instances=None):
+        if instances is None:
+            instances = cls._get_global_instances()
+
+        return sum(instance.currsize for instance in instances)
+
+    @staticmethod
+    def _get_ast_size(rql_ast):
+        size = 0
+        nodes = [] if rql_ast is None else [rql_ast]
+        while nodes:
+            node = nodes.pop()
+            size += sys.getsizeof(node)
+
+            if isinstance(node, Tree):
+                size += sys.getsizeof(node.children)
+                nodes.extend(node.children)
+
+        return size
+
+    @classmethod
+    def _get_queryset_size(cls, queryset):
+        size = cls.QUERYSET_SIZE
+        nodes = [queryset.query.where]
+        while nodes:
+            node = nodes.pop()
+            if hasattr(node, 'rhs'):
+                size += cls.LOOKUP_SIZE + cls._get_value_size(node.rhs)
+            else:
+                nodes.extend(getattr(node, 'children', ()))
+
+        return size
+
+    @staticmethod
+    def _get_value_size(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+
+        return sys.getsizeof(value)
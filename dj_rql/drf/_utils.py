@@ -4,6 +4,35 @@
 
 from urllib.parse import unquote
 
+from lark import Tree
+
 
 def get_query(drf_request):
     return unquote(drf_request._request.META['QUERY_STRING'])
+
+
+def normalize_query(query, rql_ast):
+    """RQL query, where all values are replaced with `?` to group queries with the same shape."""
+    if rql_ast is None:
+        return query
+
+    value_positions = []
+    for tree in rql_ast.iter_subtrees():
+        if tree.data != 'val':
+            continue
+
+        for token in tree.children:
+            if isinstance(token, Tree):
+                continue
+
+            start_pos = getattr(token, 'start_pos', None)
+            if start_pos is None:
+                start_pos = token.pos_in_stream
+
+            value_positions.append((start_pos, token.end_pos))
+
+    normalized_query = query
+    for start_pos, end_pos in sorted(value_positions, reverse=True):
+        normalized_query = normalized_query[:start_pos] + '?' + normalized_query[end_pos:]
+
+    return normalized_query
@@ -1,23 +1,82 @@
 #
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
-from threading import Lock
+from random import random
+from threading import Event, Lock
 
 from rest_framework.filters import BaseFilterBackend
 
+from dj_rql.cache import QueryPlansCache
 from dj_rql.drf._utils import get_query
-
-
-lock = Lock()
+from dj_rql.drf.server_timing import start_server_timing
+from dj_rql.signals import QueryCacheEvents, send_query_cache_event
+from dj_rql.stats import usage_stats
 
 
 class _FilterClassCache:
     CACHE = {}
+    LOCKS = {}
 
     @classmethod
     def clear(cls):
         cls.CACHE = {}
 
+    @classmethod
+    def get_lock(cls, qual_name):
+        """Build lock of a filter class, so different filter classes are built concurrently."""
+        build_lock = cls.LOCKS.get(qual_name)
+        if build_lock is not None:
+            return build_lock
+
+        return cls.LOCKS.setdefault(qual_name, Lock())
+
+
+class _QueriesCacheLock:
+    """Lock of a queries cache with single-flight de-duplication of concurrent cache misses.
+
+    Only one thread applies filters for a missing key, while other threads with the same key
+    wait for its result. Caches from `cachetools` are not thread-safe even for reads,
+    so all cache operations are done under the lock.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._in_flight = {}
+
+    def get_or_apply(self, cache, key, apply):
+        """Cached or applied result and number of evicted entries (`None` for cached results)."""
+        while True:
+            with self._lock:
+                try:
+                    return cache[key], None
+                except KeyError:
+                    pass
+
+                event = self._in_flight.get(key)
+                if event is None:
+                    event = self._in_flight[key] = Event()
+                    break
+
+            # If the result is evicted or filters are failed, the key is retried
+            event.wait()
+
+        try:
+            result = apply()
+            with self._lock:
+                size = len(cache)
+                cache[key] = result
+
+                # Caches can refuse to store results (f.e. `MemoryBoundedCache` for large ones)
+                evictions = size - len(cache) + (1 if key in cache else 0)
+
+            return result, evictions
+
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+            event.set()
+
 
 class RQLFilterBackend(BaseFilterBackend):
     """
@@ -49,7 +108,20 @@ class RQLFilterBackend(BaseFilterBackend):
 
     OPENAPI_RETRIEVE_SPECIFICATION = False
 
+    SERVER_TIMING_SAMPLE_RATE = 0
+    """Fraction of requests with the `Server-Timing` header of RQL stages (default 0)."""
+
+    QUERY_RECORDER = None
+    """`QueryRecorder` of sampled queries, that is set by its `connect()` (default `None`)."""
+
+    HEAVY_QUERY_COST = None
+    """Min cost of queries by `RQLFilterClass.get_query_cost()`, that are heavy (default `None`)."""
+
+    HEAVY_QUERY_DATABASE = None
+    """DB alias, that heavy queries are routed to (f.e. a replica) (default `None`)."""
+
     _CACHES = {}
+    _CACHE_LOCKS = {}
 
     def filter_queryset(self, request, queryset, view):
         """Return a filtered queryset."""
@@ -57,6 +129,9 @@ class RQLFilterBackend(BaseFilterBackend):
         if not filter_class:
             return queryset
 
+        if self.SERVER_TIMING_SAMPLE_RATE and random() < self.SERVER_TIMING_SAMPLE_RATE:
+            start_server_timing(request)
+
         filter_instance = self._get_filter_instance(filter_class, queryset, view)
         query = self.get_query(filter_instance, request, view)
 
@@ -73,12 +148,25 @@ class RQLFilterBackend(BaseFilterBackend):
             cache_key = str(queryset.query) + query
 
             query_cache = self._get_or_init_cache(filter_class, view)
-            try:
-                filters_result = query_cache[cache_key]
-            except KeyError:
-                filters_result = filter_instance.apply_filters(query, request, view)
-                with lock:
-                    query_cache[cache_key] = filters_result
+            if isinstance(query_cache, QueryPlansCache):
+                filters_result = self._apply_filters_with_plans_cache(
+                    query_cache,
+                    cache_key,
+                    filter_instance,
+                    query,
+                    request,
+                    view,
+                )
+            else:
+                filters_result, evictions = self._get_cache_lock(
+                    filter_class,
+                    view,
+                ).get_or_apply(
+                    query_cache,
+                    cache_key,
+                    lambda: filter_instance.apply_filters(query, request, view),
+                )
+                self._send_query_cache_events(filter_class, view, evictions)
 
         else:
             filters_result = filter_instance.apply_filters(query, request, view)
@@ -86,9 +174,23 @@ class RQLFilterBackend(BaseFilterBackend):
         rql_ast, queryset = filters_result
 
         request.rql_ast = rql_ast
+        request.rql_query = query
         if queryset.select_data:
             request.rql_select = queryset.select_data
 
+        if self.QUERY_RECORDER is not None:
+            self.QUERY_RECORDER.record(view, filter_class, query, rql_ast)
+
+        if usage_stats.enabled:
+            usage = getattr(queryset, 'rql_usage', None) or ()
+            usage_stats.record_usage(filter_class, usage)
+            request.rql_usage = (filter_class, usage)
+
+        database = self.get_query_database(filter_instance, queryset, request, view)
+        if database is not None:
+            request.rql_database = database
+            return queryset.using(database)
+
         return queryset.all()
 
     def get_schema_operation_parameters(self, view):
@@ -116,14 +218,69 @@ class RQLFilterBackend(BaseFilterBackend):
     def get_query(cls, filter_instance, request, view):
         return get_query(request)
 
+    def get_query_database(self, filter_instance, queryset, request, view):
+        """DB alias for the filtered queryset or `None` to keep the default DB routing.
+
+        Queries with the cost not less than `HEAVY_QUERY_COST` are routed to
+        the `HEAVY_QUERY_DATABASE` by default. Only read requests are routed, as querysets
+        of other methods are used for writes.
+        """
+        if self.HEAVY_QUERY_DATABASE is None or self.HEAVY_QUERY_COST is None:
+            return None
+
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return None
+
+        cost = filter_instance.get_query_cost(getattr(queryset, 'rql_query_plan', None))
+        request.rql_query_cost = cost
+        if cost >= self.HEAVY_QUERY_COST:
+            return self.HEAVY_QUERY_DATABASE
+
+        return None
+
+    @staticmethod
+    def _apply_filters_with_plans_cache(plans_cache, key, filter_instance, query, request, view):
+        filter_class = type(filter_instance)
+
+        query_plan = plans_cache.get(filter_instance, key)
+        if query_plan is not None:
+            send_query_cache_event(filter_class, QueryCacheEvents.HIT, view)
+            return filter_instance.apply_query_plan(query_plan, request, view)
+
+        send_query_cache_event(filter_class, QueryCacheEvents.MISS, view)
+        filters_result = filter_instance.apply_filters(query, request, view)
+        plans_cache.set(filter_instance, key, filter_instance.query_plan)
+        return filters_result
+
+    @staticmethod
+    def _send_query_cache_events(filter_class, view, evictions):
+        if evictions is None:
+            send_query_cache_event(filter_class, QueryCacheEvents.HIT, view)
+        else:
+            send_query_cache_event(filter_class, QueryCacheEvents.MISS, view)
+            send_query_cache_event(filter_class, QueryCacheEvents.EVICTION, view, evictions)
+
     @classmethod
     def _get_or_init_cache(cls, filter_class, view):
         qual_name = cls._get_filter_cls_qual_name(view, filter_class)
+        query_cache = cls._CACHES.get(qual_name)
+        if query_cache is not None:
+            return query_cache
+
         return cls._CACHES.setdefault(
             qual_name,
             filter_class.QUERIES_CACHE_BACKEND(int(filter_class.QUERIES_CACHE_SIZE)),
         )
 
+    @classmethod
+    def _get_cache_lock(cls, filter_class, view):
+        qual_name = cls._get_filter_cls_qual_name(view, filter_class)
+        cache_lock = cls._CACHE_LOCKS.get(qual_name)
+        if cache_lock is not None:
+            return cache_lock
+
+        return cls._CACHE_LOCKS.setdefault(qual_name, _QueriesCacheLock())
+
     @classmethod
     def _get_filter_instance(cls, filter_class, queryset, view):
         qual_name = cls._get_filter_cls_qual_name(view, filter_class)
@@ -132,9 +289,15 @@ class RQLFilterBackend(BaseFilterBackend):
         if filter_instance:
             return filter_class(queryset=queryset, instance=filter_instance)
 
-        filter_instance = filter_class(queryset)
-        _FilterClassCache.CACHE[qual_name] = filter_instance
-        return filter_instance
+        with _FilterClassCache.get_lock(qual_name):
+            # Concurrent first requests must not build the same filter class several times
+            filter_instance = _FilterClassCache.CACHE.get(qual_name)
+            if filter_instance:
+                return filter_class(queryset=queryset, instance=filter_instance)
+
+            filter_instance = filter_class(queryset)
+            _FilterClassCache.CACHE[qual_name] = filter_instance
+            return filter_instance
 
     @staticmethod
     def _get_filter_cls_qual_name(view, filter_class):
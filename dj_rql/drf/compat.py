@@ -262,6 +262,8 @@ class DjangoFiltersRQLFilterBackend(CompatibilityRQLFilterBackend):
         if old_syntax_filters:
             return old_syntax_filters
 
+        filter_instance.compile_filters()
+
         similar_to_old_syntax_filters = set()
         for filter_name in filter_instance.filters.keys():
             if cls._is_old_style_filter(filter_name):
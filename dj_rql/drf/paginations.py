@@ -9,6 +9,8 @@ from rest_framework.pagination import LimitOffsetPagination, _positive_int
 from rest_framework.response import Response
 
 from dj_rql.drf._utils import get_query
+from dj_rql.drf.server_timing import set_server_timing_header
+from dj_rql.signals import Stages, measure_stage
 from dj_rql.transformer import RQLLimitOffsetTransformer
 
 
@@ -25,6 +27,8 @@ class RQLLimitOffsetPagination(LimitOffsetPagination):
         return schema
 
     def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+
         rql_ast = None
         try:
             rql_ast = request.rql_ast
@@ -45,16 +49,15 @@ class RQLLimitOffsetPagination(LimitOffsetPagination):
 
         self.limit = self.get_limit(request)
         if self.limit == 0:
-            self.count = self.get_count(queryset)
+            self.count = self._get_measured_count(queryset, request, view)
             self.offset = 0
             return []
 
         elif self.limit is None:
             return None
 
-        self.count = self.get_count(queryset)
+        self.count = self._get_measured_count(queryset, request, view)
         self.offset = self.get_offset(request)
-        self.request = request
         if self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
@@ -64,7 +67,30 @@ class RQLLimitOffsetPagination(LimitOffsetPagination):
         if self.limit + self.offset > self.count:
             self.limit = self.count - self.offset
 
-        return list(queryset[self.offset : self.offset + self.limit])
+        page_queryset = queryset[self.offset : self.offset + self.limit]
+        with measure_stage(
+            type(self),
+            Stages.FETCH,
+            request=request,
+            view=view,
+            queryset=page_queryset,
+        ):
+            return list(page_queryset)
+
+    def _get_measured_count(self, queryset, request, view):
+        with measure_stage(
+            type(self),
+            Stages.COUNT,
+            request=request,
+            view=view,
+            queryset=queryset,
+        ):
+            return self.get_count(queryset)
+
+    def get_paginated_response(self, data):
+        response = super(RQLLimitOffsetPagination, self).get_paginated_response(data)
+        set_server_timing_header(response, self.request)
+        return response
 
     def get_limit(self, *args):
         if self._rql_limit is not None:
@@ -102,4 +128,6 @@ class RQLContentRangeLimitOffsetPagination(RQLLimitOffsetPagination):
             self.offset + length,
             self.count,
         )
-        return Response(data, headers={'Content-Range': content_range})
+        response = Response(data, headers={'Content-Range': content_range})
+        set_server_timing_header(response, self.request)
+        return response
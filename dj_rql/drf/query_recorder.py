@@ -0,0 +1,252 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+from math import ceil
+from random import random
+from threading import Lock
+from time import perf_counter
+
+from django.db import DatabaseError
+from django.utils.module_loading import import_string
+from lark.exceptions import LarkError
+from py_rql.exceptions import RQLFilterError
+
+from dj_rql.drf._utils import normalize_query
+from dj_rql.drf.backend import RQLFilterBackend
+from dj_rql.signals import Stages, measure_stage, stage_finished
+from dj_rql.transformer import RQLLimitOffsetTransformer
+
+
+class QueryRecorder:
+    """Recorder of sampled RQL queries of DRF views into a local JSON lines file.
+
+    Each line contains the view, the filter class, the query and its shape, where all values
+    are replaced with `?`. Recorded files are replayed by the `rql_replay_queries` command.
+    Queries are recorded with values, so the file must be protected as well as request logs.
+    """
+
+    def __init__(self, path, sample_rate=1.0, max_queries=None):
+        """
+        :param str path: Path to the corpus file, queries are appended to it
+        :param float sample_rate: Fraction of queries, that are recorded
+        :param int or None max_queries: Max number of recorded queries per process
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_queries = max_queries
+
+        self._lock = Lock()
+        self._file = None
+        self._recorded = 0
+
+    def connect(self):
+        RQLFilterBackend.QUERY_RECORDER = self
+
+    def disconnect(self):
+        if RQLFilterBackend.QUERY_RECORDER is self:
+            RQLFilterBackend.QUERY_RECORDER = None
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def record(self, view, filter_class, query, rql_ast):
+        if self.sample_rate < 1 and random() >= self.sample_rate:
+            return
+
+        line = json.dumps(
+            {
+                'view': self._get_qual_name(type(view)),
+                'filter_class': self._get_qual_name(filter_class),
+                'query': query,
+                'shape': normalize_query(query, rql_ast),
+            },
+        )
+
+        with self._lock:
+            if self.max_queries is not None and self._recorded >= self.max_queries:
+                return
+
+            if self._file is None:
+                self._file = open(self.path, 'a')
+
+            self._file.write(line + '\n')
+            self._file.flush()
+            self._recorded += 1
+
+    @staticmethod
+    def _get_qual_name(cls):
+        return '{0}.{1}'.format(cls.__module__, cls.__qualname__)
+
+
+class QueryReplay:
+    """Replay of recorded queries against filter classes and a database.
+
+    Each query is applied by the filter class without queries caches, then its count
+    and page are fetched as by the RQL limit offset pagination. Stage durations
+    are reported as percentiles for all queries and per query shape.
+    """
+
+    STAGES = (
+        Stages.PARSE,
+        Stages.TRANSFORM,
+        Stages.ORDERING,
+        Stages.SELECT,
+        Stages.OPTIMIZATIONS,
+        Stages.COUNT,
+        Stages.FETCH,
+    )
+    TOTAL = 'total'
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, filter_class=None, database=None, repeat=1, default_limit=10):
+        """
+        :param type or None filter_class: Filter class for all queries, recorded filter classes
+            are used by default
+        :param str or None database: Database alias, the default database is used if not set
+        :param int repeat: Number of replays of each query
+        :param int default_limit: Page size for queries without limit
+        """
+        self.filter_class = filter_class
+        self.database = database
+        self.repeat = repeat
+        self.default_limit = default_limit
+
+        self._filter_instances = {}
+        self._durations = {}
+
+    def run(self, records):
+        """
+        Args:
+            records (iterable): dicts with `filter_class`, `query` and `shape` keys.
+
+        Returns:
+            dict: number of queries and errors, stage duration percentiles (in seconds)
+                for all queries and per shape, errors of failed queries per shape.
+        """
+        all_durations, shapes = {}, {}
+
+        stage_finished.connect(self._add_duration, weak=False, dispatch_uid='dj_rql_query_replay')
+        try:
+            for record in records:
+                filter_class = self.filter_class or import_string(record['filter_class'])
+                shape_key = '{0}.{1}: {2}'.format(
+                    filter_class.__module__,
+                    filter_class.__qualname__,
+                    record.get('shape', record['query']),
+                )
+                shape = shapes.setdefault(
+                    shape_key,
+                    {'queries': 0, 'errors': 0, 'failures': {}, 'durations': {}},
+                )
+
+                for _ in range(self.repeat):
+                    durations, error = self._replay(filter_class, record['query'])
+                    if error is not None:
+                        shape['errors'] += 1
+                        shape['failures'][record['query']] = error
+                        continue
+
+                    shape['queries'] += 1
+                    for stage, duration in durations.items():
+                        shape['durations'].setdefault(stage, []).append(duration)
+                        all_durations.setdefault(stage, []).append(duration)
+        finally:
+            stage_finished.disconnect(dispatch_uid='dj_rql_query_replay')
+
+        return {
+            'queries': sum(shape['queries'] for shape in shapes.values()),
+            'errors': sum(shape['errors'] for shape in shapes.values()),
+            'stages': self._get_percentiles(all_durations),
+            'shapes': {
+                shape_key: {
+                    'queries': shape['queries'],
+                    'errors': shape['errors'],
+                    'failures': shape['failures'],
+                    'stages': self._get_percentiles(shape['durations']),
+                }
+                for shape_key, shape in shapes.items()
+            },
+        }
+
+    @classmethod
+    def percentile(cls, values, percent):
+        """Nearest-rank percentile of sorted values."""
+        return values[max(ceil(percent / 100 * len(values)) - 1, 0)]
+
+    def _replay(self, filter_class, query):
+        self._durations = {}
+        start = perf_counter()
+
+        try:
+            rql_ast, queryset = self._get_filter_instance(filter_class).apply_filters(query)
+            limit, offset = self._get_limit_offset(rql_ast)
+
+            with measure_stage(type(self), Stages.COUNT):
+                queryset.count()
+
+            with measure_stage(type(self), Stages.FETCH):
+                list(queryset[offset : offset + limit])
+        except (RQLFilterError, DatabaseError, ValueError) as e:
+            # Queries can be invalid for changed filter classes or DB schemas, or have
+            # limits and offsets, that are not valid for slicing
+            return None, self._format_error(e)
+
+        durations = self._durations
+        durations[self.TOTAL] = perf_counter() - start
+        return durations, None
+
+    @staticmethod
+    def _format_error(error):
+        message = str(error)
+        details = getattr(error, 'details', None)
+        if details and details.get('error'):
+            message = '{0} {1}'.format(message, details['error'])
+
+        return '{0}: {1}'.format(type(error).__name__, message)
+
+    def _get_filter_instance(self, filter_class):
+        queryset = filter_class.MODEL._default_manager.using(self.database).all()
+
+        filter_instance = self._filter_instances.get(filter_class)
+        if filter_instance is None:
+            filter_instance = self._filter_instances[filter_class] = filter_class(queryset)
+            return filter_instance
+
+        return filter_class(queryset=queryset, instance=filter_instance)
+
+    def _get_limit_offset(self, rql_ast):
+        limit, offset = None, None
+        if rql_ast is not None:
+            try:
+                limit, offset = RQLLimitOffsetTransformer().transform(rql_ast)
+            except LarkError:
+                pass
+
+        limit = self.default_limit if limit is None else int(limit)
+        offset = 0 if offset is None else int(offset)
+        if limit < 0 or offset < 0:
+            raise ValueError('Limit and offset must not be negative.')
+
+        return limit, offset
+
+    def _add_duration(self, sender, stage, duration, **kwargs):
+        self._durations[stage] = self._durations.get(stage, 0) + duration
+
+    def _get_percentiles(self, durations):
+        percentiles = {}
+        for stage in self.STAGES + (self.TOTAL,):
+            values = sorted(durations.get(stage, ()))
+            if not values:
+                continue
+
+            percentiles[stage] = {
+                'count': len(values),
+                **{'p{0}'.format(p): self.percentile(values, p) for p in self.PERCENTILES},
+                'max': values[-1],
+            }
+
+        return percentiles
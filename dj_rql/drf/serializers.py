@@ -3,38 +3,145 @@
 #
 
 from collections import OrderedDict
-from copy import deepcopy
+from functools import lru_cache
+
+from rest_framework.serializers import LIST_SERIALIZER_KWARGS, ListSerializer
+
+from dj_rql.signals import Stages, measure_stage
+
+
+try:
+    from rest_framework.serializers import LIST_SERIALIZER_KWARGS_REMOVE
+except ImportError:  # pragma: no cover
+    # DRF < 3.15 pops the same list only arguments one by one
+    LIST_SERIALIZER_KWARGS_REMOVE = ('allow_empty', 'min_length', 'max_length')
+
+
+class _RQLSelectMask:
+    """Select data of one serializer level, resolved into a pre-split field mask.
+
+    Masks are shared between serializers and requests, so they must never be mutated.
+    """
+
+    __slots__ = ('excluded', 'nested')
+
+    def __init__(self, excluded, nested):
+        """
+        :param tuple excluded: Names of current level fields, that must be removed
+        :param tuple nested: Pairs of current level field names and their deeper select items
+        """
+        self.excluded = excluded
+        self.nested = nested
+
+
+@lru_cache(maxsize=512)
+def _compile_rql_select_mask(select_items):
+    excluded = []
+    nested = OrderedDict()
+
+    for field_name, is_included in select_items:
+        current_depth_field_name, _, deeper_depth_field_name = field_name.partition('.')
+
+        if not deeper_depth_field_name:
+            if not is_included:
+                excluded.append(current_depth_field_name)
+
+        # Deeper selects of fields, that were already excluded on this level, are not applied
+        elif current_depth_field_name not in excluded:
+            nested.setdefault(current_depth_field_name, []).append(
+                (deeper_depth_field_name, is_included),
+            )
+
+    return _RQLSelectMask(
+        tuple(excluded),
+        tuple((field_name, tuple(items)) for field_name, items in nested.items()),
+    )
+
+
+def _get_rql_select_mask(select):
+    return _compile_rql_select_mask(tuple(select.items()))
+
+
+class RQLListSerializer(ListSerializer):
+    """List serializer of `RQLMixin` serializers, that measures serialization of all objects once.
+
+    It's the default `Meta.list_serializer_class` of `RQLMixin` serializers, custom list
+    serializer classes can inherit it.
+    """
+
+    def to_representation(self, data):
+        if self.root is not self:
+            return super(RQLListSerializer, self).to_representation(data)
+
+        with measure_stage(
+            type(self.child),
+            Stages.SERIALIZATION,
+            request=self.context.get('request'),
+        ):
+            return super(RQLListSerializer, self).to_representation(data)
 
 
 class RQLMixin:
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        # Same as `BaseSerializer.many_init()`, but with `RQLListSerializer` by default
+        list_kwargs = {}
+        for key in LIST_SERIALIZER_KWARGS_REMOVE:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+
+        list_kwargs['child'] = cls(*args, **kwargs)
+        list_kwargs.update(
+            {key: value for key, value in kwargs.items() if key in LIST_SERIALIZER_KWARGS},
+        )
+
+        meta = getattr(cls, 'Meta', None)
+        list_serializer_class = getattr(meta, 'list_serializer_class', RQLListSerializer)
+        return list_serializer_class(*args, **list_kwargs)
+
     def to_representation(self, instance):
-        self.apply_rql_select()
-        return super(RQLMixin, self).to_representation(instance)
+        # Serializer instances (f.e. the child of a ListSerializer) are reused for every
+        #  represented object, so select is resolved only once per serializer
+        if getattr(self, '_rql_select_mask', None) is None:
+            self.apply_rql_select()
+
+        # Only top level objects are measured, nested serializers are a part of them,
+        #  and lists are measured by `RQLListSerializer` at once
+        parent = self.parent
+        is_measured = self.root is self or (
+            self.root is parent and not isinstance(parent, RQLListSerializer)
+        )
+        if not is_measured:
+            return super(RQLMixin, self).to_representation(instance)
+
+        with measure_stage(
+            type(self),
+            Stages.SERIALIZATION,
+            request=self.context.get('request'),
+        ):
+            return super(RQLMixin, self).to_representation(instance)
 
     def apply_rql_select(self):
         rql_select = self._get_field_rql_select(self)
 
         self.rql_select = rql_select
+        self._rql_select_mask = _get_rql_select_mask(rql_select['select'])
         deeper_rql_select = self._get_deeper_rql_select()
 
-        for field_name, is_included in rql_select['select'].items():
-            split_field_name = field_name.split('.')
-            is_current_level_field = len(split_field_name) == 1
-            current_depth_field_name = split_field_name[0]
-
-            if is_current_level_field:
-                if not is_included:
-                    self.fields.pop(current_depth_field_name, None)
+        fields = self.fields
+        for current_depth_field_name, deeper_select_items in self._rql_select_mask.nested:
+            if current_depth_field_name not in fields:
+                continue
 
-            elif current_depth_field_name in self.fields:
-                deeper_depth_field_name = '.'.join(split_field_name[1:])
-                deeper_field = self.fields[current_depth_field_name]
+            deeper_field_select = OrderedDict(deeper_select_items)
+            self._set_field_rql_select(fields[current_depth_field_name], deeper_field_select)
 
-                deeper_field_select = {deeper_depth_field_name: is_included}
-                self._set_field_rql_select(deeper_field, select=deeper_field_select)
+            deeper_rql_select.setdefault(current_depth_field_name, OrderedDict())
+            deeper_rql_select[current_depth_field_name].update(deeper_field_select)
 
-                deeper_rql_select.setdefault(current_depth_field_name, OrderedDict())
-                deeper_rql_select[current_depth_field_name].update(deeper_field_select)
+        for current_depth_field_name in self._rql_select_mask.excluded:
+            fields.pop(current_depth_field_name, None)
 
     def rql_context(self, field_name):
         deeper_select = self._get_deeper_rql_select()
@@ -68,7 +175,8 @@ class RQLMixin:
                 'rql_select',
                 context.get('rql_select', None),
             )
-            rql_select = deepcopy(default) if default else {'depth': 0, 'select': OrderedDict()}
+            # Select data is only read here, so the request data can be shared without copying
+            rql_select = default or {'depth': 0, 'select': OrderedDict()}
 
         field.rql_select = rql_select
         return field.rql_select
@@ -76,5 +184,7 @@ class RQLMixin:
     def _set_field_rql_select(self, field, select):
         rql_select = self._get_field_rql_select(field)
 
-        rql_select['depth'] = self.rql_select['depth'] + 1
-        rql_select['select'].update(select)
+        field_select = OrderedDict(rql_select['select'])
+        field_select.update(select)
+
+        field.rql_select = {'depth': self.rql_select['depth'] + 1, 'select': field_select}
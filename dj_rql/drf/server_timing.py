@@ -0,0 +1,58 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from dj_rql.signals import QueryCacheEvents
+
+
+SERVER_TIMING_HEADER = 'Server-Timing'
+
+
+class ServerTiming:
+    """Stage timings of an RQL request, that are rendered into the `Server-Timing` header.
+
+    Durations of repeated stages (f.e. serialization by several serializers) are summed up.
+    """
+
+    __slots__ = ('durations', 'cache')
+
+    METRIC_PREFIX = 'rql-'
+
+    def __init__(self):
+        self.durations = {}
+        self.cache = None
+
+    def add(self, stage, duration):
+        self.durations[stage] = self.durations.get(stage, 0) + duration
+
+    def add_query_cache_event(self, event):
+        if event != QueryCacheEvents.EVICTION:
+            self.cache = event
+
+    def render(self):
+        metrics = [
+            '{0}{1};dur={2:.3f}'.format(self.METRIC_PREFIX, stage, duration * 1000)
+            for stage, duration in self.durations.items()
+        ]
+        if self.cache:
+            metrics.append('{0}cache;desc={1}'.format(self.METRIC_PREFIX, self.cache))
+
+        return ', '.join(metrics)
+
+
+def start_server_timing(request):
+    # Stages are recorded by `measure_stage()` only for requests with the timing
+    request.rql_server_timing = ServerTiming()
+
+
+def set_server_timing_header(response, request):
+    server_timing = getattr(request, 'rql_server_timing', None)
+    if server_timing is None:
+        return
+
+    header = server_timing.render()
+    if header:
+        existing_header = response.get(SERVER_TIMING_HEADER)
+        response[SERVER_TIMING_HEADER] = (
+            '{0}, {1}'.format(existing_header, header) if existing_header else header
+        )
@@ -0,0 +1,120 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import logging
+from random import random
+from threading import Lock
+from time import monotonic
+
+from dj_rql.drf._utils import get_query, normalize_query
+from dj_rql.drf.backend import RQLFilterBackend
+from dj_rql.signals import Stages, stage_finished
+
+
+logger = logging.getLogger('dj_rql.slow_queries')
+
+
+class SlowQueryLog:
+    """Recorder of slow RQL queryset evaluations (count and page fetch) of paginated requests.
+
+    Records are written to the `dj_rql.slow_queries` logger, f.e. it can be configured
+    with a `logging.handlers.RotatingFileHandler` in Django `LOGGING` settings. Each record
+    contains the normalized RQL query, the filter class, the stage, its duration and the SQL.
+    `EXPLAIN` output is captured optionally.
+    """
+
+    STAGES = (Stages.COUNT, Stages.FETCH)
+
+    def __init__(self, threshold=1.0, sample_rate=1.0, rate_limit=10, explain=False):
+        """
+        :param float threshold: Min duration of a slow query in seconds
+        :param float sample_rate: Fraction of slow queries, that are recorded
+        :param int rate_limit: Max number of records per minute
+        :param bool explain: If True, `EXPLAIN` output is captured
+        """
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.rate_limit = rate_limit
+        self.explain = explain
+
+        self._lock = Lock()
+        self._window_start = None
+        self._window_records = 0
+
+    def connect(self):
+        stage_finished.connect(self.record, weak=False, dispatch_uid='dj_rql_slow_query_log')
+
+    @staticmethod
+    def disconnect():
+        stage_finished.disconnect(dispatch_uid='dj_rql_slow_query_log')
+
+    def record(self, sender, stage, duration, request=None, view=None, queryset=None, **kwargs):
+        if (stage not in self.STAGES) or (queryset is None) or (duration < self.threshold):
+            return
+
+        if self.sample_rate < 1 and random() >= self.sample_rate:
+            return
+
+        if not self._is_allowed_by_rate_limit():
+            return
+
+        record = {
+            'rql': self._get_normalized_query(request),
+            'filter_class': self._get_filter_class_name(view),
+            'stage': stage,
+            'duration': round(duration, 6),
+            'sql': self._get_sql(queryset),
+        }
+        if self.explain:
+            record['explain'] = self._get_explain(queryset)
+
+        logger.warning(
+            'Slow RQL query %(stage)s (%(duration).3fs) of %(filter_class)s: %(rql)s',
+            record,
+            extra={'rql_slow_query': record},
+        )
+
+    def _is_allowed_by_rate_limit(self):
+        now = monotonic()
+        with self._lock:
+            if self._window_start is None or now - self._window_start >= 60:
+                self._window_start = now
+                self._window_records = 0
+
+            if self._window_records >= self.rate_limit:
+                return False
+
+            self._window_records += 1
+            return True
+
+    @staticmethod
+    def _get_normalized_query(request):
+        query = getattr(request, 'rql_query', None)
+        if query is None:
+            return get_query(request) if request is not None else ''
+
+        return normalize_query(query, getattr(request, 'rql_ast', None))
+
+    @staticmethod
+    def _get_filter_class_name(view):
+        filter_class = RQLFilterBackend.get_filter_class(view) if view is not None else None
+        if filter_class is None:
+            return None
+
+        return '{0}.{1}'.format(filter_class.__module__, filter_class.__qualname__)
+
+    @staticmethod
+    def _get_sql(queryset):
+        try:
+            return str(queryset.query)
+        except Exception:
+            # Queries, that can't be rendered (f.e. with empty `IN` lookups), are not executed
+            return None
+
+    @staticmethod
+    def _get_explain(queryset):
+        try:
+            return queryset.explain()
+        except Exception as e:
+            return 'EXPLAIN failed: {0}'.format(e)
@@ -0,0 +1,237 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import logging
+import os
+import sys
+from threading import Lock
+
+from django.core.signals import request_started
+from django.test.client import RequestFactory
+from django.urls import URLResolver, get_resolver, resolve
+
+from dj_rql.drf.backend import RQLFilterBackend
+
+
+logger = logging.getLogger(__name__)
+
+WARM_UP_DISPATCH_UID = 'dj_rql_warm_up'
+
+WARM_UP_FIRST_REQUEST = 'first_request'
+
+# Management commands, that serve requests, so they are warmed up on start
+SERVING_COMMANDS = ('runserver',)
+
+_first_request_lock = Lock()
+
+
+def warm_up(queries_file=None, urlconf=None):
+    """
+    Build filter instances of all DRF views and fill query caches before serving traffic.
+
+    Args:
+        queries_file (str): optional path to a file with common queries, one request path
+            with a query string per line (f.e. `/api/books/?eq(author.name,Jack)&limit=10`).
+        urlconf (str): optional URL configuration module, the `ROOT_URLCONF` is used by default.
+
+    Returns:
+        int: number of warmed filter instances and queries.
+    """
+    warmed = warm_up_filter_classes(urlconf=urlconf)
+
+    if queries_file:
+        with open(queries_file) as f:
+            warmed += warm_up_query_caches(f, urlconf=urlconf)
+
+    return warmed
+
+
+def warm_up_on_start(queries_file=None, urlconf=None, argv=None):
+    """
+    Run `warm_up()` on application start, unless a management command is run.
+
+    It's called by `DjRQLConfig.ready()`, if the `RQL_WARM_UP` setting is enabled, so processes
+    are warmed up before serving traffic. Failures are logged and don't break the start.
+
+    Args:
+        queries_file (str): optional path to a file with common queries.
+        urlconf (str): optional URL configuration module, the `ROOT_URLCONF` is used by default.
+        argv (list): optional command line arguments, `sys.argv` is used by default.
+
+    Returns:
+        int or None: number of warmed filter instances and queries or `None`, if skipped.
+    """
+    if _is_management_command(sys.argv if argv is None else argv):
+        return None
+
+    try:
+        return warm_up(queries_file=queries_file, urlconf=urlconf)
+
+    except Exception:
+        logger.warning('RQL warm-up failed.', exc_info=True)
+        return None
+
+
+def warm_up_on_first_request(queries_file=None, urlconf=None):
+    """
+    Run `warm_up()` once, when the first request of the process is started.
+
+    It's a fallback for processes, that can't be warmed up before serving traffic
+    (`RQL_WARM_UP = 'first_request'`): the first request of every process waits for the warm-up.
+
+    Args:
+        queries_file (str): optional path to a file with common queries.
+        urlconf (str): optional URL configuration module, the `ROOT_URLCONF` is used by default.
+    """
+
+    def receiver(sender, **kwargs):
+        with _first_request_lock:
+            # Concurrent first requests don't wait for the warm-up
+            if not request_started.disconnect(dispatch_uid=WARM_UP_DISPATCH_UID):
+                return
+
+        try:
+            warm_up(queries_file=queries_file, urlconf=urlconf)
+
+        except Exception:
+            logger.warning('RQL warm-up failed.', exc_info=True)
+
+    request_started.connect(receiver, weak=False, dispatch_uid=WARM_UP_DISPATCH_UID)
+
+
+def warm_up_filter_classes(urlconf=None):
+    """
+    Build and cache filter instances of all DRF views, discovered in the URL configuration.
+
+    Views with `rql_filter_class` attribute or `get_rql_filter_class()` method are supported.
+    Filter classes, that can't be resolved without a request, are skipped.
+
+    Args:
+        urlconf (str): optional URL configuration module, the `ROOT_URLCONF` is used by default.
+
+    Returns:
+        int: number of warmed filter instances.
+    """
+    warmed = set()
+    for view in _iter_views(get_resolver(urlconf).url_patterns, set()):
+        for backend_cls in _get_rql_backends(view):
+            try:
+                filter_class = backend_cls.get_filter_class(view)
+                if filter_class:
+                    backend_cls._get_filter_instance(filter_class, queryset=None, view=view)
+                    warmed.add(backend_cls._get_filter_cls_qual_name(view, filter_class))
+
+            except Exception:
+                logger.warning(
+                    'Filter class of the view %s.%s can not be warmed up.',
+                    view.__class__.__module__,
+                    view.__class__.__name__,
+                    exc_info=True,
+                )
+
+    return len(warmed)
+
+
+def warm_up_query_caches(queries, urlconf=None):
+    """
+    Fill query caches of the DRF views with common queries.
+
+    Queries are applied for anonymous GET requests, so they must not depend on authentication.
+
+    Args:
+        queries (iterable): request paths with query strings. Empty lines and lines,
+            starting with `#`, are ignored.
+        urlconf (str): optional URL configuration module, the `ROOT_URLCONF` is used by default.
+
+    Returns:
+        int: number of warmed queries.
+    """
+    warmed = 0
+    request_factory = RequestFactory()
+
+    for line in queries:
+        path = line.strip()
+        if (not path) or path.startswith('#'):
+            continue
+
+        try:
+            warmed += _warm_up_query(request_factory.get(path), urlconf)
+
+        except Exception:
+            logger.warning('Query %s can not be warmed up.', path, exc_info=True)
+
+    return warmed
+
+
+def _warm_up_query(http_request, urlconf):
+    match = resolve(http_request.path_info, urlconf=urlconf)
+    view = _get_view(match.func, match.args, match.kwargs)
+    backends = _get_rql_backends(view) if view else ()
+    if not backends:
+        return 0
+
+    view.request = view.initialize_request(http_request, *match.args, **match.kwargs)
+    view.format_kwarg = view.get_format_suffix(**match.kwargs)
+
+    queryset = view.get_queryset()
+    warmed = 0
+    for backend_cls in backends:
+        if backend_cls.get_filter_class(view):
+            queryset = backend_cls().filter_queryset(view.request, queryset, view)
+            warmed = 1
+
+    return warmed
+
+
+def _is_management_command(argv):
+    if not argv:
+        return False
+
+    program = argv[0]
+    is_django_main = os.path.basename(os.path.dirname(program)) == 'django'
+    if (os.path.basename(program) not in ('manage.py', 'django-admin')) and not is_django_main:
+        return False
+
+    return (len(argv) < 2) or (argv[1] not in SERVING_COMMANDS)
+
+
+def _iter_views(url_patterns, seen):
+    for pattern in url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_views(pattern.url_patterns, seen)
+            continue
+
+        callback = pattern.callback
+        for action in set((getattr(callback, 'actions', None) or {None: None}).values()):
+            key = (getattr(callback, 'cls', None), action)
+            if key in seen:
+                continue
+
+            seen.add(key)
+            view = _get_view(callback)
+            if view:
+                view.action = action
+                yield view
+
+
+def _get_view(callback, args=(), kwargs=None):
+    view_cls = getattr(callback, 'cls', None)
+    if view_cls is None:
+        return None
+
+    view = view_cls(**getattr(callback, 'initkwargs', {}))
+    view.action_map = getattr(callback, 'actions', None) or {}
+    view.request = None
+    view.args = args
+    view.kwargs = kwargs or {}
+    view.format_kwarg = None
+    return view
+
+
+def _get_rql_backends(view):
+    return [
+        backend_cls
+        for backend_cls in getattr(view, 'filter_backends', ())
+        if isinstance(backend_cls, type) and issubclass(backend_cls, RQLFilterBackend)
+    ]
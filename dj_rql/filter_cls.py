@@ -3,22 +3,30 @@
 #
 import decimal
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 from itertools import chain
+from threading import RLock
 from typing import Set
 from uuid import uuid4
 
+import django
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import (
+    F,
     ForeignKey,
     ManyToManyField,
     Model,
     OneToOneField,
     OneToOneRel,
+    Prefetch,
     Q,
+    Window,
 )
+from django.db.models.functions import RowNumber
 from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 from lark.exceptions import LarkError
 from py_rql.constants import (
     RESERVED_FILTER_NAMES,
@@ -38,16 +46,86 @@ from py_rql.constants import (
 from py_rql.exceptions import RQLFilterLookupError, RQLFilterParsingError, RQLFilterValueError
 from py_rql.parser import RQLParser
 
-from dj_rql._dataclasses import FilterArgs, OptimizationArgs
+from dj_rql._dataclasses import (
+    CompiledFilterSchema,
+    FilterArgs,
+    FilterItem,
+    OptimizationArgs,
+    QueryPlan,
+    SelectNode,
+    intern_set,
+)
 from dj_rql.constants import SUPPORTED_FIELD_TYPES, DjangoLookups, FilterTypes
 from dj_rql.fields import SelectField
+from dj_rql.indexes import get_cached_model_indexes, get_indexed_lookups
 from dj_rql.openapi import RQLFilterClassSpecification
-from dj_rql.qs import NPR, NSR, Annotation
-from dj_rql.transformer import RQLToDjangoORMTransformer
+from dj_rql.qs import (
+    NPR,
+    NSR,
+    Annotation,
+    OptimizationPlan,
+    PrefetchRelated,
+)
+from dj_rql.signals import Stages, measure_stage
+from dj_rql.stats import UsageKinds, usage_stats
+from dj_rql.transformer import RQLLimitOffsetTransformer, RQLToDjangoORMTransformer
 
 
 iterable_types = (list, tuple)
 
+PREFETCH_ROW_NUMBER = '_rql_prefetch_row_number'
+
+INDEX_POLICY_ORDERING = 'ordering'
+
+# Flags of lazy namespaces with fields, that affect select or search
+LAZY_NAMESPACE_SELECT = 'select'
+LAZY_NAMESPACE_SEARCH = 'search'
+
+PREFIX_DJANGO_LOOKUPS = {
+    DjangoLookups.I_EXACT,
+    DjangoLookups.STARTSWITH,
+    DjangoLookups.I_STARTSWITH,
+}
+PATTERN_DJANGO_LOOKUPS = {
+    DjangoLookups.CONTAINS,
+    DjangoLookups.I_CONTAINS,
+    DjangoLookups.ENDSWITH,
+    DjangoLookups.I_ENDSWITH,
+    DjangoLookups.REGEX,
+    DjangoLookups.I_REGEX,
+}
+
+
+class _SchemaAttribute:
+    """Attribute of filter class instances, that is read from the compiled schema.
+
+    Values, that are set on the instance, take precedence over the schema: these are either
+    working copies of the compilation or copy-on-write extensions of subclasses
+    (f.e. `self.ordering_filters |= {'name'}` in `__init__`).
+    """
+
+    def __init__(self, schema_name=None):
+        self.schema_name = schema_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.schema_name = self.schema_name or name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            return getattr(instance._schema, self.schema_name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        instance.__dict__.pop(self.name, None)
+
 
 class RQLFilterClass:
     """Base class for filter classes."""
@@ -82,21 +160,78 @@ class RQLFilterClass:
     QUERIES_CACHE_SIZE = 20
     """Default number of cached queries (default 20)."""
 
+    SELECT_PLANS_CACHE_SIZE = 100
+    """Max number of cached select plans per filter class (default 100)."""
+
+    LAZY_NAMESPACES = False
+    """If True, namespace filters are compiled on first use of the namespace (default `False`)."""
+
+    COMPILED_SCHEMA = None
+    """Importable location of a module, generated by the `compile_rql_class` command
+     (default `None`). If set, filters are loaded from this module instead of being built."""
+
+    INDEX_POLICY = False
+    """If True, lookups and ordering of model fields are restricted to ones, that can use
+    model indexes and unique constraints (default `False`). Custom and dynamic filters
+    are not restricted."""
+
+    INDEX_POLICY_OVERRIDES = None
+    """Dict of filter names and sets of lookups (and `ordering`), that are allowed by the index
+    policy regardless of model indexes, or `True` to allow all of them (default `None`)."""
+
+    QUERY_COST_WEIGHTS = {
+        'lookup': 1,
+        'prefix_lookup': 2,
+        'pattern_lookup': 10,
+        'list_value': 0.1,
+        'join': 2,
+        'to_many_join': 5,
+        'distinct': 10,
+        'ordering': 1,
+        'offset': 0.01,
+    }
+    """Weights of query features for the static query cost estimation by `get_query_cost()`."""
+
     Q_CLS = Q
     """Class for building nodes of the query, generated by django (default `Q`)."""
 
     FILTER_TYPES_CLS = FilterTypes
     """Class for the mapping of model field types to filter types (default `FilterTypes`)."""
 
+    filters = _SchemaAttribute()
+    ordering_filters = _SchemaAttribute()
+    search_filters = _SchemaAttribute()
+    select_tree = _SchemaAttribute()
+    default_exclusions = _SchemaAttribute()
+    annotations = _SchemaAttribute()
+    allowed_ordering_permutations = _SchemaAttribute()
+    _lazy_namespaces = _SchemaAttribute('lazy_namespaces')
+
+    _SCHEMA_ATTRIBUTES = (
+        'filters',
+        'ordering_filters',
+        'search_filters',
+        'select_tree',
+        'default_exclusions',
+        'annotations',
+        'allowed_ordering_permutations',
+        '_lazy_namespaces',
+    )
+
     def __init__(self, queryset: Q, instance=None):
         self.queryset = queryset
         self._is_distinct = self.DISTINCT
+        self._filter_q = None
         self._request = None
         self._view = None
         self._applied_annotations = set()
+        self._query_plan = None
+        self._usage = None
 
         if instance:
             self._init_from_class(instance)
+        elif self.COMPILED_SCHEMA:
+            self._compiled_init()
         else:
             self._validate_init()
             self._default_init(self._get_init_filters())
@@ -125,6 +260,12 @@ class RQLFilterClass:
             assert all(isinstance(t, tuple) for t in perms), e
             assert all(isinstance(s, str) for s in chain.from_iterable(perms)), e
 
+        e = 'Index policy overrides must be a dict.'
+        assert self.INDEX_POLICY_OVERRIDES is None or isinstance(
+            self.INDEX_POLICY_OVERRIDES,
+            dict,
+        ), e
+
     def _get_init_filters(self):
         return self.FILTERS
 
@@ -139,23 +280,232 @@ class RQLFilterClass:
         self.default_exclusions = set()
         self.annotations = {}
         self.allowed_ordering_permutations = None
+        self._lazy_namespaces = {}
+
+        self._schema_owner = self
+        self._compilation_lock = RLock()
 
         self._build_filters(filters)
-        self._validate_and_store_allowed_ordering_permutations()
         self._extend_annotations()
+        self._set_schema(self._compile_schema())
+
+        # Permutations can reference filters of lazy namespaces, so they are validated last
+        if self.ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY:
+            self._validate_and_store_allowed_ordering_permutations()
+            self._set_schema(self._compile_schema())
+
+    def _compiled_init(self):
+        self._schema_owner = self
+        self._compilation_lock = RLock()
+
+        self._set_schema(import_string('{0}.SCHEMA'.format(self.COMPILED_SCHEMA)))
 
     def _init_from_class(self, instance):
-        copied_attributes = (
-            'filters',
-            'ordering_filters',
-            'search_filters',
-            'select_tree',
-            'default_exclusions',
-            'annotations',
-            'allowed_ordering_permutations',
+        # Schema attributes are read from the schema, so nothing else is copied per request
+        self._schema_owner = instance._schema_owner
+        self._schema = self._schema_owner.schema
+
+    @property
+    def schema(self) -> CompiledFilterSchema:
+        """Compiled filter schema, that is shared between instances of the filter class."""
+        return self._schema
+
+    def _compile_schema(self):
+        return CompiledFilterSchema(
+            filters=self.filters,
+            ordering_filters=self.ordering_filters,
+            search_filters=self.search_filters,
+            select_tree=self.select_tree,
+            default_exclusions=self.default_exclusions,
+            annotations=self.annotations,
+            allowed_ordering_permutations=self.allowed_ordering_permutations,
+            lazy_namespaces=self._lazy_namespaces,
+        )
+
+    def _set_schema(self, schema):
+        self._schema = schema
+
+        # Instance values (working copies and extensions) must not hide the new schema
+        for name in self._SCHEMA_ATTRIBUTES:
+            delattr(self, name)
+
+    def _replace_schema(self, schema, extensions=None):
+        """Sets the new schema, keeping per-instance extensions of schema sets."""
+        if extensions is None:
+            extensions = self._pop_schema_extensions()
+
+        self._set_schema(schema)
+        for name, extension in extensions.items():
+            setattr(self, name, (getattr(self, name) or frozenset()) | extension)
+
+    def _pop_schema_extensions(self):
+        extensions = {}
+        for name in self._SCHEMA_ATTRIBUTES:
+            value = self.__dict__.pop(name, None)
+            if isinstance(value, (set, frozenset)):
+                extension = value - (getattr(self, name) or frozenset())
+                if extension:
+                    extensions[name] = extension
+
+        return extensions
+
+    def compile_filters(self, filter_names=None):
+        """Compile lazy namespaces, that are needed for the given filters.
+
+        Args:
+            filter_names (Iterable[str] or None): Full filter names. If None, all lazy
+                namespaces are compiled.
+        """
+        if filter_names is not None:
+            for filter_name in filter_names:
+                self._compile_filter_namespaces(filter_name)
+
+            return
+
+        while self._lazy_namespaces:
+            self._compile_namespace(next(iter(self._lazy_namespaces)))
+
+    def _compile_filter_namespaces(self, filter_name):
+        if not self._lazy_namespaces:
+            return
+
+        namespace_route = ''
+        for filter_name_part in filter_name.split('.'):
+            namespace_route += filter_name_part
+            if namespace_route in self._lazy_namespaces:
+                self._compile_namespace(namespace_route)
+
+            namespace_route += '.'
+
+    def _compile_select_namespaces(self, select):
+        include_select, exclude_select = self._prepare_selects(select)
+        self.compile_filters(include_select)
+
+        # Excluded namespaces are not compiled, only their parents
+        for filter_name in exclude_select:
+            parent_route = filter_name.rpartition('.')[0]
+            if parent_route:
+                self._compile_filter_namespaces(parent_route)
+
+        def is_selected(namespace_route):
+            return all(
+                (route not in exclude_select)
+                and ((route not in self.default_exclusions) or (route in include_select))
+                for route in self._iter_filter_name_routes(namespace_route)
+            )
+
+        # Other selected namespaces are compiled only if they have hidden or optimized fields,
+        # otherwise their compilation doesn't change select data and optimizations
+        self._compile_lazy_namespaces(
+            lambda namespace_route, flags: (
+                (LAZY_NAMESPACE_SELECT in flags) and is_selected(namespace_route)
+            ),
         )
-        for attr in copied_attributes:
-            setattr(self, attr, getattr(instance, attr))
+
+    def _compile_lazy_namespaces(self, is_needed):
+        is_compiled = True
+        while is_compiled and self._lazy_namespaces:
+            is_compiled = False
+
+            for namespace_route, entries in tuple(self._lazy_namespaces.items()):
+                flags = set(chain.from_iterable(entry[2] for entry in entries))
+                if is_needed(namespace_route, flags):
+                    self._compile_namespace(namespace_route)
+                    is_compiled = True
+
+    @classmethod
+    def _get_lazy_namespace_flags(cls, filters):
+        flags = set()
+        for item in filters:
+            if isinstance(item, str):
+                continue
+
+            if item.get('hidden') or (('namespace' not in item) and item.get('qs')):
+                flags.add(LAZY_NAMESPACE_SELECT)
+
+            if item.get('search'):
+                flags.add(LAZY_NAMESPACE_SEARCH)
+
+            if 'namespace' in item:
+                flags.update(cls._get_lazy_namespace_flags(item.get('filters', [])))
+
+        return frozenset(flags)
+
+    @staticmethod
+    def _iter_filter_name_routes(filter_name):
+        route = ''
+        for filter_name_part in filter_name.split('.'):
+            route += filter_name_part
+            yield route
+            route += '.'
+
+    def _compile_namespace(self, namespace_route):
+        schema_owner = self._schema_owner
+
+        with schema_owner._compilation_lock:
+            # Extensions are popped, so that working copies are built from the schema only
+            extensions = self._pop_schema_extensions()
+
+            # Namespace can be already compiled in a concurrent request
+            schema = schema_owner.schema
+            if namespace_route not in schema.lazy_namespaces:
+                self._replace_schema(schema, extensions)
+                return
+
+            self.filters = dict(schema.filters)
+            self.ordering_filters = set(schema.ordering_filters)
+            self.search_filters = set(schema.search_filters)
+            self.default_exclusions = set(schema.default_exclusions)
+            self.annotations = dict(schema.annotations)
+            self._lazy_namespaces = dict(schema.lazy_namespaces)
+
+            namespace_fields = None
+            if self.SELECT:
+                namespace_fields = dict(self._get_select_node(namespace_route)['fields'])
+
+            compiled_filter_names = set(self.filters.keys())
+            for filters, kwargs, _ in self._lazy_namespaces.pop(namespace_route):
+                self._build_filters(filters, select_tree=namespace_fields, **kwargs)
+
+            if self.SELECT:
+                self.select_tree = self._replace_select_node_fields(
+                    self.select_tree,
+                    namespace_route.split('.'),
+                    namespace_fields,
+                )
+
+            self._extend_annotations(set(self.filters.keys()) - compiled_filter_names)
+
+            # Published schemas are never changed, so concurrent requests see consistent data
+            schema = self._compile_schema()
+            if schema_owner is not self:
+                schema_owner._replace_schema(schema)
+
+            self._replace_schema(schema, extensions)
+
+    def _get_select_node(self, filter_route):
+        select_tree = self.select_tree
+        for filter_name_part in filter_route.split('.'):
+            select_node = select_tree[filter_name_part]
+            select_tree = select_node['fields']
+
+        return select_node
+
+    @classmethod
+    def _replace_select_node_fields(cls, select_tree, filter_name_parts, fields):
+        current_part = filter_name_parts[0]
+        select_node = select_tree[current_part]
+
+        if len(filter_name_parts) > 1:
+            fields = cls._replace_select_node_fields(
+                select_node['fields'],
+                filter_name_parts[1:],
+                fields,
+            )
+
+        changed_select_tree = dict(select_tree)
+        changed_select_tree[current_part] = SelectNode(**dict(select_node, fields=fields))
+        return changed_select_tree
 
     def build_q_for_custom_filter(self, data: FilterArgs) -> Q:
         """Django Q() builder for custom filter.
@@ -206,6 +556,7 @@ class RQLFilterClass:
 
     @property
     def openapi_specification(self):
+        self.compile_filters()
         return self.OPENAPI_SPECIFICATION.get(self)
 
     def apply_annotations(self, filter_names: Set[str], queryset: Q = None):
@@ -226,6 +577,10 @@ class RQLFilterClass:
         if not self.SELECT:
             return qs
 
+        return OptimizationPlan().add(*self._get_not_applied_annotations(filter_names)).apply(qs)
+
+    def _get_not_applied_annotations(self, filter_names):
+        annotations = []
         for filter_name in filter_names:
             anno_list = self.annotations.get(filter_name)
 
@@ -238,9 +593,9 @@ class RQLFilterClass:
                     continue
 
                 self._applied_annotations.add(anno_id)
-                qs = anno.apply(qs)
+                annotations.append(anno)
 
-        return qs
+        return annotations
 
     def apply_filters(self, query: str, request=None, view=None):
         """Main entrypoint for request filtering.
@@ -255,15 +610,20 @@ class RQLFilterClass:
         """
         self._request = request
         self._view = view
+        self._usage = {} if usage_stats.enabled else None
 
         rql_ast, qs, select_filters = None, self.queryset, []
+        filter_names, ordering, ordering_properties = (), None, ()
         qs.select_data = None
 
         if query:
-            rql_ast = RQLParser.parse_query(query)
+            with self._measure_stage(Stages.PARSE):
+                rql_ast = RQLParser.parse_query(query)
+
             rql_transformer = RQLToDjangoORMTransformer(self)
             try:
-                qs = rql_transformer.transform(rql_ast)
+                with self._measure_stage(Stages.TRANSFORM):
+                    qs = rql_transformer.transform(rql_ast)
             except LarkError as e:
                 # Lark reraises it's errors, but the original ones are needed
                 original_error = e.orig_exc
@@ -272,27 +632,213 @@ class RQLFilterClass:
 
                 raise RQLFilterParsingError()
 
-            qs = self._apply_ordering(qs, rql_transformer.ordering_filters)
+            with self._measure_stage(Stages.ORDERING):
+                ordering_properties = rql_transformer.ordering_filters
+                ordering = self._get_ordering(ordering_properties)
+                if ordering:
+                    qs = qs.order_by(*ordering)
+
             select_filters = rql_transformer.select_filters
+            filter_names = rql_transformer.filtered_props
+            self._add_select_usage(select_filters)
+            self._filter_q = rql_transformer.filter_q
+
+            if self._is_distinct:
+                qs = qs.distinct()
+
+            qs.select_data = None
+
+        self._query_plan = QueryPlan(
+            rql_ast,
+            frozenset(filter_names),
+            self._filter_q,
+            ordering,
+            self._is_distinct,
+            tuple(select_filters),
+            tuple(self._usage or ()),
+            tuple(ordering_properties[0]) if ordering else (),
+        )
+        self._usage = None
+        return rql_ast, self._apply_select(qs, select_filters)
+
+    @property
+    def query_plan(self) -> QueryPlan:
+        """Picklable plan of the last applied query (`None`, if no query was applied)."""
+        return self._query_plan
+
+    def apply_query_plan(self, query_plan: QueryPlan, request=None, view=None):
+        """Request filtering with a plan of a previously compiled query.
+
+        Args:
+            query_plan (QueryPlan): query plan from the `query_plan` of a filter class instance.
+            request (Request): Request from API view.
+            view (View): API view.
+
+        Returns:
+            A Lark AST, Filtered QuerySet (could be None).
+        """
+        self._request = request
+        self._view = view
+        self._query_plan = query_plan
+
+        qs = self.queryset
+        qs.select_data = None
+
+        if query_plan.rql_ast is not None:
+            if self._lazy_namespaces:
+                self.compile_filters(query_plan.filter_names)
+
+            with self._measure_stage(Stages.TRANSFORM):
+                qs = self.apply_annotations(query_plan.filter_names).filter(query_plan.q)
 
+            self._is_distinct = query_plan.distinct
+            if query_plan.ordering:
+                with self._measure_stage(Stages.ORDERING):
+                    # Cached plans can outlive filters, so ordering is validated and rebuilt
+                    ordering = self._get_ordering([query_plan.ordering_properties])
+                    qs = qs.order_by(*ordering)
+
+            self._filter_q = query_plan.q
             if self._is_distinct:
                 qs = qs.distinct()
 
             qs.select_data = None
 
+        return query_plan.rql_ast, self._apply_select(qs, query_plan.select)
+
+    def _apply_select(self, qs, select_filters):
         if self.SELECT:
-            select_data = self._build_select_data(select_filters)
-            qs = self._apply_optimizations(qs, select_data)
+            with self._measure_stage(Stages.SELECT):
+                if self._lazy_namespaces:
+                    self._compile_select_namespaces(select_filters)
+
+                select_data, optimization_steps = self._get_select_plan(select_filters)
+
+            with self._measure_stage(Stages.OPTIMIZATIONS):
+                qs = self._apply_optimization_steps(qs, select_data, optimization_steps)
+
             qs.select_data = {
                 'depth': 0,
                 'select': select_data,
             }
 
+        qs.rql_usage = self._query_plan.usage
+        qs.rql_query_plan = self._query_plan
         self.queryset = qs
+        self._filter_q = None
         self._request = None
         self._view = None
 
-        return rql_ast, qs
+        return qs
+
+    def get_query_cost(self, query_plan: QueryPlan = None) -> float:
+        """Static cost estimation of a compiled query without database access.
+
+        Cost is a sum of weighted query features from `QUERY_COST_WEIGHTS`: lookups (pattern
+        lookups, like `ilike` with leading wildcards, and values of `in` lookups are weighted
+        separately), joins of relations from lookups and ordering, distinct, ordering properties
+        and offset rows.
+
+        Args:
+            query_plan (QueryPlan or None): Query plan, the plan of the last applied query
+                is used by default.
+
+        Returns:
+            Query cost (0 for empty queries).
+        """
+        query_plan = query_plan or self._query_plan
+        if query_plan is None or query_plan.rql_ast is None:
+            return 0
+
+        weights = self.QUERY_COST_WEIGHTS
+        cost, routes = 0, set()
+
+        for lookup, value in self._iter_q_lookups(query_plan.q):
+            route, django_lookup = self._split_django_lookup(lookup)
+            routes.add(route)
+
+            if django_lookup in PATTERN_DJANGO_LOOKUPS:
+                cost += weights['pattern_lookup']
+            elif django_lookup in PREFIX_DJANGO_LOOKUPS:
+                cost += weights['prefix_lookup']
+            else:
+                cost += weights['lookup']
+
+            if django_lookup == DjangoLookups.IN and isinstance(value, (list, tuple, set)):
+                cost += weights['list_value'] * len(value)
+
+        for ordering in query_plan.ordering or ():
+            cost += weights['ordering']
+            if isinstance(ordering, str):
+                routes.add(ordering.lstrip('-'))
+
+        joins, to_many_joins = self._get_route_joins(routes)
+        cost += weights['join'] * joins + weights['to_many_join'] * to_many_joins
+
+        if query_plan.distinct:
+            cost += weights['distinct']
+
+        return cost + weights['offset'] * self._get_query_offset(query_plan.rql_ast)
+
+    @classmethod
+    def _iter_q_lookups(cls, q):
+        if q is None:
+            return
+
+        for child in q.children:
+            if isinstance(child, Q):
+                yield from cls._iter_q_lookups(child)
+            elif isinstance(child, tuple):
+                yield child
+
+    @staticmethod
+    def _split_django_lookup(lookup):
+        route, _, django_lookup = lookup.rpartition('__')
+        if route and django_lookup in DjangoLookups.all():
+            return route, django_lookup
+
+        return lookup, DjangoLookups.EXACT
+
+    def _get_route_joins(self, routes):
+        joins = {}
+        for route in routes:
+            model, join_route = self.MODEL, ''
+            for part in route.split('__')[:-1]:
+                try:
+                    field = model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    break
+
+                if not field.is_relation or field.related_model is None:
+                    break
+
+                join_route += part + '__'
+                joins[join_route] = field.many_to_many or field.one_to_many
+                model = field.related_model
+
+        to_many_joins = sum(1 for is_to_many in joins.values() if is_to_many)
+        return len(joins) - to_many_joins, to_many_joins
+
+    @staticmethod
+    def _get_query_offset(rql_ast):
+        try:
+            _, offset = RQLLimitOffsetTransformer().transform(rql_ast)
+            return max(int(offset or 0), 0)
+        except (LarkError, TypeError, ValueError):
+            return 0
+
+    def _measure_stage(self, stage):
+        return measure_stage(type(self), stage, request=self._request, view=self._view)
+
+    def _add_usage(self, *key):
+        if self._usage is not None:
+            self._usage[key] = None
+
+    def _add_select_usage(self, select_filters):
+        # Select data is memoized per select plan, so usage is taken from the query
+        if self._usage is not None:
+            for s_prop in select_filters:
+                self._add_usage(UsageKinds.SELECT, s_prop[1:] if s_prop[0] == RQL_PLUS else s_prop)
 
     def build_q_for_filter(self, data: FilterArgs) -> Q:
         """Django Q() builder for extracted from query RQL expression.
@@ -327,6 +873,9 @@ class RQLFilterClass:
 
         filter_item = self.filters[filter_name]
         available_lookups = base_item.get('lookups', set())
+        if base_item.get('index_restricted'):
+            self._check_index_restricted_lookup(filter_name, base_item, data)
+
         if list_operator:
             if list_operator == ListOperators.IN:
                 list_filter_lookup = FilterLookups.IN
@@ -350,6 +899,15 @@ class RQLFilterClass:
             available_lookups,
             null_values,
         )
+        if list_operator:
+            usage_lookup = list_filter_lookup
+        elif str_value in null_values:
+            # `eq(x,null())` and `ne(x,null())` are served by the null lookup
+            usage_lookup = FilterLookups.NULL
+        else:
+            usage_lookup = filter_lookup
+        self._add_usage(UsageKinds.FILTER, filter_name, usage_lookup)
+
         django_field = base_item.get('field')
         if django_field and isinstance(django_field, SelectField):
             raise RQLFilterLookupError(
@@ -361,6 +919,8 @@ class RQLFilterClass:
             )
 
         django_lookup = self._get_django_lookup(filter_lookup, str_value, null_values)
+        if filter_lookup in base_item.get('prefix_lookups', ()):
+            self._check_prefix_lookup(filter_name, filter_lookup, str_value, django_lookup)
 
         use_repr = base_item.get('use_repr', False)
 
@@ -402,6 +962,8 @@ class RQLFilterClass:
         return q
 
     def get_filter_base_item(self, filter_name: str):
+        self._compile_filter_namespaces(filter_name)
+
         filter_item = self.filters.get(filter_name)
         if filter_item:
             return filter_item[0] if isinstance(filter_item, iterable_types) else filter_item
@@ -529,8 +1091,13 @@ class RQLFilterClass:
         if not unquoted_value.endswith(RQL_ANY_SYMBOL):
             unquoted_value += '*'
 
+        # Only namespaces with search filters are needed
+        self._compile_lazy_namespaces(
+            lambda namespace_route, flags: LAZY_NAMESPACE_SEARCH in flags,
+        )
+
         q = self._build_q_for_extended_search(unquoted_value)
-        for filter_name in self.search_filters:
+        for filter_name in sorted(self.search_filters):
             q |= self.build_q_for_filter(
                 FilterArgs(
                     filter_name,
@@ -560,47 +1127,244 @@ class RQLFilterClass:
 
         return q
 
-    def _apply_optimizations(self, queryset, select_data):
-        return self.__apply_optimizations(
-            OptimizationArgs(queryset, select_data, self.select_tree),
-        )
+    def _get_select_plan(self, select):
+        """Select data and optimization steps are memoized per normalized select expression."""
+        key = tuple(s_prop[1:] if s_prop[0] == RQL_PLUS else s_prop for s_prop in select)
 
-    def __apply_optimizations(self, data: OptimizationArgs):
-        qs, select_data, filter_tree = data.queryset, data.select_data, data.filter_tree
+        select_plans = self._schema.select_plans
+        select_plan = select_plans.get(key)
+        if select_plan is None:
+            select_data = self._build_select_data(select)
+            select_plan = select_data, self._get_optimization_steps(select_data)
 
-        if filter_tree:
-            for node in filter_tree.values():
-                filter_path = node['path']
+            if len(select_plans) >= self.SELECT_PLANS_CACHE_SIZE:
+                select_plans.clear()
 
-                if select_data.get(filter_path, True):
-                    qs = self.__apply_field_optimizations(qs, data, node)
+            select_plans[key] = select_plan
 
-        return qs
+        select_data, optimization_steps = select_plan
+        return dict(select_data), optimization_steps
 
-    def __apply_field_optimizations(self, qs, data, node):
-        select_data, filter_tree = data.select_data, data.filter_tree
-        filter_path = node['path']
+    def _get_optimization_steps(self, select_data):
+        steps = []
+        self.__collect_optimization_steps(self.select_tree, select_data, steps)
+        return tuple(steps)
 
-        optimized_qs = self.optimize_field(
-            OptimizationArgs(qs, select_data, filter_tree, node, filter_path),
+    def __collect_optimization_steps(self, filter_tree, select_data, steps, pushed=(None, ())):
+        is_optimize_field_overridden = (
+            type(self).optimize_field is not RQLFilterClass.optimize_field
         )
+        parent_path, pushed_paths = pushed
+
+        for node in filter_tree.values():
+            filter_path = node['path']
+            if not select_data.get(filter_path, True):
+                continue
+
+            optimization = node['qs']
+            prefetch_spec, nested_pushed_paths = None, ()
+            if optimization and (not isinstance(optimization, Annotation)):
+                prefetch_spec, nested_pushed_paths = self._get_namespace_prefetch_spec(
+                    node,
+                    select_data,
+                    optimization,
+                )
+
+            if optimization or is_optimize_field_overridden:
+                pushed_by = parent_path if filter_path in pushed_paths else None
+                steps.append((filter_tree, node, prefetch_spec, pushed_by))
+
+            self.__collect_optimization_steps(
+                node['fields'],
+                select_data,
+                steps,
+                (filter_path, nested_pushed_paths),
+            )
+
+    def _apply_optimization_steps(self, queryset, select_data, optimization_steps):
+        plan = OptimizationPlan()
+        prefetched_paths = set()
+
+        for filter_tree, node, prefetch_spec, pushed_by in optimization_steps:
+            filter_path = node['path']
+            optimized_qs = self.optimize_field(
+                OptimizationArgs(queryset, select_data, filter_tree, node, filter_path),
+            )
 
-        optimization = node['qs']
-        if optimized_qs is not None:
-            qs = optimized_qs
-        elif optimization:
-            if isinstance(optimization, Annotation):
-                qs = self.apply_annotations({filter_path}, qs)
+            optimization = node['qs']
+            if optimized_qs is not None:
+                queryset = optimized_qs
+            elif (not optimization) or (pushed_by and pushed_by in prefetched_paths):
+                # Optimizations of nested to-one namespaces can be joined in parent prefetches
+                continue
+            elif isinstance(optimization, Annotation):
+                plan.add(*self._get_not_applied_annotations({filter_path}))
+            elif prefetch_spec:
+                plan.add(PrefetchRelated(self._build_namespace_prefetch(prefetch_spec)))
+                prefetched_paths.add(filter_path)
             else:
-                qs = optimization.apply(qs)
+                plan.add(optimization)
+
+        return plan.apply(queryset)
+
+    def _get_namespace_prefetch_spec(self, node, select_data, optimization):
+        """Specification of a select-aware `Prefetch` for namespaces with prefetch options.
+
+        Returns:
+            A tuple of `Prefetch` specification (or None) and paths of nested namespaces,
+            that are pushed down into the prefetch queryset.
+        """
+        prefetch_data = node.get('prefetch')
+        is_simple_prefetch = (
+            isinstance(optimization, PrefetchRelated)
+            and len(optimization.relations) == 1
+            and isinstance(optimization.main_relation, str)
+        )
+        if not (prefetch_data and is_simple_prefetch):
+            return None, ()
+
+        relation = optimization.main_relation
+        only_fields = set(prefetch_data['required_fields'])
+        select_related, pushed_paths = [], []
+
+        for child_name, child_node in node['fields'].items():
+            child_path = child_node['path']
+            if not select_data.get(child_path, True):
+                continue
+
+            child_relation = prefetch_data['namespaces'].get(child_name)
+            if child_relation is not None:
+                if child_relation.concrete:
+                    only_fields.add(child_relation.name)
+
+                if self._is_pushable_optimization(child_node['qs'], relation, child_relation):
+                    select_related.append(child_relation.name)
+                    pushed_paths.append(child_path)
+
+            elif not child_node['namespace']:
+                only_fields.update(self._get_filter_model_field_names(child_path, prefetch_data))
+
+        prefetch_spec = (relation, prefetch_data, tuple(sorted(only_fields)), tuple(select_related))
+        return prefetch_spec, tuple(pushed_paths)
+
+    def _build_namespace_prefetch(self, prefetch_spec):
+        relation, prefetch_data, only_fields, select_related = prefetch_spec
+
+        queryset = prefetch_data['model']._default_manager.all()
+        if prefetch_data['filter']:
+            queryset = queryset.filter(self._get_namespace_prefetch_q(prefetch_data['orm_route']))
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetch_data['only']:
+            queryset = queryset.only(*only_fields)
+
+        if prefetch_data['limit']:
+            queryset = self._limit_prefetch_queryset(queryset, prefetch_data)
+
+        return Prefetch(relation, queryset=queryset)
+
+    @staticmethod
+    def _limit_prefetch_queryset(queryset, prefetch_data):
+        ordering = prefetch_data['ordering']
+        row_number = Window(
+            RowNumber(),
+            partition_by=F(prefetch_data['partition']),
+            order_by=list(ordering),
+        )
+
+        return (
+            queryset.annotate(**{PREFETCH_ROW_NUMBER: row_number})
+            .filter(**{'{0}__lte'.format(PREFETCH_ROW_NUMBER): prefetch_data['limit']})
+            .order_by(*ordering)
+        )
+
+    def _get_namespace_prefetch_q(self, orm_route):
+        """Collects top level conjuncts of the query, that filter only by the namespace relation,
+        and rebases them on the namespace model."""
+        q = self.Q_CLS()
+        if not self._filter_q:
+            return q
+
+        for conjunct in self._iter_q_conjuncts(self._filter_q):
+            rebased_conjunct = self._rebase_q_child(conjunct, orm_route)
+            if rebased_conjunct is not None:
+                q &= rebased_conjunct
+
+        return q
+
+    @classmethod
+    def _iter_q_conjuncts(cls, q):
+        if not (isinstance(q, Q) and q.connector == Q.AND and not q.negated):
+            yield q
+            return
+
+        for child in q.children:
+            yield from cls._iter_q_conjuncts(child)
+
+    @classmethod
+    def _rebase_q_child(cls, child, orm_route):
+        if not isinstance(child, Q):
+            lookup, value = child
+            if not lookup.startswith(orm_route):
+                return
+
+            return cls.Q_CLS(**{lookup[len(orm_route) :]: value})
+
+        if not child.children:
+            return
+
+        rebased_children = []
+        for q_child in child.children:
+            rebased_child = cls._rebase_q_child(q_child, orm_route)
+            if rebased_child is None:
+                return
+
+            rebased_children.append(rebased_child)
+
+        return child.__class__(
+            *rebased_children,
+            _connector=child.connector,
+            _negated=child.negated,
+        )
 
-        return self.__apply_optimizations(
-            OptimizationArgs(qs, select_data, node['fields']),
+    @staticmethod
+    def _is_pushable_optimization(optimization, parent_relation, relation):
+        # Nested to-one relations, that are prefetched separately, can be joined instead
+        return isinstance(optimization, PrefetchRelated) and optimization.relations == (
+            '{0}__{1}'.format(parent_relation, relation.name),
         )
 
-    def _apply_ordering(self, qs, properties):
+    def _get_filter_model_field_names(self, filter_name, prefetch_data):
+        filter_item = self.filters.get(filter_name)
+        if not filter_item:
+            return ()
+
+        if not isinstance(filter_item, iterable_types):
+            filter_item = (filter_item,)
+
+        model, orm_route = prefetch_data['model'], prefetch_data['orm_route']
+        field_names = []
+        for item in filter_item:
+            item_orm_route = item.get('orm_route', '')
+            if not item_orm_route.startswith(orm_route):
+                continue
+
+            model_field_name = item_orm_route[len(orm_route) :].split('__', 1)[0]
+            try:
+                model_field = self._get_model_field(model, model_field_name)
+            except FieldDoesNotExist:
+                continue
+
+            if model_field.concrete:
+                field_names.append(model_field.name)
+
+        return field_names
+
+    def _get_ordering(self, properties):
         if len(properties) == 0:
-            return qs
+            return None
 
         if len(properties) > 1:
             raise RQLFilterParsingError(
@@ -622,7 +1386,18 @@ class RQLFilterClass:
         perm = []
         for prop in properties[0]:
             filter_name, sign = self._get_filter_name_with_sign_for_ordering(prop)
+            self._compile_filter_namespaces(filter_name)
+
             if filter_name not in self.ordering_filters:
+                if INDEX_POLICY_ORDERING in self._get_index_restrictions(filter_name):
+                    raise RQLFilterLookupError(
+                        details={
+                            'filter': filter_name,
+                            'lookup': INDEX_POLICY_ORDERING,
+                            'error': "Ordering can't use an index.",
+                        },
+                    )
+
                 raise RQLFilterParsingError(
                     details={
                         'error': 'Bad ordering filter: {0}.'.format(filter_name),
@@ -630,6 +1405,7 @@ class RQLFilterClass:
                 )
 
             perm.append('{0}{1}'.format(sign, filter_name))
+            self._add_usage(UsageKinds.ORDERING, perm[-1])
             filters = self.filters[filter_name]
             if not isinstance(filters, list):
                 filters = [filters]
@@ -648,7 +1424,7 @@ class RQLFilterClass:
                 },
             )
 
-        return qs.order_by(*ordering_fields)
+        return tuple(ordering_fields)
 
     @staticmethod
     def _get_filter_name_with_sign_for_ordering(prop):
@@ -707,13 +1483,12 @@ class RQLFilterClass:
                 orm_field_name = item.get('source', namespace)
                 related_orm_route = '{0}{1}__'.format(orm_route, orm_field_name)
 
-                related_model = self._get_field_related_model(
-                    self._get_field(
-                        _model,
-                        orm_field_name,
-                        get_related=True,
-                    ),
+                related_field = self._get_field(
+                    _model,
+                    orm_field_name,
+                    get_related=True,
                 )
+                related_model = self._get_field_related_model(related_field)
 
                 qs = item.get('qs')
                 tree, p_qs = self._fill_select_tree(
@@ -724,17 +1499,33 @@ class RQLFilterClass:
                     hidden=item.get('hidden', False),
                     qs=qs,
                     parent_qs=parent_qs,
+                    prefetch=self._get_namespace_prefetch_data(
+                        item,
+                        related_field,
+                        related_model,
+                        related_orm_route,
+                    ),
                 )
 
-                self._build_filters(
-                    item.get('filters', []),
-                    filter_route=related_filter_route + '.',
-                    orm_route=related_orm_route,
-                    orm_model=related_model,
-                    select_tree=tree,
-                    parent_qs=p_qs,
-                    distinct=item.get('distinct', distinct),
-                )
+                namespace_kwargs = {
+                    'filter_route': related_filter_route + '.',
+                    'orm_route': related_orm_route,
+                    'orm_model': related_model,
+                    'parent_qs': p_qs,
+                    'distinct': item.get('distinct', distinct),
+                }
+                if self.LAZY_NAMESPACES:
+                    namespace_filters = item.get('filters', [])
+                    self._lazy_namespaces.setdefault(related_filter_route, []).append(
+                        (
+                            namespace_filters,
+                            namespace_kwargs,
+                            self._get_lazy_namespace_flags(namespace_filters),
+                        ),
+                    )
+                    continue
+
+                self._build_namespace_filters(item.get('filters', []), tree, **namespace_kwargs)
                 continue
 
             assert 'filter' in item, "All extended filters must have set 'filter' set."
@@ -767,6 +1558,9 @@ class RQLFilterClass:
                 distinct,
             )
 
+    def _build_namespace_filters(self, filters, select_tree, **kwargs):
+        self._build_filters(filters, select_tree=select_tree, **kwargs)
+
     def _build_filters_for_common_item(
         self,
         item,
@@ -798,7 +1592,7 @@ class RQLFilterClass:
             items = self._build_mapped_item(field, full_orm_route, **kwargs)
             self._check_search(item, field_filter_route, field)
 
-        self._add_filter_item(field_filter_route, items)
+        self._add_filter_item(field_filter_route, items, ordering=item.get('ordering', False))
         self._register_ordering_and_search(item, field_filter_route)
 
     def _fill_select_tree(
@@ -810,6 +1604,7 @@ class RQLFilterClass:
         hidden=False,
         qs=None,
         parent_qs=None,
+        prefetch=None,
     ):
         if not self.SELECT:
             return select_tree, None
@@ -833,36 +1628,165 @@ class RQLFilterClass:
         path = ''
         for index, filter_name_part in enumerate(filter_name_parts):
             path += filter_name_part
-            current_select_tree.setdefault(
-                filter_name_part,
-                {
-                    'hidden': hidden,
-                    'fields': {},
-                    'namespace': namespace or (index != last_filter_name_part_index),
-                    'qs': changed_qs,
-                    'path': path if is_logical_namespace else full_f_name,
-                },
-            )
+            if filter_name_part not in current_select_tree:
+                current_select_tree[filter_name_part] = SelectNode(
+                    hidden=hidden,
+                    fields={},
+                    namespace=namespace or (index != last_filter_name_part_index),
+                    qs=changed_qs,
+                    path=path if is_logical_namespace else full_f_name,
+                    prefetch=prefetch if index == last_filter_name_part_index else None,
+                )
+
             current_select_tree = current_select_tree[filter_name_part]['fields']
             path += '.'
 
         return current_select_tree, parent_qs if not qs else changed_qs
 
-    def _add_filter_item(self, filter_name, item):
+    def _get_namespace_prefetch_data(self, item, related_field, related_model, orm_route):
+        prefetch_only = item.get('prefetch_only', False)
+        filter_prefetch = item.get('filter_prefetch', False)
+        prefetch_limit = item.get('prefetch_limit')
+        has_options = prefetch_only or filter_prefetch or (prefetch_limit is not None)
+        if not (self.SELECT and has_options):
+            return None
+
+        namespace = item['namespace']
+        e = "{0}: prefetch options require a 'PrefetchRelated' optimization.".format(namespace)
+        assert isinstance(item.get('qs'), PrefetchRelated), e
+
+        e = "{0}: 'prefetch_only' must be a boolean or a list of field names.".format(namespace)
+        assert isinstance(prefetch_only, (bool,) + iterable_types), e
+
+        prefetch_ordering = item.get('prefetch_ordering', ('pk',))
+        if prefetch_limit is not None:
+            e = "{0}: 'prefetch_limit' must be a positive integer.".format(namespace)
+            assert isinstance(prefetch_limit, int) and prefetch_limit > 0, e
+
+            e = "{0}: 'prefetch_limit' is supported only for reverse foreign keys.".format(
+                namespace,
+            )
+            assert related_field.one_to_many, e
+
+            e = "{0}: 'prefetch_ordering' must be a list of field names.".format(namespace)
+            assert prefetch_ordering and isinstance(prefetch_ordering, iterable_types), e
+
+            # Rows are limited per parent by filtering on a window function
+            e = "{0}: 'prefetch_limit' requires Django 4.2 or later.".format(namespace)
+            assert django.VERSION >= (4, 2), e
+
+        required_fields = {related_model._meta.pk.name}
+        partition = None
+        if related_field.auto_created and (not related_field.many_to_many):
+            # Reverse relations are prefetched by the foreign key of the related model
+            partition = related_field.field.name
+            required_fields.add(partition)
+
+        if isinstance(prefetch_only, iterable_types):
+            required_fields.update(prefetch_only)
+
+        return {
+            'model': related_model,
+            'orm_route': orm_route,
+            'only': bool(prefetch_only),
+            'filter': filter_prefetch,
+            'limit': prefetch_limit,
+            'ordering': tuple(prefetch_ordering),
+            'partition': partition,
+            'required_fields': required_fields,
+            'namespaces': self._get_to_one_namespace_relations(item, related_model),
+        }
+
+    def _get_to_one_namespace_relations(self, item, model):
+        relations = {}
+        for child_item in item.get('filters', ()):
+            if not (isinstance(child_item, dict) and 'namespace' in child_item):
+                continue
+
+            child_namespace = child_item['namespace']
+            source = child_item.get('source', child_namespace)
+            if len(self._get_field_name_parts(source)) != 1 or '.' in child_namespace:
+                continue
+
+            relation = self._get_field(model, source, get_related=True)
+            if relation.many_to_one or relation.one_to_one:
+                relations[child_namespace] = relation
+
+        return relations
+
+    def _add_filter_item(self, filter_name, item, ordering=False):
         e = "'{0}' is a reserved filter name.".format(filter_name)
         assert filter_name not in RESERVED_FILTER_NAMES, e
 
+        if self.INDEX_POLICY:
+            item = self._apply_index_policy(filter_name, item, ordering)
+
         self.filters[filter_name] = item
 
     def _register_ordering_and_search(self, item, field_filter_route):
-        if item.get('ordering'):
+        index_restricted = self._get_index_restrictions(field_filter_route)
+
+        if item.get('ordering') and INDEX_POLICY_ORDERING not in index_restricted:
             self.ordering_filters.add(field_filter_route)
 
-        if item.get('search'):
+        if item.get('search') and FilterLookups.I_LIKE not in index_restricted:
             self.search_filters.add(field_filter_route)
 
-    def _extend_annotations(self):
-        filter_names = tuple(self.filters.keys())
+    def _apply_index_policy(self, filter_name, item, ordering):
+        items = item if isinstance(item, list) else [item]
+        if not all(isinstance(i, FilterItem) and self._is_model_column(i['field']) for i in items):
+            return item
+
+        overrides = (self.INDEX_POLICY_OVERRIDES or {}).get(filter_name, set())
+        if overrides is True:
+            return item
+
+        restricted, prefix_lookups = set(), set()
+        for filter_item in items:
+            field = filter_item['field']
+            indexes = get_cached_model_indexes(field.model)
+            lookups, is_ordering, prefix = get_indexed_lookups(indexes, field)
+
+            restricted |= filter_item['lookups'] - lookups
+            prefix_lookups |= prefix
+            if ordering and not is_ordering:
+                restricted.add(INDEX_POLICY_ORDERING)
+
+        restricted -= overrides
+        prefix_lookups = (prefix_lookups & items[0]['lookups']) - restricted - overrides
+        if not (restricted or prefix_lookups):
+            return item
+
+        policy_kwargs = {}
+        if restricted:
+            policy_kwargs['index_restricted'] = intern_set(restricted)
+
+        if prefix_lookups:
+            policy_kwargs['prefix_lookups'] = intern_set(prefix_lookups)
+
+        items = [
+            FilterItem(
+                **{**filter_item, 'lookups': filter_item['lookups'] - restricted, **policy_kwargs},
+            )
+            for filter_item in items
+        ]
+        return items if isinstance(item, list) else items[0]
+
+    def _get_index_restrictions(self, filter_name):
+        item = self.filters.get(filter_name)
+        if isinstance(item, list):
+            item = item[0]
+
+        return item.get('index_restricted', ()) if item else ()
+
+    @staticmethod
+    def _is_model_column(field):
+        return getattr(field, 'concrete', False) and getattr(field, 'model', None) is not None
+
+    def _extend_annotations(self, filter_names=None):
+        if filter_names is None:
+            filter_names = tuple(self.filters.keys())
+
         extended_annotations = defaultdict(list)
 
         for annotated_filter_name, annotation_list in self.annotations.items():
@@ -881,6 +1805,7 @@ class RQLFilterClass:
         if perms:
             for s in chain.from_iterable(perms):
                 filter_name = s[1:] if s and s[0] in ('+', '-') else s
+                self._compile_filter_namespaces(filter_name)
 
                 e = 'Wrong configuration of allowed ordering permutations: {n}.'.format(n=s)
                 assert filter_name in self.ordering_filters, e
@@ -937,26 +1862,28 @@ class RQLFilterClass:
         openapi = kwargs.get('openapi')
         hidden = kwargs.get('hidden')
 
-        possible_lookups = lookups or cls.FILTER_TYPES_CLS.default_field_filter_lookups(field)
+        possible_lookups = set(
+            lookups or cls.FILTER_TYPES_CLS.default_field_filter_lookups(field),
+        )
         if not cls._is_field_nullable(field):
             possible_lookups.discard(FilterLookups.NULL)
 
-        result = {
-            'field': field,
-            'orm_route': field_orm_route,
-            'lookups': possible_lookups,
-            'null_values': null_values or {RQL_NULL},
-            'distinct': distinct or False,
-            'hidden': hidden or False,
-        }
-
+        optional_kwargs = {}
         if use_repr is not None:
-            result['use_repr'] = use_repr
+            optional_kwargs['use_repr'] = use_repr
 
         if openapi is not None:
-            result['openapi'] = openapi
-
-        return result
+            optional_kwargs['openapi'] = openapi
+
+        return FilterItem(
+            field=field,
+            orm_route=field_orm_route,
+            lookups=possible_lookups,
+            null_values=null_values or {RQL_NULL},
+            distinct=distinct or False,
+            hidden=hidden or False,
+            **optional_kwargs,
+        )
 
     @staticmethod
     def _is_pk_field(field):
@@ -1234,6 +2161,33 @@ class RQLFilterClass:
         }
         return mapper[grammar_operator]
 
+    def _check_index_restricted_lookup(self, filter_name, base_item, data):
+        if data.list_operator:
+            is_in = data.list_operator == ListOperators.IN
+            filter_lookup = FilterLookups.IN if is_in else FilterLookups.OUT
+        elif data.str_value in base_item.get('null_values', ()):
+            filter_lookup = FilterLookups.NULL
+        else:
+            filter_lookup = self._get_filter_lookup_by_operator(data.operator)
+
+        if filter_lookup in base_item['index_restricted']:
+            error_details = self._get_error_details(filter_name, filter_lookup, data.str_value)
+            error_details['details']['error'] = "Lookup can't use an index."
+            raise RQLFilterLookupError(**error_details)
+
+    def _check_prefix_lookup(self, filter_name, filter_lookup, str_value, django_lookup):
+        prefix_django_lookups = (
+            DjangoLookups.EXACT,
+            DjangoLookups.I_EXACT,
+            DjangoLookups.STARTSWITH,
+            DjangoLookups.I_STARTSWITH,
+        )
+        if django_lookup not in prefix_django_lookups:
+            error = "Pattern with a leading wildcard can't use an index."
+            error_details = self._get_error_details(filter_name, filter_lookup, str_value)
+            error_details['details']['error'] = error
+            raise RQLFilterLookupError(**error_details)
+
     @staticmethod
     def _get_error_details(filter_name, filter_lookup, str_value):
         return {
@@ -1333,31 +2287,153 @@ class NestedAutoRQLFilterClass(AutoRQLFilterClass):
      `AutoRQLFilterClass`. (default 1)."""
 
     def _get_init_filters(self):
+        self._built_subtrees = {}
         if self.DEPTH == 0:
             return super()._get_init_filters()
 
-        depth = 0
-        global_namespace = []
-        iterator = [(self.MODEL, global_namespace, None, None)]
+        # Same related models are reached via several paths, so equal subtrees are shared
+        subtrees = {}
+        global_namespace = self._get_model_filters(self.MODEL, None, None, 0, subtrees)
+
+        # Every declared subtree is built once, so subtrees, that are used by several namespaces,
+        #  are built on the first use, other namespaces get copies with changed routes
+        uses = Counter(
+            id(item['filters'])
+            for namespace in subtrees.values()
+            for item in namespace
+            if 'namespace' in item
+        )
+        self._built_subtrees = {
+            id(namespace): [namespace, uses[id(namespace)], None]
+            for namespace in subtrees.values()
+            if uses[id(namespace)] > 1
+        }
+        return self._described_filters + tuple(global_namespace)
+
+    def _default_init(self, filters):
+        try:
+            super()._default_init(filters)
 
-        while depth <= self.DEPTH and iterator:
-            iterator = self._iter_models_to_get_filters(depth, iterator)
-            depth += 1
+        finally:
+            # Built subtrees are needed only for the construction
+            self._built_subtrees = {}
 
-        return self._described_filters + tuple(global_namespace)
+    def _build_namespace_filters(self, filters, select_tree, **kwargs):
+        subtree = self._built_subtrees.get(id(filters))
+
+        # Overrides of the index policy are set by full filter names
+        if (subtree is None) or self.INDEX_POLICY_OVERRIDES:
+            super()._build_namespace_filters(filters, select_tree, **kwargs)
+            return
+
+        subtree[1] -= 1
+        if subtree[2] is None:
+            subtree[2] = self._build_subtree(filters, select_tree, **kwargs)
+            return
+
+        self._copy_subtree(subtree[2], filters, select_tree, **kwargs)
+        if not subtree[1]:
+            # The last copy is done, so built filters are released
+            del self._built_subtrees[id(filters)]
+
+    def _build_subtree(self, filters, select_tree, **kwargs):
+        outer_filters = self.filters
+        outer_ordering_filters = self.ordering_filters
+        outer_search_filters = self.search_filters
+        self.filters, self.ordering_filters, self.search_filters = {}, set(), set()
+
+        try:
+            super()._build_namespace_filters(filters, select_tree, **kwargs)
+
+            return (
+                kwargs['filter_route'],
+                kwargs['orm_route'],
+                self.filters,
+                self.ordering_filters,
+                self.search_filters,
+            )
+
+        finally:
+            outer_filters.update(self.filters)
+            outer_ordering_filters.update(self.ordering_filters)
+            outer_search_filters.update(self.search_filters)
+            self.filters = outer_filters
+            self.ordering_filters = outer_ordering_filters
+            self.search_filters = outer_search_filters
+
+    def _copy_subtree(self, subtree, filters, select_tree, **kwargs):
+        filter_route, orm_route = kwargs['filter_route'], kwargs['orm_route']
+        (
+            built_filter_route,
+            built_orm_route,
+            built_filters,
+            ordering_filters,
+            search_filters,
+        ) = subtree
+        route_start, orm_route_start = len(built_filter_route), len(built_orm_route)
+
+        for filter_name, item in built_filters.items():
+            if isinstance(item, list):
+                item = [
+                    FilterItem(**{**i, 'orm_route': orm_route + i['orm_route'][orm_route_start:]})
+                    for i in item
+                ]
+
+            else:
+                item = FilterItem(
+                    **{**item, 'orm_route': orm_route + item['orm_route'][orm_route_start:]},
+                )
+
+            self.filters[filter_route + filter_name[route_start:]] = item
+
+        self.ordering_filters.update(filter_route + f[route_start:] for f in ordering_filters)
+        self.search_filters.update(filter_route + f[route_start:] for f in search_filters)
+        if self.SELECT:
+            self._fill_subtree_select_tree(filters, select_tree, filter_route, kwargs['parent_qs'])
 
-    def _iter_models_to_get_filters(self, depth, iterator):
-        related_models = []
+    def _fill_subtree_select_tree(self, filters, select_tree, filter_route, parent_qs):
+        # Select nodes are not copied, as their optimizations depend on parent optimizations
+        for item in filters:
+            if 'namespace' not in item:
+                filter_name = item['filter']
+                self._fill_select_tree(
+                    filter_name,
+                    filter_route + filter_name,
+                    select_tree,
+                    parent_qs=parent_qs,
+                )
+                continue
 
-        for model_data in iterator:
-            related_models.extend(self._iter_model_to_get_filters(depth, model_data))
+            namespace = item['namespace']
+            tree, p_qs = self._fill_select_tree(
+                namespace,
+                filter_route + namespace,
+                select_tree,
+                namespace=True,
+                qs=item['qs'],
+                parent_qs=parent_qs,
+            )
+            self._fill_subtree_select_tree(
+                item['filters'],
+                tree,
+                '{0}{1}.'.format(filter_route, namespace),
+                p_qs,
+            )
 
-        return related_models
+    def _get_model_filters(self, model, circular_related_name, prefix, depth, subtrees):
+        subtree_key = (
+            model,
+            circular_related_name,
+            self.DEPTH - depth,
+            self._get_relative_excluded_filter_names(prefix),
+        )
+        namespace = subtrees.get(subtree_key)
+        if namespace is not None:
+            return namespace
 
-    def _iter_model_to_get_filters(self, depth, model_data):
-        model, namespace, circular_related_name, prefix = model_data
+        namespace = []
         through_models = set()
-        model_related_models = []
+        related_namespaces = []
 
         for field in model._meta.get_fields():
             rel_f_name = self._get_relative_field_name(field, circular_related_name, prefix)
@@ -1368,8 +2444,15 @@ class NestedAutoRQLFilterClass(AutoRQLFilterClass):
                 if self._is_through_field(field):
                     through_models.add(field.through)
 
-                relation_data = self._add_relation_to_iterated_models(depth, field, namespace)
-                model_related_models.append(relation_data + (rel_f_name,))
+                if depth < self.DEPTH:
+                    namespace_item = {
+                        'namespace': field.name,
+                        'filters': [],
+                        'qs': self._get_field_optimization(field),
+                    }
+                    namespace.append(namespace_item)
+                    related_namespaces.append((field, namespace_item, rel_f_name))
+
                 continue
 
             namespace.append(
@@ -1380,25 +2463,43 @@ class NestedAutoRQLFilterClass(AutoRQLFilterClass):
                 },
             )
 
-        return [i for i in model_related_models if i[0] not in through_models]
+        for field, namespace_item, rel_f_name in related_namespaces:
+            if field.related_model not in through_models:
+                namespace_item['filters'] = self._get_model_filters(
+                    field.related_model,
+                    self._get_circular_related_name(field),
+                    rel_f_name,
+                    depth + 1,
+                    subtrees,
+                )
 
-    def _add_relation_to_iterated_models(self, depth, field, namespace):
+        subtrees[subtree_key] = namespace
+        return namespace
+
+    @staticmethod
+    def _get_circular_related_name(field):
         if isinstance(field, (ForeignKey, ManyToManyField)):
-            circular_related_name = field.remote_field.name
-        else:
-            circular_related_name = field.field.name
+            return field.remote_field.name
 
-        namespace_filters = []
-        if depth < self.DEPTH:
-            namespace.append(
-                {
-                    'namespace': field.name,
-                    'filters': namespace_filters,
-                    'qs': self._get_field_optimization(field),
-                },
-            )
+        return field.field.name
 
-        return field.related_model, namespace_filters, circular_related_name
+    def _get_relative_excluded_filter_names(self, prefix):
+        excluded_filter_names = self._excluded_filter_names
+        if not prefix:
+            return excluded_filter_names
+
+        prefix += '.'
+        return frozenset(
+            filter_name[len(prefix) :]
+            for filter_name in excluded_filter_names
+            if filter_name.startswith(prefix)
+        )
+
+    @cached_property
+    def _excluded_filter_names(self):
+        return frozenset(self.EXCLUDE_FILTERS).union(
+            f for f in self._described_filters if isinstance(f, str)
+        )
 
     def _get_relative_field_name(self, field, circular_related_name, prefix):
         field_name = field.name
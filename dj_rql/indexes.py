@@ -0,0 +1,416 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from collections import namedtuple
+from collections.abc import Mapping
+from functools import lru_cache
+
+from django.db.models import CharField, Index, TextField, UniqueConstraint
+from py_rql.constants import FilterLookups
+
+from dj_rql.stats import UsageKinds
+
+
+ModelIndex = namedtuple('ModelIndex', ('name', 'fields', 'opclasses'))
+"""Existing index of a model: field names (`-` prefix for descending columns) and opclasses."""
+
+IndexRecommendation = namedtuple(
+    'IndexRecommendation',
+    ('model', 'kind', 'fields', 'reasons', 'weight'),
+)
+"""Recommended index of a model with the filters, that need it, and their usage count."""
+
+
+class IndexKinds:
+    BTREE = 'btree'
+    COMPOSITE = 'composite'
+    PATTERN = 'pattern'
+    TRIGRAM = 'trigram'
+
+    @classmethod
+    def all(cls):
+        return (cls.BTREE, cls.COMPOSITE, cls.PATTERN, cls.TRIGRAM)
+
+
+BTREE_LOOKUPS = {
+    FilterLookups.EQ,
+    FilterLookups.IN,
+    FilterLookups.GT,
+    FilterLookups.GE,
+    FilterLookups.LT,
+    FilterLookups.LE,
+    FilterLookups.NULL,
+}
+"""Lookups, that are served by B-tree indexes.
+
+`ne` and `out` are not included: negative conditions usually match most rows of a table,
+so databases scan the table instead of the index. They can be allowed for indexed filters
+with `INDEX_POLICY_OVERRIDES`.
+"""
+
+PATTERN_OPCLASSES = {'varchar_pattern_ops', 'text_pattern_ops'}
+TRIGRAM_OPCLASSES = {'gin_trgm_ops', 'gist_trgm_ops'}
+
+
+def get_model_indexes(model):
+    """Indexes of a model, including primary keys, unique and indexed fields and constraints.
+
+    Expression and partial indexes are skipped, as they can't serve arbitrary filters.
+    """
+    meta = model._meta
+    indexes = []
+
+    for field in meta.concrete_fields:
+        if field.primary_key or field.unique or field.db_index:
+            indexes.append(ModelIndex(field.column, (field.name,), ()))
+
+    for index in meta.indexes:
+        if index.fields and not getattr(index, 'condition', None):
+            indexes.append(
+                ModelIndex(
+                    index.name,
+                    tuple(_normalize_index_field(meta, name) for name in index.fields),
+                    tuple(index.opclasses),
+                ),
+            )
+
+    field_sets = list(getattr(meta, 'index_together', ())) + list(meta.unique_together)
+    for constraint in meta.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.fields:
+            if not constraint.condition:
+                field_sets.append(constraint.fields)
+
+    for field_names in field_sets:
+        indexes.append(
+            ModelIndex(
+                '_'.join(field_names),
+                tuple(_normalize_index_field(meta, name) for name in field_names),
+                (),
+            ),
+        )
+
+    return indexes
+
+
+@lru_cache(maxsize=None)
+def get_cached_model_indexes(model):
+    """`get_model_indexes()`, that is cached per model, as model indexes don't change at runtime."""
+    return tuple(get_model_indexes(model))
+
+
+def is_indexed(indexes, fields, opclasses=None):
+    """Check, that fields are leading columns of one of indexes.
+
+    Directions of columns must match or be all reversed, as B-tree indexes are scanned backwards.
+    If `opclasses` are given, the first column must be indexed with one of them.
+    """
+    names = tuple(_strip_sign(name) for name in fields)
+    reversed_fields = tuple(_reverse_sign(name) for name in fields)
+
+    for index in indexes:
+        leading_fields = index.fields[: len(fields)]
+        if tuple(_strip_sign(name) for name in leading_fields) != names:
+            continue
+
+        if len(fields) > 1 and leading_fields not in (fields, reversed_fields):
+            continue
+
+        index_opclass = index.opclasses[0] if index.opclasses else None
+        if opclasses is None and index_opclass is None:
+            return True
+
+        if opclasses is not None and index_opclass in opclasses:
+            return True
+
+    return False
+
+
+def get_indexed_lookups(indexes, field):
+    """Lookups and ordering of a model field, that can use indexes of its model.
+
+    Returns:
+        tuple: set of lookups, flag if ordering can use indexes and set of lookups,
+            that can use indexes only without a leading wildcard.
+    """
+    fields = (field.name,)
+    lookups, prefix_lookups = set(), set()
+
+    is_ordering = is_indexed(indexes, fields)
+    if is_ordering:
+        lookups |= BTREE_LOOKUPS
+
+    if is_indexed(indexes, fields, PATTERN_OPCLASSES):
+        lookups |= {FilterLookups.EQ, FilterLookups.IN, FilterLookups.LIKE}
+        prefix_lookups.add(FilterLookups.LIKE)
+
+    if is_indexed(indexes, fields, TRIGRAM_OPCLASSES):
+        lookups |= {FilterLookups.LIKE, FilterLookups.I_LIKE}
+        prefix_lookups.discard(FilterLookups.LIKE)
+
+    return lookups, is_ordering, prefix_lookups
+
+
+def get_pattern_opclass(field):
+    return 'text_pattern_ops' if isinstance(field, TextField) else 'varchar_pattern_ops'
+
+
+def build_index(recommendation):
+    """Django index for the recommendation. Names are generated as by `makemigrations`."""
+    model, kind, fields = recommendation.model, recommendation.kind, recommendation.fields
+
+    index = Index(fields=list(fields))
+    index.set_name_with_model(model)
+    if kind in (IndexKinds.BTREE, IndexKinds.COMPOSITE):
+        return index
+
+    if kind == IndexKinds.PATTERN:
+        opclass = get_pattern_opclass(model._meta.get_field(fields[0]))
+        return Index(fields=list(fields), name=index.name[:-3] + 'pat', opclasses=[opclass])
+
+    from django.contrib.postgres.indexes import GinIndex
+
+    return GinIndex(fields=list(fields), name=index.name[:-3] + 'trg', opclasses=['gin_trgm_ops'])
+
+
+class IndexAdvisor:
+    """Advisor of model indexes for filters, ordering and search of a filter class.
+
+    Recommendations are derived from filter definitions and are compared with existing model
+    indexes:
+
+    * `btree` - single column indexes for comparison lookups and ordering;
+    * `composite` - multi column indexes for `ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY`;
+    * `pattern` - PostgreSQL `*_pattern_ops` indexes for `like` lookups of string filters;
+    * `trigram` - PostgreSQL `gin_trgm_ops` indexes for `ilike` lookups and search.
+
+    Usage stats of the filter class (from the `rql_usage_stats` command) are used as weights.
+    String filters support `like` and `ilike` by default, so pattern and trigram indexes
+    are recommended only for lookups, that are used according to the stats or, without stats,
+    that are declared explicitly (lookups, that differ from defaults of the field).
+    """
+
+    def __init__(self, filter_instance, usage=None):
+        """
+        :param dj_rql.filter_cls.RQLFilterClass filter_instance: Filter class instance
+        :param dict or None usage: Usage stats of the filter class
+        """
+        self.filter_instance = filter_instance
+        self.usage = usage
+
+        self._indexes = {}
+        self._recommendations = {}
+
+    def recommend(self, kinds=None, min_count=0):
+        """
+        Args:
+            kinds (Iterable[str] or None): kinds of recommended indexes, all kinds by default.
+            min_count (int): min usage count of recommended indexes, if usage stats are set.
+
+        Returns:
+            list: `IndexRecommendation` items, that are sorted by weight.
+        """
+        instance = self.filter_instance
+        instance.compile_filters()
+
+        self._recommendations = {}
+        for filter_name, items in instance.filters.items():
+            for item in items if isinstance(items, list) else [items]:
+                self._add_filter_recommendations(filter_name, item)
+
+        for orm_route in instance.EXTENDED_SEARCH_ORM_ROUTES:
+            field = instance._get_field(instance.MODEL, orm_route)
+            if self._is_string_field(field):
+                self._add(field.model, IndexKinds.TRIGRAM, (field.name,), 'search', orm_route)
+
+        for permutation in instance.allowed_ordering_permutations or ():
+            self._add_permutation_recommendation(permutation)
+
+        kinds = set(kinds or IndexKinds.all())
+        if IndexKinds.COMPOSITE in kinds:
+            self._merge_composite_prefixes()
+
+        recommendations = [
+            recommendation
+            for recommendation in self._recommendations.values()
+            if recommendation.kind in kinds
+            and (self.usage is None or recommendation.weight >= min_count)
+            and not self._is_covered(recommendation)
+        ]
+        return sorted(
+            recommendations,
+            key=lambda r: (-(r.weight or 0), r.model._meta.label, r.kind, r.fields),
+        )
+
+    def _add_filter_recommendations(self, filter_name, item):
+        field = self._get_concrete_field(item)
+        if field is None:
+            return
+
+        lookups = item.get('lookups', set())
+        is_ordering = filter_name in self.filter_instance.ordering_filters
+        is_search = filter_name in self.filter_instance.search_filters
+        is_string = self._is_string_field(field)
+        is_pattern = is_string and self._is_used(filter_name, field, lookups, FilterLookups.LIKE)
+
+        # Pattern opclasses serve equality lookups, but not ordering
+        btree_lookups = set() if is_pattern else lookups & BTREE_LOOKUPS
+        if btree_lookups:
+            self._add(field.model, IndexKinds.BTREE, (field.name,), filter_name, *btree_lookups)
+
+        if is_ordering:
+            self._add(
+                field.model,
+                IndexKinds.BTREE,
+                (field.name,),
+                'ordering',
+                filter_name,
+                weight=self._get_ordering_count(filter_name),
+            )
+
+        if is_pattern:
+            pattern_lookups = (lookups & BTREE_LOOKUPS) | {FilterLookups.LIKE}
+            self._add(field.model, IndexKinds.PATTERN, (field.name,), filter_name, *pattern_lookups)
+
+        if is_string and (
+            is_search or self._is_used(filter_name, field, lookups, FilterLookups.I_LIKE)
+        ):
+            self._add(
+                field.model,
+                IndexKinds.TRIGRAM,
+                (field.name,),
+                filter_name,
+                FilterLookups.I_LIKE,
+            )
+
+    def _is_used(self, filter_name, field, lookups, lookup):
+        if lookup not in lookups:
+            return False
+
+        if self.usage is not None:
+            filter_usage = self.usage.get(UsageKinds.FILTER, {}).get(filter_name, {})
+            return filter_usage.get(lookup, {}).get('count', 0) > 0
+
+        default_lookups = self.filter_instance.FILTER_TYPES_CLS.default_field_filter_lookups(field)
+        return set(lookups) - {FilterLookups.NULL} != set(default_lookups) - {FilterLookups.NULL}
+
+    def _add_permutation_recommendation(self, permutation):
+        if len(permutation) < 2:
+            return
+
+        model, fields = None, []
+        for prop in permutation:
+            filter_name = prop.lstrip('-')
+            field = self._get_concrete_field(self.filter_instance.filters.get(filter_name))
+            if field is None or model not in (None, field.model):
+                return
+
+            model = field.model
+            fields.append('-' + field.name if prop.startswith('-') else field.name)
+
+        weight = None
+        if self.usage is not None:
+            weight = min(self._get_ordering_count(prop.lstrip('-')) for prop in permutation)
+
+        self._add(
+            model,
+            IndexKinds.COMPOSITE,
+            tuple(fields),
+            'ordering',
+            ','.join(permutation),
+            weight=weight,
+        )
+
+    def _merge_composite_prefixes(self):
+        # Leading columns of composite indexes serve single column recommendations
+        for key, recommendation in list(self._recommendations.items()):
+            if recommendation.kind != IndexKinds.BTREE:
+                continue
+
+            for other in self._recommendations.values():
+                if other.kind == IndexKinds.COMPOSITE and other.model is recommendation.model:
+                    if _strip_sign(other.fields[0]) == recommendation.fields[0]:
+                        other_key = (other.model, other.kind, other.fields)
+                        self._recommendations[other_key] = other._replace(
+                            reasons=other.reasons + recommendation.reasons,
+                            weight=_add_weights(other.weight, recommendation.weight),
+                        )
+                        del self._recommendations[key]
+                        break
+
+    def _add(self, model, kind, fields, filter_name, *lookups, weight=None):
+        key = (model, kind, fields)
+        reason = '{0} ({1})'.format(filter_name, ', '.join(sorted(lookups)))
+
+        if weight is None and self.usage is not None:
+            filter_usage = self.usage.get(UsageKinds.FILTER, {}).get(filter_name, {})
+            weight = sum(filter_usage.get(lookup, {}).get('count', 0) for lookup in lookups)
+
+        recommendation = self._recommendations.get(key)
+        if recommendation is None:
+            self._recommendations[key] = IndexRecommendation(model, kind, fields, (reason,), weight)
+            return
+
+        self._recommendations[key] = recommendation._replace(
+            reasons=recommendation.reasons + (reason,),
+            weight=_add_weights(recommendation.weight, weight),
+        )
+
+    def _is_covered(self, recommendation):
+        indexes = self._indexes.get(recommendation.model)
+        if indexes is None:
+            indexes = self._indexes[recommendation.model] = get_model_indexes(recommendation.model)
+
+        if recommendation.kind == IndexKinds.PATTERN:
+            return is_indexed(indexes, recommendation.fields, PATTERN_OPCLASSES)
+
+        if recommendation.kind == IndexKinds.TRIGRAM:
+            return is_indexed(indexes, recommendation.fields, TRIGRAM_OPCLASSES)
+
+        return is_indexed(indexes, recommendation.fields)
+
+    def _get_ordering_count(self, filter_name):
+        if self.usage is None:
+            return None
+
+        ordering_usage = self.usage.get(UsageKinds.ORDERING, {})
+        return sum(
+            ordering_usage.get(prop, {}).get('count', 0)
+            for prop in (filter_name, '-' + filter_name)
+        )
+
+    @staticmethod
+    def _get_concrete_field(item):
+        if not isinstance(item, Mapping) or item.get('custom') or item.get('dynamic'):
+            return None
+
+        field = item.get('field')
+        if not getattr(field, 'concrete', False) or getattr(field, 'model', None) is None:
+            return None
+
+        return field
+
+    @staticmethod
+    def _is_string_field(field):
+        return isinstance(field, (CharField, TextField))
+
+
+def _normalize_index_field(meta, name):
+    field_name = _strip_sign(name)
+    normalized = meta.get_field(field_name).name
+    return '-' + normalized if name.startswith('-') else normalized
+
+
+def _strip_sign(name):
+    return name[1:] if name.startswith('-') else name
+
+
+def _reverse_sign(name):
+    return name[1:] if name.startswith('-') else '-' + name
+
+
+def _add_weights(weight, other_weight):
+    if weight is None or other_weight is None:
+        return weight if other_weight is None else other_weight
+
+    return weight + other_weight
@@ -0,0 +1,68 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from django.core.management import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from dj_rql._compiler import FilterSchemaCompilationError, FilterSchemaCompiler
+
+
+class Command(BaseCommand):
+    help = (
+        'Compiles a filter class into a Python module, that can be loaded without '
+        'building filters from declarations.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'filter_class',
+            nargs=1,
+            type=str,
+            help='Importable filter class location string.',
+        )
+        parser.add_argument(
+            '-o',
+            '--output',
+            type=str,
+            help='Path to the generated module. Code is returned, if it is not set.',
+        )
+        parser.add_argument(
+            '-c',
+            '--check',
+            action='store_true',
+            default=False,
+            help='Flag to check, that the generated module is up to date with models.',
+        )
+
+    def handle(self, *args, **options):
+        filter_cls_import = options['filter_class'][0]
+        output = options['output']
+
+        try:
+            code = FilterSchemaCompiler(import_string(filter_cls_import)).render()
+        except FilterSchemaCompilationError as e:
+            raise CommandError('{0}: {1}'.format(filter_cls_import, str(e)))
+
+        if options['check']:
+            if not output:
+                raise CommandError('Output module must be set for the check.')
+
+            try:
+                with open(output) as f:
+                    is_up_to_date = f.read() == code
+            except FileNotFoundError:
+                is_up_to_date = False
+
+            if not is_up_to_date:
+                raise CommandError(
+                    '{0}: compiled module {1} is out of date.'.format(filter_cls_import, output),
+                )
+
+            return
+
+        if not output:
+            return code
+
+        with open(output, 'w') as f:
+            f.write(code)
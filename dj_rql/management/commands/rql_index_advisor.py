@@ -0,0 +1,182 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+import os
+
+from django.core.management import BaseCommand, CommandError
+from django.db import migrations
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+from django.utils.module_loading import import_string
+
+from dj_rql.indexes import IndexAdvisor, IndexKinds, build_index
+from dj_rql.stats import UsageStats
+
+
+class Command(BaseCommand):
+    help = (
+        'Recommends model indexes for filters, ordering and search of a filter class, '
+        'that are not covered by existing indexes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'filter_class',
+            nargs=1,
+            type=str,
+            help='Importable filter class location string.',
+        )
+        parser.add_argument(
+            '-u',
+            '--usage',
+            type=str,
+            help=(
+                'Directory with usage stats files or a JSON output of the `rql_usage_stats` '
+                'command. Usage counts are used as weights of recommendations.'
+            ),
+        )
+        parser.add_argument(
+            '--min-count',
+            type=int,
+            default=0,
+            help='Min usage count of recommended indexes, if usage stats are set (default 0).',
+        )
+        parser.add_argument(
+            '-k',
+            '--kind',
+            action='append',
+            choices=IndexKinds.all(),
+            help='Kind of recommended indexes. All kinds are recommended by default.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=('text', 'json', 'migration'),
+            default='text',
+            help=(
+                'Report format (default text). Migration contains indexes of models '
+                'of the filter class model app.'
+            ),
+        )
+        parser.add_argument(
+            '--migration-name',
+            type=str,
+            default='rql_indexes',
+            help='Name of the migration without number (default rql_indexes).',
+        )
+        parser.add_argument(
+            '-o',
+            '--output',
+            type=str,
+            help='Path to the output file. Report is returned, if it is not set.',
+        )
+
+    def handle(self, *args, **options):
+        filter_cls_import = options['filter_class'][0]
+        try:
+            filter_class = import_string(filter_cls_import)
+        except ImportError as e:
+            raise CommandError(str(e))
+
+        usage = None
+        if options['usage']:
+            usage = self._load_usage(options['usage']).get(filter_cls_import, {})
+
+        instance = filter_class(filter_class.MODEL._default_manager.all())
+        recommendations = IndexAdvisor(instance, usage=usage).recommend(
+            kinds=options['kind'],
+            min_count=options['min_count'],
+        )
+
+        if options['format'] == 'migration':
+            output = self._render_migration(
+                filter_class.MODEL._meta.app_label,
+                options['migration_name'],
+                recommendations,
+            )
+        elif options['format'] == 'json':
+            output = json.dumps(
+                [self._serialize(recommendation) for recommendation in recommendations],
+                indent=2,
+            )
+        else:
+            output = self._format_report(filter_cls_import, recommendations)
+
+        if not options['output']:
+            return output
+
+        with open(options['output'], 'w') as f:
+            f.write(output)
+
+    @staticmethod
+    def _load_usage(path):
+        if os.path.isdir(path):
+            return UsageStats.load(path)
+
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise CommandError('Usage stats {0} do not exist.'.format(path))
+
+    @staticmethod
+    def _serialize(recommendation):
+        return {
+            'model': recommendation.model._meta.label,
+            'kind': recommendation.kind,
+            'fields': list(recommendation.fields),
+            'name': build_index(recommendation).name,
+            'reasons': list(recommendation.reasons),
+            'weight': recommendation.weight,
+        }
+
+    @staticmethod
+    def _format_report(filter_cls_import, recommendations):
+        if not recommendations:
+            return '{0}: all filters are covered by indexes.'.format(filter_cls_import)
+
+        lines = ['{0}: {1} recommended indexes.'.format(filter_cls_import, len(recommendations))]
+        for recommendation in recommendations:
+            lines.append(
+                '{0} {1} ({2}){3}: {4}'.format(
+                    recommendation.model._meta.label,
+                    recommendation.kind,
+                    ', '.join(recommendation.fields),
+                    '' if recommendation.weight is None else ' x{0}'.format(recommendation.weight),
+                    '; '.join(recommendation.reasons),
+                ),
+            )
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _render_migration(app_label, name, recommendations):
+        recommendations = [r for r in recommendations if r.model._meta.app_label == app_label]
+
+        operations = [
+            migrations.AddIndex(
+                model_name=recommendation.model._meta.model_name,
+                index=build_index(recommendation),
+            )
+            for recommendation in recommendations
+        ]
+        if any(r.kind == IndexKinds.TRIGRAM for r in recommendations):
+            operations.insert(
+                0,
+                migrations.RunSQL(
+                    'CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+                    reverse_sql=migrations.RunSQL.noop,
+                ),
+            )
+
+        leaf_nodes = MigrationLoader(None, ignore_no_migrations=True).graph.leaf_nodes(app_label)
+        number = 1
+        if leaf_nodes:
+            number = (MigrationAutodetector.parse_number(leaf_nodes[0][1]) or 0) + 1
+
+        migration = migrations.Migration('{0:04d}_{1}'.format(number, name), app_label)
+        migration.dependencies = leaf_nodes
+        migration.operations = operations
+        return MigrationWriter(migration).as_string()
@@ -0,0 +1,138 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+import os
+
+from django.core.management import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from dj_rql.drf.query_recorder import QueryReplay
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays a corpus of queries, recorded with the `RQL_QUERY_RECORDER` setting, '
+        'and reports percentiles of RQL stage durations per query shape.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('corpus', type=str, help='Path to the JSON lines corpus file.')
+        parser.add_argument(
+            '-f',
+            '--filter-class',
+            type=str,
+            help='Qualified name of a filter class for all queries (default is recorded classes).',
+        )
+        parser.add_argument(
+            '-d',
+            '--database',
+            type=str,
+            help='Database alias to replay queries against (default is the default database).',
+        )
+        parser.add_argument(
+            '-r',
+            '--repeat',
+            type=int,
+            default=1,
+            help='Number of replays of each query (default 1).',
+        )
+        parser.add_argument(
+            '-l',
+            '--limit',
+            type=int,
+            default=10,
+            help='Page size for queries without limit (default 10).',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Number of the slowest query shapes by p90 in the text report (default 10).',
+        )
+        parser.add_argument(
+            '--format',
+            choices=('text', 'json'),
+            default='text',
+            help='Report format (default text).',
+        )
+        parser.add_argument(
+            '-o',
+            '--output',
+            type=str,
+            help='Path to the output file. Report is returned, if it is not set.',
+        )
+
+    def handle(self, *args, **options):
+        corpus = options['corpus']
+        if not os.path.isfile(corpus):
+            raise CommandError('Corpus file {0} does not exist.'.format(corpus))
+
+        filter_class = None
+        if options['filter_class']:
+            try:
+                filter_class = import_string(options['filter_class'])
+            except ImportError as e:
+                raise CommandError(str(e))
+
+        replay = QueryReplay(
+            filter_class=filter_class,
+            database=options['database'],
+            repeat=options['repeat'],
+            default_limit=options['limit'],
+        )
+        with open(corpus) as f:
+            report = replay.run(json.loads(line) for line in f if line.strip())
+
+        if options['format'] == 'json':
+            output = json.dumps(report, indent=2, sort_keys=True)
+        else:
+            output = self._format_report(report, options['top'])
+
+        if not options['output']:
+            return output
+
+        with open(options['output'], 'w') as f:
+            f.write(output)
+
+    @classmethod
+    def _format_report(cls, report, top):
+        lines = [
+            'Replayed queries: {0}, errors: {1}.'.format(report['queries'], report['errors']),
+            '',
+        ]
+        lines.extend(cls._format_stages(report['stages']))
+
+        shapes = sorted(
+            report['shapes'].items(),
+            key=lambda item: item[1]['stages'].get(QueryReplay.TOTAL, {}).get('p90', 0),
+            reverse=True,
+        )
+        for shape_key, shape in shapes[:top]:
+            lines.extend(
+                (
+                    '',
+                    '{0} (queries: {1}, errors: {2})'.format(
+                        shape_key,
+                        shape['queries'],
+                        shape['errors'],
+                    ),
+                ),
+            )
+            lines.extend(cls._format_stages(shape['stages']))
+            lines.extend(
+                'failed {0}: {1}'.format(query, error) for query, error in shape['failures'].items()
+            )
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _format_stages(stages):
+        columns = ('p50', 'p90', 'p99', 'max')
+        yield '{0:<15}{1}'.format('stage', ''.join('{0:>12}'.format(c) for c in columns))
+        for stage, percentiles in stages.items():
+            yield '{0:<15}{1}'.format(
+                stage,
+                ''.join('{0:>10.3f}ms'.format(percentiles[c] * 1e3) for c in columns),
+            )
@@ -0,0 +1,64 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+import os
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from dj_rql.stats import UsageStats
+
+
+class Command(BaseCommand):
+    help = (
+        'Dumps usage stats of filters, lookups, ordering and select, collected '
+        'with the `RQL_USAGE_STATS` setting.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-p',
+            '--path',
+            type=str,
+            help=('Directory with stats files (default is the `path` of `RQL_USAGE_STATS`).'),
+        )
+        parser.add_argument(
+            '-f',
+            '--filter-class',
+            action='append',
+            type=str,
+            help='Qualified name of a filter class to dump. All classes are dumped by default.',
+        )
+        parser.add_argument(
+            '-o',
+            '--output',
+            type=str,
+            help='Path to the JSON output file. Stats are returned, if it is not set.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path'] or (getattr(settings, 'RQL_USAGE_STATS', None) or {}).get('path')
+
+        # Stats of the command process are always empty, so they are never dumped
+        if not path:
+            raise CommandError(
+                'Stats directory is not set, use --path or the `path` of `RQL_USAGE_STATS`.',
+            )
+
+        if not os.path.isdir(path):
+            raise CommandError('Stats directory {0} does not exist.'.format(path))
+
+        stats = UsageStats.load(path)
+
+        filter_classes = options['filter_class']
+        if filter_classes:
+            stats = {k: v for k, v in stats.items() if k in filter_classes}
+
+        output = json.dumps(stats, indent=2, sort_keys=True)
+        if not options['output']:
+            return output
+
+        with open(options['output'], 'w') as f:
+            f.write(output)
@@ -4,7 +4,9 @@
 
 from collections import namedtuple
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Prefetch, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 
 
 class DBOptimization:
@@ -180,6 +182,178 @@ class Chain(_NestedOptimizationMixin, DBOptimization):
         return queryset
 
 
+class _PlanGroup:
+    __slots__ = ('annotations', 'select_related', 'prefetch_related')
+
+    def __init__(self):
+        self.annotations = {}
+        self.select_related = {}
+        self.prefetch_related = {}
+
+
+class OptimizationPlan:
+    """Normalized set of DB optimizations, that is applied to the queryset at once.
+
+    Annotations are combined into one `annotate()` call, select related paths are merged,
+    prefetch lookups are deduplicated and prefetches of to-one relations are converted
+    into joins, when it's possible. Custom optimizations are applied in the order, in which
+    they were added relative to other optimizations.
+    """
+
+    def __init__(self):
+        self._steps = []
+        self._annotation_names = set()
+        self._prefetch_related = {}
+
+    def add(self, *optimizations):
+        """
+        Add optimizations to the plan.
+
+        Args:
+            optimizations (DBOptimization): optimizations to add.
+
+        Returns:
+            OptimizationPlan: the plan itself.
+
+        Raises:
+            ValueError: if different `Prefetch` objects are added for the same lookup.
+        """
+        for optimization in optimizations:
+            if isinstance(optimization, Chain):
+                self.add(*optimization.relations)
+
+            elif isinstance(optimization, Annotation):
+                group = self._get_group()
+                for name, expression in optimization.extensions.items():
+                    if name not in self._annotation_names:
+                        self._annotation_names.add(name)
+                        group.annotations[name] = expression
+
+            elif isinstance(optimization, SelectRelated):
+                group = self._get_group()
+                for relation in optimization.relations:
+                    group.select_related.setdefault(relation)
+
+            elif isinstance(optimization, PrefetchRelated):
+                group = self._get_group()
+                for relation in optimization.relations:
+                    self._add_prefetch_lookup(group, relation)
+
+            else:
+                self._steps.append(optimization)
+
+        return self
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """
+        Apply all planned optimizations for the given queryset.
+
+        Args:
+            queryset (QuerySet): queryset instance to optimize.
+
+        Returns:
+            QuerySet: queryset optimized.
+        """
+        for step in self._steps:
+            if isinstance(step, _PlanGroup):
+                queryset = self._apply_group(queryset, step)
+            else:
+                queryset = step.apply(queryset)
+
+        return queryset
+
+    def _get_group(self):
+        if not (self._steps and isinstance(self._steps[-1], _PlanGroup)):
+            self._steps.append(_PlanGroup())
+
+        return self._steps[-1]
+
+    def _apply_group(self, queryset, group):
+        if group.annotations:
+            queryset = queryset.annotate(**group.annotations)
+
+        select_related = list(group.select_related)
+        prefetch_related = []
+        for prefetch_to in group.prefetch_related:
+            lookup = self._prefetch_related[prefetch_to]
+            if self._is_joinable_lookup(queryset, lookup):
+                select_related.append(lookup)
+            else:
+                prefetch_related.append(lookup)
+
+        if select_related:
+            queryset = queryset.select_related(*self._merge_select_related(select_related))
+
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        return queryset
+
+    def _add_prefetch_lookup(self, group, lookup):
+        prefetch_to = lookup if isinstance(lookup, str) else lookup.prefetch_to
+        current_lookup = self._prefetch_related.get(prefetch_to)
+
+        if current_lookup is None:
+            self._prefetch_related[prefetch_to] = lookup
+            group.prefetch_related[prefetch_to] = None
+
+        elif isinstance(lookup, str):
+            return
+
+        elif isinstance(current_lookup, str):
+            # Prefetch objects take precedence over the same plain lookups
+            self._prefetch_related[prefetch_to] = lookup
+
+        elif not self._is_same_prefetch(current_lookup, lookup):
+            raise ValueError(
+                "'{0}' lookup was already added with a different Prefetch.".format(prefetch_to),
+            )
+
+    def _is_joinable_lookup(self, queryset, lookup):
+        if not isinstance(lookup, str):
+            return False
+
+        # Deferred fields can't be traversed with select_related
+        if queryset.query.deferred_loading[0] or (not queryset.query.deferred_loading[1]):
+            return False
+
+        model = queryset.model
+        path = ''
+        for part in lookup.split(LOOKUP_SEP):
+            path = '{0}{1}{2}'.format(path, LOOKUP_SEP, part) if path else part
+            if not isinstance(self._prefetch_related.get(path, path), str):
+                # Related objects, that are prefetched with custom querysets, must not be joined
+                return False
+
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return False
+
+            is_to_one = (field.many_to_one and field.concrete) or field.one_to_one
+            if not (is_to_one and field.related_model):
+                return False
+
+            model = field.related_model
+
+        return True
+
+    @staticmethod
+    def _is_same_prefetch(prefetch, other):
+        return (prefetch is other) or (
+            prefetch.to_attr == other.to_attr and prefetch.queryset is other.queryset
+        )
+
+    @staticmethod
+    def _merge_select_related(relations):
+        unique_relations = dict.fromkeys(relations)
+        return [
+            relation
+            for relation in unique_relations
+            if not any(other.startswith(relation + LOOKUP_SEP) for other in unique_relations)
+        ]
+
+
 AN = Annotation
 SR = SelectRelated
 NSR = NestedSelectRelated
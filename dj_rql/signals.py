@@ -0,0 +1,116 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from time import perf_counter
+
+from django.dispatch import Signal
+
+
+query_cache_event = Signal()
+"""Sent by `RQLFilterBackend` on queries cache usage.
+
+Sender is the filter class. Arguments: `event` (one of `QueryCacheEvents`),
+`count` (number of events) and `view`.
+"""
+
+stage_finished = Signal()
+"""Sent after an RQL request processing stage is finished.
+
+Sender is the class, that processed the stage (filter class, pagination or serializer).
+Arguments: `stage` (one of `Stages`), `duration` (in seconds), `request` and optional `view`.
+"""
+
+
+class QueryCacheEvents:
+    HIT = 'hit'
+    MISS = 'miss'
+    EVICTION = 'eviction'
+
+
+class Stages:
+    PARSE = 'parse'
+    TRANSFORM = 'transform'
+    ORDERING = 'ordering'
+    SELECT = 'select'
+    OPTIMIZATIONS = 'optimizations'
+    COUNT = 'count'
+    FETCH = 'fetch'
+    SERIALIZATION = 'serialization'
+
+
+class _StageTimer:
+    __slots__ = ('_sender', '_stage', '_kwargs', '_server_timing', '_start')
+
+    def __init__(self, sender, stage, kwargs, server_timing=None):
+        self._sender = sender
+        self._stage = stage
+        self._kwargs = kwargs
+        self._server_timing = server_timing
+        self._start = None
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            return
+
+        duration = perf_counter() - self._start
+        if self._server_timing is not None:
+            self._server_timing.add(self._stage, duration)
+
+        if stage_finished.receivers:
+            stage_finished.send(
+                sender=self._sender,
+                stage=self._stage,
+                duration=duration,
+                **self._kwargs,
+            )
+
+
+class _NoopStageTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NOOP_STAGE_TIMER = _NoopStageTimer()
+
+
+def measure_stage(sender, stage, **kwargs):
+    """
+    Context manager, that sends the `stage_finished` signal with the duration of the stage.
+
+    Nothing is measured, if there are no receivers of the signal and the request
+    is not sampled for the `Server-Timing` header.
+
+    Args:
+        sender (type): class, that processes the stage.
+        stage (str): stage name.
+        kwargs (dict): other signal arguments.
+    """
+    # Sampled requests are timed directly, so other requests don't pay for global receivers
+    server_timing = _get_server_timing(kwargs.get('request'))
+    if server_timing is None and not stage_finished.receivers:
+        return _NOOP_STAGE_TIMER
+
+    return _StageTimer(sender, stage, kwargs, server_timing)
+
+
+def send_query_cache_event(filter_class, event, view=None, count=1):
+    server_timing = _get_server_timing(getattr(view, 'request', None))
+    if server_timing is not None:
+        server_timing.add_query_cache_event(event)
+
+    if query_cache_event.receivers and count:
+        query_cache_event.send(sender=filter_class, event=event, count=count, view=view)
+
+
+def _get_server_timing(request):
+    return getattr(request, 'rql_server_timing', None)
@@ -0,0 +1,195 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import atexit
+import json
+import os
+import tempfile
+from bisect import bisect_left
+from threading import Lock
+from time import monotonic
+
+from dj_rql.signals import Stages, stage_finished
+
+
+class UsageKinds:
+    FILTER = 'filter'
+    ORDERING = 'ordering'
+    SELECT = 'select'
+
+
+class UsageStats:
+    """In-memory aggregating collector of filters, lookups, ordering and select usage.
+
+    Usage is collected per filter class on query compilation and is counted for every filtered
+    request, including queries from caches. Latencies of the resulting DB queries (count and
+    page fetch of paginated requests) are aggregated into histograms.
+
+    Stats of each process are flushed into a JSON file of the `path` directory, they are merged
+    and reported by the `rql_usage_stats` command.
+    """
+
+    LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    """Upper bounds of latency histogram buckets in seconds, the last bucket is unbounded."""
+
+    LATENCY_STAGES = (Stages.COUNT, Stages.FETCH)
+
+    FILE_PREFIX = 'rql_usage_'
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.flush_interval = 60
+
+        self._lock = Lock()
+        self._stats = {}
+        self._last_flush = monotonic()
+
+    def enable(self, path=None, flush_interval=60):
+        """
+        :param str or None path: Directory for stats files, stats are kept only in memory,
+            if it's not set
+        :param float flush_interval: Min interval between flushes in seconds
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self._last_flush = monotonic()
+        self.enabled = True
+
+        stage_finished.connect(self.record_latency, weak=False, dispatch_uid='dj_rql_usage_stats')
+        if path:
+            atexit.register(self.flush)
+
+    def disable(self):
+        self.enabled = False
+
+        stage_finished.disconnect(dispatch_uid='dj_rql_usage_stats')
+        atexit.unregister(self.flush)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def record_usage(self, filter_class, usage):
+        """
+        Args:
+            filter_class (type): filter class.
+            usage (tuple): usage keys of the query, f.e. `('filter', 'title', 'eq')`.
+        """
+        with self._lock:
+            stats = self._get_filter_class_stats(filter_class)
+            stats['queries'] += 1
+            for key in usage:
+                self._get_usage_item(stats, key)['count'] += 1
+
+        self._flush_if_needed()
+
+    def record_latency(self, sender, stage, duration, request=None, **kwargs):
+        if stage not in self.LATENCY_STAGES:
+            return
+
+        filter_class, usage = getattr(request, 'rql_usage', (None, None))
+        if filter_class is None:
+            return
+
+        bucket = bisect_left(self.LATENCY_BUCKETS, duration)
+        with self._lock:
+            stats = self._get_filter_class_stats(filter_class)
+            self._add_latency(stats['latency'], bucket, duration)
+            for key in usage:
+                self._add_latency(self._get_usage_item(stats, key)['latency'], bucket, duration)
+
+    def dump(self):
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    def flush(self):
+        if not self.path:
+            return
+
+        stats = self.dump()
+        file_name = '{0}{1}.json'.format(self.FILE_PREFIX, os.getpid())
+
+        # Concurrent flushes (f.e. by request threads and `atexit`) write into different files
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_file_path = tempfile.mkstemp(prefix=file_name, suffix='.tmp', dir=self.path)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(stats, f)
+
+            os.replace(tmp_file_path, os.path.join(self.path, file_name))
+
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """Merged stats of all stats files in the directory."""
+        stats = {}
+        for file_name in sorted(os.listdir(path)):
+            if file_name.startswith(cls.FILE_PREFIX) and file_name.endswith('.json'):
+                with open(os.path.join(path, file_name)) as f:
+                    merge_usage_stats(stats, json.load(f))
+
+        return stats
+
+    def _flush_if_needed(self):
+        if self.path and monotonic() - self._last_flush >= self.flush_interval:
+            self._last_flush = monotonic()
+            self.flush()
+
+    def _get_filter_class_stats(self, filter_class):
+        qual_name = '{0}.{1}'.format(filter_class.__module__, filter_class.__qualname__)
+
+        stats = self._stats.get(qual_name)
+        if stats is None:
+            stats = self._stats[qual_name] = {
+                'queries': 0,
+                'latency': self._build_latency(),
+                UsageKinds.FILTER: {},
+                UsageKinds.ORDERING: {},
+                UsageKinds.SELECT: {},
+            }
+
+        return stats
+
+    def _get_usage_item(self, stats, key):
+        items = stats[key[0]]
+        for part in key[1:-1]:
+            items = items.setdefault(part, {})
+
+        item = items.get(key[-1])
+        if item is None:
+            item = items[key[-1]] = {'count': 0, 'latency': self._build_latency()}
+
+        return item
+
+    def _build_latency(self):
+        return {'count': 0, 'sum': 0.0, 'buckets': [0] * (len(self.LATENCY_BUCKETS) + 1)}
+
+    @staticmethod
+    def _add_latency(latency, bucket, duration):
+        latency['count'] += 1
+        latency['sum'] += duration
+        latency['buckets'][bucket] += 1
+
+
+def merge_usage_stats(stats, other_stats):
+    """Merge counters and histograms of `other_stats` into `stats`."""
+    for key, value in other_stats.items():
+        if isinstance(value, dict):
+            merge_usage_stats(stats.setdefault(key, {}), value)
+
+        elif isinstance(value, list):
+            current = stats.setdefault(key, [0] * len(value))
+            stats[key] = [a + b for a, b in zip(current, value)]
+
+        else:
+            stats[key] = stats.get(key, 0) + value
+
+    return stats
+
+
+usage_stats = UsageStats()
@@ -36,6 +36,7 @@ class RQLToDjangoORMTransformer(BaseRQLTransformer):
         self._ordering = []
         self._select = []
         self._filtered_props = set()
+        self._filter_q = None
 
         self._namespace = []
         self._active_namespace = 0
@@ -88,9 +89,18 @@ class RQLToDjangoORMTransformer(BaseRQLTransformer):
     def select_filters(self):
         return self._select
 
+    @property
+    def filter_q(self):
+        return self._filter_q
+
+    @property
+    def filtered_props(self):
+        return self._filtered_props
+
     def start(self, args):
         qs = self._filter_cls_instance.apply_annotations(self._filtered_props)
 
+        self._filter_q = args[0]
         return qs.filter(args[0])
 
     def comp(self, args):
@@ -13,6 +13,8 @@ def assert_filter_cls(filter_cls, filters, ordering_filters, search_filters):
         search_filters (set): filter_cls.search_filters
     """
     instance = filter_cls(filter_cls.MODEL._default_manager.none())
+    instance.compile_filters()
+
     _is_filter_subset(instance.filters, filters)
     assert instance.ordering_filters == ordering_filters, "Ordering filter data doesn't match."
     assert instance.search_filters == search_filters, "Searching filter data doesn't match."
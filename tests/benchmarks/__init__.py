@@ -0,0 +1,3 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
@@ -0,0 +1,188 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+"""Request path microbenchmarks of dj_rql on an in-memory SQLite database.
+
+Usage:
+    python -m tests.benchmarks -o results.json
+    python -m tests.benchmarks -k 'apply_filters.*' -k 'select.*'
+    python -m tests.benchmarks --compare baseline.json --threshold 1.25
+    python -m tests.benchmarks --memory --thresholds tests/benchmarks/memory_thresholds.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmarks', description=__doc__)
+    parser.add_argument(
+        '-k',
+        '--pattern',
+        action='append',
+        help='Shell-style pattern of benchmark names to run. All benchmarks are run by default.',
+    )
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Measurements per benchmark.')
+    parser.add_argument(
+        '-t',
+        '--min-time',
+        type=float,
+        default=0.02,
+        help='Min duration of a measurement in seconds.',
+    )
+    parser.add_argument('--rows', type=int, default=200, help='Number of objects per model.')
+    parser.add_argument('-o', '--output', help='Path to the JSON report.')
+    parser.add_argument('-l', '--label', help='Label of the report, f.e. a version.')
+    parser.add_argument('-c', '--compare', help='Path to the JSON report to compare with.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=1.25,
+        help='Max allowed ratio of current and baseline medians or sizes (default 1.25).',
+    )
+    parser.add_argument(
+        '-m',
+        '--memory',
+        action='store_true',
+        default=False,
+        help='Flag to run memory benchmarks instead of latency ones.',
+    )
+    parser.add_argument(
+        '--thresholds',
+        help=(
+            'Path to the JSON file with max ratios of sizes to the baseline size '
+            'by memory benchmark names.'
+        ),
+    )
+    parser.add_argument(
+        '--update-thresholds',
+        type=float,
+        metavar='MARGIN',
+        help='Write current ratios multiplied by the margin (f.e. 1.2) into the thresholds file.',
+    )
+    return parser.parse_args(args)
+
+
+def setup_django(rows):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.benchmarks.settings')
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+    from tests.benchmarks.suites import seed
+
+    seed(rows)
+
+
+def get_versions():
+    versions = {}
+    for package in ('django-rql', 'django', 'djangorestframework', 'lib-rql', 'lark-parser'):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+
+    return versions
+
+
+def run_latency_benchmarks(options):
+    from tests.benchmarks.runner import format_result, run
+    from tests.benchmarks.suites import get_benchmarks
+
+    return run(
+        get_benchmarks(),
+        repeat=options.repeat,
+        min_time=options.min_time,
+        patterns=options.pattern,
+        on_result=lambda name, result: print(format_result(name, result), file=sys.stderr),
+    )
+
+
+def run_memory_benchmarks(options):
+    from tests.benchmarks.memory import BASELINE, get_memory_benchmarks
+    from tests.benchmarks.runner import format_size, run_memory
+
+    # Thresholds are relative to the baseline, so it's measured with any patterns
+    patterns = options.pattern and options.pattern + [BASELINE.rsplit('.', 1)[0]]
+    return run_memory(
+        get_memory_benchmarks(),
+        patterns=patterns,
+        on_result=lambda name, result: print(
+            '{0:<60} {1:>12}'.format(name, format_size(result['bytes'])),
+            file=sys.stderr,
+        ),
+    )
+
+
+def check_memory_thresholds(options, report):
+    from tests.benchmarks.memory import BASELINE
+    from tests.benchmarks.runner import build_thresholds, check_thresholds
+
+    if options.update_thresholds:
+        thresholds = build_thresholds(report, BASELINE, options.update_thresholds)
+        with open(options.thresholds, 'w') as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+        return True
+
+    with open(options.thresholds) as f:
+        violations = check_thresholds(report, json.load(f), BASELINE)
+
+    for name, ratio, threshold in violations:
+        print(
+            '{0} exceeds the threshold: {1:.2f}x > {2:.2f}x of the baseline.'.format(
+                name,
+                ratio,
+                threshold,
+            ),
+        )
+
+    return not violations
+
+
+def main(args=None):
+    options = parse_args(args)
+    setup_django(options.rows)
+
+    from tests.benchmarks.runner import build_report, compare, format_comparison, format_size
+
+    if options.memory:
+        results = run_memory_benchmarks(options)
+    else:
+        results = run_latency_benchmarks(options)
+
+    report = build_report(results, label=options.label, versions=get_versions())
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    is_ok = True
+    if options.memory and options.thresholds:
+        is_ok = check_memory_thresholds(options, report)
+
+    if options.compare:
+        with open(options.compare) as f:
+            rows = compare(
+                json.load(f),
+                report,
+                threshold=options.threshold,
+                metric='bytes' if options.memory else 'median',
+            )
+
+        print(format_comparison(rows, formatter=format_size if options.memory else None))
+        is_ok = is_ok and not any(row[-1] == 'regression' for row in rows)
+
+    return 0 if is_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+"""Representative RQL queries, select expressions and filters of benchmarked filter classes."""
+
+from py_rql.constants import ComparisonOperators, ListOperators, SearchOperators
+
+
+QUERIES = {
+    'books': {
+        'empty': '',
+        'eq': 'title=abc',
+        'logical': (
+            'and(or(eq(title,a),eq(title,b)),ge(current_price,10),not(eq(written,2020-01-01)))'
+        ),
+        'list': 'in(id,({0}))'.format(','.join(str(i) for i in range(50))),
+        'search': 'search=abc',
+        'namespace': 'eq(author.email,a@example.com)&eq(author.publisher.id,1)',
+        'ordering': 'ge(published.at,2020-01-01T00:00Z)&ordering(-published.at)',
+        'select': 'select(author,-page)&limit=10',
+    },
+    'wide': {
+        'many_filters': '&'.join(
+            'eq(int_{0},{0})&eq(str_{0},value_{0})'.format(i) for i in range(10)
+        ),
+        'like': 'like(str_0,*abc*)&ilike(str_1,abc*)',
+        'search': 'search=abc',
+        'ordering': 'ordering(-int_0,str_1,dt_2)',
+        'select': 'select(-str_0,-int_0,-dec_0)',
+    },
+    'deep': {
+        'nested': 'eq(parent.parent.parent.parent.name,x)',
+        'nested_or': 'or(eq(parent.value,1),eq(parent.parent.value,2))',
+        'ordering': 'ordering(-parent.parent.value)',
+        'select': 'select(parent.parent.parent.parent)',
+    },
+    'tree': {
+        'nested': 'eq(children.children.children.children.name,x)',
+        'select': 'select(children.children.children.children)',
+    },
+}
+
+SELECTS = {
+    'books': {
+        'default': (),
+        'include': ('author', 'author.publisher', 'page'),
+        'exclude': ('-page', '-title'),
+    },
+    'wide': {
+        'default': (),
+        'exclude': ('-str_0', '-int_0', '-dec_0'),
+    },
+    'deep': {
+        'default': (),
+        'include': ('parent.parent.parent.parent',),
+    },
+    'tree': {
+        'default': (),
+        'include': ('children.children.children.children',),
+    },
+}
+
+FILTERS = {
+    'books': {
+        'eq': ('title', ComparisonOperators.EQ, 'abc'),
+        'decimal': ('current_price', ComparisonOperators.GE, '10.5'),
+        'datetime': ('published.at', ComparisonOperators.GE, '2020-01-01T00:00Z'),
+        'namespace': ('author.email', ComparisonOperators.EQ, 'a@example.com'),
+        'in': ('id', ComparisonOperators.EQ, '1', ListOperators.IN),
+        'ilike': ('title', SearchOperators.I_LIKE, '*abc*'),
+        'null': ('title', ComparisonOperators.EQ, 'null()'),
+    },
+    'deep': {
+        'deep_namespace': ('parent.parent.parent.parent.name', ComparisonOperators.EQ, 'x'),
+    },
+}
+
+REQUESTS = {
+    'books': {
+        'list': '/select/?limit=25',
+        'filtered': '/select/?ge(current_price,10)&ordering(-published.at)&limit=25',
+        'select': '/select/?select(author,-page)&limit=25',
+    },
+}
@@ -0,0 +1,32 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from dj_rql.filter_cls import AutoRQLFilterClass, NestedAutoRQLFilterClass
+from tests.benchmarks.models import DEEP_MODEL_LEVELS, DeepLeaf, DeepRoot, GraphRoot, WideModel
+
+
+class WideFilterClass(AutoRQLFilterClass):
+    MODEL = WideModel
+    SELECT = True
+
+
+class DeepFilterClass(NestedAutoRQLFilterClass):
+    """To-one relations of all levels."""
+
+    MODEL = DeepLeaf
+    DEPTH = DEEP_MODEL_LEVELS - 1
+
+
+class TreeFilterClass(NestedAutoRQLFilterClass):
+    """To-many relations of all levels."""
+
+    MODEL = DeepRoot
+    DEPTH = DEEP_MODEL_LEVELS - 1
+
+
+class GraphFilterClass(NestedAutoRQLFilterClass):
+    """Several relation paths to the same models on each level."""
+
+    MODEL = GraphRoot
+    DEPTH = 4
@@ -0,0 +1,143 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+"""Memory benchmarks of filter classes, requests and cache entries, that are based on tracemalloc.
+
+Each benchmark returns a dict of named sizes in bytes:
+
+* `retained` - size of memory, that is retained by the result of a call (f.e. a filter class
+  instance or a filtered queryset, that is stored in a queries cache);
+* `peak` - peak size of memory, that is allocated during a call;
+* `filters`, `select_tree`, `annotations` - deep sizes of filter class schema parts;
+* `estimate` - size of a cache entry, estimated by the `MemoryBoundedCache`;
+* `plan_pickle` - size of a pickled query plan, that is stored by the `QueryPlansCache`.
+
+Sizes of Python and Django objects differ between versions, so thresholds are ratios of sizes
+to the `BASELINE` size of a plain Django queryset, that is measured in the same run.
+"""
+
+import pickle
+
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from dj_rql._dataclasses import FilterArgs
+from dj_rql.cache import MemoryBoundedCache
+from dj_rql.filter_cls import NestedAutoRQLFilterClass
+from tests.benchmarks.corpus import QUERIES, REQUESTS
+from tests.benchmarks.filters import DeepFilterClass, TreeFilterClass
+from tests.benchmarks.models import DEEP_MODEL_LEVELS
+from tests.benchmarks.runner import deep_getsizeof, measure_allocations
+from tests.benchmarks.suites import (
+    FILTER_CLASSES,
+    _apply_filters,
+    _serialize,
+    _with_depth,
+    get_querysets,
+)
+from tests.dj_rf.filters import SelectBooksFilterClass
+from tests.dj_rf.models import AutoMain, Book
+
+
+FILTER_ARGS_LOOPS = 1000
+
+BASELINE = 'baseline.queryset.peak'
+"""Name of the size, that thresholds are relative to."""
+
+
+def get_memory_benchmarks():
+    """Pairs of names and functions, that return named sizes in bytes."""
+    querysets = get_querysets()
+    benchmarks = [('baseline.queryset', _bind(_measure_call, _build_baseline_queryset))]
+
+    filter_classes = dict(FILTER_CLASSES)
+    for depth in range(DEEP_MODEL_LEVELS):
+        for key, filter_class in (('deep', DeepFilterClass), ('tree', TreeFilterClass)):
+            filter_classes['{0}_depth_{1}'.format(key, depth)] = _with_depth(filter_class, depth)
+            querysets['{0}_depth_{1}'.format(key, depth)] = querysets[key]
+
+    for depth in range(4):
+        key = 'auto_depth_{0}'.format(depth)
+        filter_classes[key] = _with_depth(NestedAutoRQLFilterClass, depth, model=AutoMain)
+        querysets[key] = AutoMain.objects.all()
+
+    for key, filter_class in filter_classes.items():
+        benchmarks.append(
+            ('init.{0}'.format(key), _bind(_measure_filter_class, filter_class, querysets[key])),
+        )
+
+    for key, queries in QUERIES.items():
+        instance = FILTER_CLASSES[key](querysets[key])
+        for name, query in queries.items():
+            benchmarks.append(
+                (
+                    'apply_filters.{0}.{1}'.format(key, name),
+                    _bind(_measure_apply_filters, instance, querysets[key], query),
+                ),
+            )
+
+    benchmarks.append(('filter_args', _measure_filter_args))
+    benchmarks.extend(_get_response_benchmarks(querysets['books']))
+    return benchmarks
+
+
+def _get_response_benchmarks(queryset):
+    request_factory = APIRequestFactory()
+    instance = SelectBooksFilterClass(queryset)
+
+    for name, query in (('default', ''), ('select', 'select(author,-page)')):
+        request = Request(request_factory.get('/?' + query))
+        _, filtered_queryset = _apply_filters(instance, queryset, query)
+        request.rql_select = filtered_queryset.select_data
+        page = list(filtered_queryset[:25])
+
+        yield (
+            'serialization.books.{0}'.format(name),
+            _bind(_measure_call, _serialize, page, request),
+        )
+
+    client = APIClient()
+    for name, path in REQUESTS['books'].items():
+        yield 'request.books.{0}'.format(name), _bind(_measure_call, client.get, path)
+
+
+def _bind(func, *args):
+    return lambda: func(*args)
+
+
+def _measure_call(func, *args):
+    # The first call fills lazy caches, so the steady state is measured
+    func(*args)
+    return {'peak': measure_allocations(lambda: func(*args))['peak']}
+
+
+def _build_baseline_queryset():
+    return Book.objects.filter(title='title', author__email='email').order_by('-id')
+
+
+def _measure_filter_class(filter_class, queryset):
+    filter_class(queryset)
+    sizes = measure_allocations(lambda: filter_class(queryset))
+
+    instance = filter_class(queryset)
+    seen = set()
+    for attr in ('filters', 'select_tree', 'annotations'):
+        sizes[attr] = deep_getsizeof(getattr(instance, attr), seen)
+
+    return sizes
+
+
+def _measure_apply_filters(instance, queryset, query):
+    result = _apply_filters(instance, queryset, query)
+    sizes = measure_allocations(lambda: _apply_filters(instance, queryset, query))
+    sizes['estimate'] = MemoryBoundedCache(0).getsizeof(result)
+    sizes['plan_pickle'] = len(pickle.dumps(instance.query_plan))
+    return sizes
+
+
+def _measure_filter_args():
+    return measure_allocations(
+        lambda: FilterArgs('author.email', 'eq', 'a@example.com', namespace=['author']),
+        loops=FILTER_ARGS_LOOPS,
+    )
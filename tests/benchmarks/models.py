@@ -0,0 +1,95 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from django.db import models
+
+
+WIDE_MODEL_FIELDS_PER_TYPE = 10
+DEEP_MODEL_LEVELS = 5
+
+
+def _build_wide_model_fields():
+    fields = {}
+    for i in range(WIDE_MODEL_FIELDS_PER_TYPE):
+        fields['int_{0}'.format(i)] = models.IntegerField(default=0)
+        fields['str_{0}'.format(i)] = models.CharField(max_length=64, default='')
+        fields['dec_{0}'.format(i)] = models.DecimalField(
+            default=0,
+            decimal_places=2,
+            max_digits=12,
+        )
+        fields['dt_{0}'.format(i)] = models.DateTimeField(null=True)
+        fields['bool_{0}'.format(i)] = models.BooleanField(default=False)
+
+    return fields
+
+
+WideModel = type(
+    'WideModel',
+    (models.Model,),
+    {'__module__': __name__, **_build_wide_model_fields()},
+)
+
+
+def _build_deep_model(level, parent_model):
+    attrs = {
+        '__module__': __name__,
+        'name': models.CharField(max_length=64, default=''),
+        'value': models.IntegerField(default=0),
+    }
+    if parent_model is not None:
+        attrs['parent'] = models.ForeignKey(
+            parent_model,
+            related_name='children',
+            on_delete=models.CASCADE,
+            null=True,
+        )
+
+    return type('DeepLevel{0}'.format(level), (models.Model,), attrs)
+
+
+def _build_deep_models():
+    deep_models = []
+    parent_model = None
+    for level in range(DEEP_MODEL_LEVELS):
+        parent_model = _build_deep_model(level, parent_model)
+        deep_models.append(parent_model)
+
+    return deep_models
+
+
+DEEP_MODELS = _build_deep_models()
+"""Chain of models, each level has the `parent` relation to the previous one."""
+
+DeepRoot, DeepLeaf = DEEP_MODELS[0], DEEP_MODELS[-1]
+
+
+GRAPH_MODELS_COUNT = 6
+
+
+def _build_graph_models():
+    graph_models = []
+    for index in range(GRAPH_MODELS_COUNT):
+        attrs = {
+            '__module__': __name__,
+            'name': models.CharField(max_length=64, default=''),
+            'value': models.IntegerField(default=0),
+        }
+        for offset in (1, 2):
+            attrs['next{0}'.format(offset)] = models.ForeignKey(
+                'GraphNode{0}'.format((index + offset) % GRAPH_MODELS_COUNT),
+                related_name='previous{0}'.format(offset),
+                on_delete=models.CASCADE,
+                null=True,
+            )
+
+        graph_models.append(type('GraphNode{0}'.format(index), (models.Model,), attrs))
+
+    return graph_models
+
+
+GRAPH_MODELS = _build_graph_models()
+"""Cycle of models, where each model is reached via several paths of relations."""
+
+GraphRoot = GRAPH_MODELS[0]
@@ -0,0 +1,262 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import gc
+import platform
+import sys
+import tracemalloc
+from fnmatch import fnmatch
+from statistics import mean, median
+from time import perf_counter
+from types import FunctionType, ModuleType
+
+from django.db.models import Field, ForeignObjectRel, Model, QuerySet
+
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, Field, ForeignObjectRel, Model, QuerySet)
+
+
+def measure(func, repeat=5, min_time=0.02):
+    """
+    Measure the duration of a single call of the function.
+
+    The number of loops is doubled, until a loop batch takes at least `min_time` seconds.
+
+    Returns:
+        dict: number of loops and repeats, min, median and mean durations in seconds.
+    """
+    loops = 1
+    while True:
+        duration = _time_loops(func, loops)
+        if duration >= min_time:
+            break
+
+        loops *= 2
+
+    timings = [duration / loops] + [_time_loops(func, loops) / loops for _ in range(repeat - 1)]
+    return {
+        'loops': loops,
+        'repeat': repeat,
+        'min': min(timings),
+        'median': median(timings),
+        'mean': mean(timings),
+    }
+
+
+def run(benchmarks, repeat=5, min_time=0.02, patterns=None, on_result=None):
+    """
+    Args:
+        benchmarks (list): pairs of benchmark names and functions without arguments.
+        repeat (int): number of measurements for each benchmark.
+        min_time (float): min duration of a measurement in seconds.
+        patterns (list or None): shell-style patterns of names of benchmarks to run.
+        on_result (callable or None): callback, that is called with each name and result.
+
+    Returns:
+        dict: results by benchmark names.
+    """
+    results = {}
+    for name, func in benchmarks:
+        if patterns and not any(fnmatch(name, pattern) for pattern in patterns):
+            continue
+
+        results[name] = measure(func, repeat=repeat, min_time=min_time)
+        if on_result:
+            on_result(name, results[name])
+
+    return results
+
+
+def measure_allocations(func, loops=1):
+    """
+    Returns:
+        dict: retained and peak traced sizes per call in bytes.
+    """
+    gc.collect()
+    tracemalloc.clear_traces()
+
+    results = [func() for _ in range(loops)]
+
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    del results
+
+    return {'retained': retained // loops, 'peak': peak // loops}
+
+
+def deep_getsizeof(obj, seen):
+    """
+    Size of the object and all objects, that are referenced by it, excluding objects in `seen`.
+
+    Classes, functions, models, model fields and querysets are shared, so they are not counted.
+    """
+    size = 0
+    objects = [obj]
+    while objects:
+        obj = objects.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            objects.extend(obj.keys())
+            objects.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            objects.extend(obj)
+        else:
+            if hasattr(obj, '__dict__'):
+                objects.append(obj.__dict__)
+
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    if hasattr(obj, slot):
+                        objects.append(getattr(obj, slot))
+
+    return size
+
+
+def run_memory(benchmarks, patterns=None, on_result=None):
+    """
+    Returns:
+        dict: results by benchmark names with size names, f.e. `init.books.retained`.
+    """
+    results = {}
+    tracemalloc.start()
+    try:
+        for name, func in benchmarks:
+            if patterns and not any(fnmatch(name, pattern) for pattern in patterns):
+                continue
+
+            for size_name, size in func().items():
+                result_name = '{0}.{1}'.format(name, size_name)
+                results[result_name] = {'bytes': size}
+                if on_result:
+                    on_result(result_name, results[result_name])
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def build_report(results, label=None, versions=None):
+    return {
+        'meta': {
+            'label': label,
+            'python': platform.python_version(),
+            **(versions or {}),
+        },
+        'benchmarks': results,
+    }
+
+
+def compare(baseline, current, threshold=1.25, metric='median'):
+    """
+    Compare metrics (median durations by default) of benchmarks, that are present in both reports.
+
+    Returns:
+        list: rows of names, baseline and current metrics, ratios and statuses.
+    """
+    rows = []
+    baseline_results = baseline['benchmarks']
+    for name, result in current['benchmarks'].items():
+        baseline_result = baseline_results.get(name)
+        if baseline_result is None:
+            continue
+
+        ratio = result[metric] / baseline_result[metric] if baseline_result[metric] else 1.0
+        if ratio > threshold:
+            status = 'regression'
+        elif ratio < 1 / threshold:
+            status = 'improvement'
+        else:
+            status = 'same'
+
+        rows.append((name, baseline_result[metric], result[metric], ratio, status))
+
+    return rows
+
+
+def build_thresholds(report, baseline_name, margin, metric='bytes'):
+    """
+    Returns:
+        dict: ratios of metrics to the baseline metric, that are multiplied by the margin.
+    """
+    results = report['benchmarks']
+    baseline = results[baseline_name][metric]
+    return {
+        name: round(result[metric] * margin / baseline, 4)
+        for name, result in results.items()
+        if name != baseline_name
+    }
+
+
+def check_thresholds(report, thresholds, baseline_name, metric='bytes'):
+    """
+    Thresholds are max ratios of metrics to the metric of the baseline benchmark of the report.
+
+    Returns:
+        list: names, ratios and thresholds of benchmarks, that exceed their thresholds.
+    """
+    results = report['benchmarks']
+    baseline = results[baseline_name][metric]
+
+    violations = []
+    for name, result in results.items():
+        if name in thresholds and result[metric] / baseline > thresholds[name]:
+            violations.append((name, result[metric] / baseline, thresholds[name]))
+
+    return violations
+
+
+def format_result(name, result):
+    return '{0:<60} {1:>12} (min {2}, {3} loops x {4})'.format(
+        name,
+        format_duration(result['median']),
+        format_duration(result['min']),
+        result['loops'],
+        result['repeat'],
+    )
+
+
+def format_comparison(rows, formatter=None):
+    formatter = formatter or format_duration
+    lines = ['{0:<60} {1:>12} {2:>12} {3:>8}'.format('benchmark', 'baseline', 'current', 'ratio')]
+    for name, baseline_value, current_value, ratio, status in rows:
+        lines.append(
+            '{0:<60} {1:>12} {2:>12} {3:>7.2f}x{4}'.format(
+                name,
+                formatter(baseline_value),
+                formatter(current_value),
+                ratio,
+                '' if status == 'same' else ' ' + status,
+            ),
+        )
+
+    return '\n'.join(lines)
+
+
+def format_duration(duration):
+    for unit, scale in (('s', 1), ('ms', 1e3)):
+        if duration >= 1 / scale:
+            return '{0:.2f} {1}'.format(duration * scale, unit)
+
+    return '{0:.2f} us'.format(duration * 1e6)
+
+
+def format_size(size):
+    for unit, scale in (('MiB', 1024 * 1024), ('KiB', 1024)):
+        if abs(size) >= scale:
+            return '{0:.2f} {1}'.format(size / scale, unit)
+
+    return '{0} B'.format(size)
+
+
+def _time_loops(func, loops):
+    start = perf_counter()
+    for _ in range(loops):
+        func()
+
+    return perf_counter() - start
@@ -0,0 +1,19 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from tests.dj_rf.settings import *  # noqa: F401,F403
+from tests.dj_rf.settings import INSTALLED_APPS
+
+
+DEBUG = False
+
+INSTALLED_APPS = INSTALLED_APPS + ['tests.benchmarks']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
+ALLOWED_HOSTS = ['testserver']
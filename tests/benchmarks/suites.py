@@ -0,0 +1,241 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from py_rql.parser import RQLParser
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from dj_rql._dataclasses import FilterArgs
+from dj_rql.drf.paginations import RQLLimitOffsetPagination
+from dj_rql.transformer import RQLToDjangoORMTransformer
+from tests.benchmarks.corpus import FILTERS, QUERIES, REQUESTS, SELECTS
+from tests.benchmarks.filters import (
+    DeepFilterClass,
+    GraphFilterClass,
+    TreeFilterClass,
+    WideFilterClass,
+)
+from tests.benchmarks.models import (
+    DEEP_MODELS,
+    WIDE_MODEL_FIELDS_PER_TYPE,
+    DeepLeaf,
+    DeepRoot,
+    GraphRoot,
+    WideModel,
+)
+from tests.dj_rf.filters import SelectBooksFilterClass
+from tests.dj_rf.models import Author, Book, Page, Publisher
+from tests.dj_rf.serializers import SelectBookSerializer
+from tests.dj_rf.view import SelectViewSet
+
+
+FILTER_CLASSES = {
+    'books': SelectBooksFilterClass,
+    'wide': WideFilterClass,
+    'deep': DeepFilterClass,
+    'tree': TreeFilterClass,
+}
+
+
+def get_querysets():
+    return {
+        'books': SelectViewSet.queryset,
+        'wide': WideModel.objects.all(),
+        'deep': DeepLeaf.objects.all(),
+        'tree': DeepRoot.objects.all(),
+    }
+
+
+def seed(rows=200):
+    """Fill the database with `rows` objects of each benchmarked model."""
+    publishers = Publisher.objects.bulk_create(
+        [Publisher(name='publisher_{0}'.format(i)) for i in range(5)],
+    )
+    authors = Author.objects.bulk_create(
+        [
+            Author(
+                name='author_{0}'.format(i),
+                email='author_{0}@example.com'.format(i),
+                publisher=publishers[i % len(publishers)],
+            )
+            for i in range(20)
+        ],
+    )
+
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    books = Book.objects.bulk_create(
+        [
+            Book(
+                title='book_{0}'.format(i),
+                current_price=Decimal(i),
+                written=date(2020, 1, 1) + timedelta(days=i),
+                published_at=start + timedelta(hours=i),
+                author=authors[i % len(authors)],
+            )
+            for i in range(rows)
+        ],
+    )
+    Page.objects.bulk_create(
+        [Page(book=book, number=number) for book in books for number in range(2)],
+    )
+
+    wide_fields = range(WIDE_MODEL_FIELDS_PER_TYPE)
+    WideModel.objects.bulk_create(
+        [
+            WideModel(
+                **{'int_{0}'.format(f): i for f in wide_fields},
+                **{'str_{0}'.format(f): 'value_{0}'.format(i) for f in wide_fields},
+            )
+            for i in range(rows)
+        ],
+    )
+
+    parents = [None] * rows
+    for model in DEEP_MODELS:
+        parents = model.objects.bulk_create(
+            [
+                model(
+                    name='{0}_{1}'.format(model.__name__, i),
+                    value=i,
+                    **({'parent': parents[i]} if parents[i] else {}),
+                )
+                for i in range(rows)
+            ],
+        )
+
+
+def get_benchmarks():
+    """Pairs of names and functions of request path stages for the query corpus."""
+    querysets = get_querysets()
+    benchmarks = []
+
+    for key, filter_class in FILTER_CLASSES.items():
+        queryset = querysets[key]
+        instance = filter_class(queryset)
+
+        benchmarks.append(('init.{0}'.format(key), _bind(filter_class, queryset)))
+        benchmarks.extend(_get_query_benchmarks(key, instance, queryset))
+        benchmarks.extend(_get_filter_benchmarks(key, instance))
+        benchmarks.extend(_get_select_benchmarks(key, instance, queryset))
+
+    benchmarks.extend(_get_init_benchmarks())
+    benchmarks.extend(_get_response_benchmarks(querysets['books']))
+    return benchmarks
+
+
+def _get_init_benchmarks():
+    # Construction of nested auto filter classes, where related models are reached
+    #  via several paths, so the number of filters grows exponentially with the depth
+    queryset = GraphRoot.objects.all()
+    for depth in range(1, GraphFilterClass.DEPTH + 1):
+        filter_class = _with_depth(GraphFilterClass, depth)
+        yield 'init.graph_depth_{0}'.format(depth), _bind(filter_class, queryset)
+
+
+def _get_query_benchmarks(key, instance, queryset):
+    for name, query in QUERIES[key].items():
+        suffix = '{0}.{1}'.format(key, name)
+
+        if query:
+            rql_ast = RQLParser.parse(query)
+            yield 'parse.' + suffix, _bind(RQLParser.parse, query)
+            yield 'transform.' + suffix, _bind(_transform, instance, queryset, rql_ast)
+
+        yield 'apply_filters.' + suffix, _bind(_apply_filters, instance, queryset, query)
+
+
+def _get_filter_benchmarks(key, instance):
+    for name, args in FILTERS.get(key, {}).items():
+        filter_name, operator, str_value = args[:3]
+        list_operator = args[3] if len(args) > 3 else None
+
+        instance.compile_filters({filter_name})
+        yield 'build_q.{0}.{1}'.format(key, name), _bind(
+            _build_q,
+            instance,
+            filter_name,
+            operator,
+            str_value,
+            list_operator,
+        )
+
+
+def _get_select_benchmarks(key, instance, queryset):
+    for name, select in SELECTS[key].items():
+        suffix = '{0}.{1}'.format(key, name)
+        instance._compile_select_namespaces(select)
+        select_data, optimization_steps = instance._get_select_plan(select)
+
+        yield 'select.' + suffix, _bind(_resolve_select, instance, select)
+        yield 'select_cached.' + suffix, _bind(instance._get_select_plan, select)
+        yield 'optimizations.' + suffix, _bind(
+            instance._apply_optimization_steps,
+            queryset,
+            select_data,
+            optimization_steps,
+        )
+
+
+def _get_response_benchmarks(queryset):
+    request_factory = APIRequestFactory()
+    instance = SelectBooksFilterClass(queryset)
+
+    for name, query in (('default', ''), ('select', 'select(author,-page)')):
+        query = '&'.join(filter(None, ('limit=25&offset=50', query)))
+        request = Request(request_factory.get('/?' + query))
+        request.rql_ast, filtered_queryset = _apply_filters(instance, queryset, query)
+        request.rql_select = filtered_queryset.select_data
+        page = list(filtered_queryset[:25])
+
+        yield 'pagination.books.{0}'.format(name), _bind(_paginate, filtered_queryset, request)
+        yield 'serialization.books.{0}'.format(name), _bind(_serialize, page, request)
+
+    client = APIClient()
+    for name, path in REQUESTS['books'].items():
+        yield 'request.books.{0}'.format(name), _bind(client.get, path)
+
+
+def _bind(func, *args):
+    return lambda: func(*args)
+
+
+def _with_depth(filter_class, depth, model=None):
+    return type(
+        '{0}Depth{1}'.format(filter_class.__name__, depth),
+        (filter_class,),
+        {'DEPTH': depth, 'MODEL': model or filter_class.MODEL},
+    )
+
+
+def _transform(instance, queryset, rql_ast):
+    instance.queryset = queryset
+    return RQLToDjangoORMTransformer(instance).transform(rql_ast)
+
+
+def _apply_filters(instance, queryset, query):
+    # Filtered queryset is stored in the instance, so it's reset for every call
+    instance.queryset = queryset
+    return instance.apply_filters(query)
+
+
+def _build_q(instance, filter_name, operator, str_value, list_operator):
+    return instance.build_q_for_filter(
+        FilterArgs(filter_name, operator, str_value, list_operator=list_operator),
+    )
+
+
+def _resolve_select(instance, select):
+    select_data = instance._build_select_data(select)
+    return select_data, instance._get_optimization_steps(select_data)
+
+
+def _paginate(queryset, request):
+    return RQLLimitOffsetPagination().paginate_queryset(queryset.all(), request)
+
+
+def _serialize(page, request):
+    return SelectBookSerializer(page, many=True, context={'request': request}).data
@@ -20,7 +20,7 @@ from dj_rql.qs import (
     PR,
     SR,
 )
-from tests.dj_rf.models import Book
+from tests.dj_rf.models import Book, IndexedItem
 
 
 AUTHOR_FILTERS = [
@@ -260,3 +260,46 @@ class SelectDetailedBooksFilterClass(SelectBooksFilterClass):
         return result
 
     FILTERS = __make_filters()
+
+
+class IndexedItemFilterClass(RQLFilterClass):
+    MODEL = IndexedItem
+    FILTERS = [
+        'id',
+        {
+            'filter': 'name',
+            'ordering': True,
+            'search': True,
+        },
+        {
+            'filter': 'code',
+            'lookups': {FilterLookups.EQ, FilterLookups.IN},
+        },
+        {
+            'filter': 'description',
+            'lookups': {FilterLookups.LIKE},
+        },
+        {
+            'filter': 'rating',
+            'ordering': True,
+        },
+        {
+            'filter': 'created_at',
+            'ordering': True,
+        },
+        {
+            'namespace': 'publisher',
+            'filters': [
+                {
+                    'filter': 'name',
+                    'lookups': {FilterLookups.EQ, FilterLookups.LIKE},
+                },
+            ],
+        },
+    ]
+    EXTENDED_SEARCH_ORM_ROUTES = ('publisher__name',)
+    ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY = {
+        ('-created_at', 'rating'),
+        ('rating', 'name'),
+        ('name',),
+    }
@@ -138,3 +138,23 @@ class Through(models.Model):
     auto = models.ForeignKey(AutoMain, on_delete=models.CASCADE)
     mtm = models.ForeignKey(ReverseManyToManyTroughRelated, on_delete=models.CASCADE)
     common_int = models.IntegerField(default=0)
+
+
+class IndexedItem(models.Model):
+    name = models.CharField(max_length=20, db_index=True)
+    code = models.CharField(max_length=20, unique=True)
+    description = models.TextField(null=True)
+    rating = models.IntegerField(null=True)
+    created_at = models.DateTimeField(null=True)
+
+    publisher = models.ForeignKey(Publisher, on_delete=models.CASCADE, null=True, related_name='+')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', 'rating'], name='indexed_item_created_idx'),
+            models.Index(
+                fields=['description'],
+                name='indexed_item_descr_pat',
+                opclasses=['text_pattern_ops'],
+            ),
+        ]
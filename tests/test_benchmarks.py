@@ -0,0 +1,194 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import sys
+import tracemalloc
+
+from dj_rql._dataclasses import FilterItem
+from tests.benchmarks.runner import (
+    build_report,
+    build_thresholds,
+    check_thresholds,
+    compare,
+    deep_getsizeof,
+    format_comparison,
+    format_duration,
+    format_result,
+    format_size,
+    measure,
+    measure_allocations,
+    run,
+    run_memory,
+)
+from tests.dj_rf.models import Book
+
+
+def test_measure():
+    calls = []
+    result = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+    assert result['repeat'] == 3
+    assert result['loops'] >= 1
+    assert len(calls) >= result['loops'] * 3
+    assert 0 < result['min'] <= result['median']
+    assert result['mean'] > 0
+
+
+def test_run_patterns():
+    calls = []
+    benchmarks = [
+        ('parse.books.eq', lambda: None),
+        ('parse.wide.eq', lambda: None),
+        ('select.books.default', lambda: None),
+    ]
+
+    results = run(
+        benchmarks,
+        repeat=1,
+        min_time=0,
+        patterns=['parse.*', '*.default'],
+        on_result=lambda name, result: calls.append(name),
+    )
+
+    assert calls == ['parse.books.eq', 'parse.wide.eq', 'select.books.default']
+    assert list(results) == calls
+
+
+def test_build_report():
+    report = build_report({'a': {}}, label='v1', versions={'django': '4.2'})
+
+    assert report['benchmarks'] == {'a': {}}
+    assert report['meta']['label'] == 'v1'
+    assert report['meta']['django'] == '4.2'
+    assert report['meta']['python']
+
+
+def test_compare():
+    baseline = build_report({'a': {'median': 1.0}, 'b': {'median': 1.0}, 'c': {'median': 1.0}})
+    current = build_report(
+        {'a': {'median': 1.1}, 'b': {'median': 2.0}, 'c': {'median': 0.5}, 'd': {'median': 1}},
+    )
+
+    assert compare(baseline, current, threshold=1.25) == [
+        ('a', 1.0, 1.1, 1.1, 'same'),
+        ('b', 1.0, 2.0, 2.0, 'regression'),
+        ('c', 1.0, 0.5, 0.5, 'improvement'),
+    ]
+
+
+def test_compare_metric():
+    baseline = build_report({'a': {'bytes': 100}, 'b': {'bytes': 0}})
+    current = build_report({'a': {'bytes': 200}, 'b': {'bytes': 10}})
+
+    assert compare(baseline, current, metric='bytes') == [
+        ('a', 100, 200, 2.0, 'regression'),
+        ('b', 0, 10, 1.0, 'same'),
+    ]
+
+
+def test_check_thresholds():
+    report = build_report(
+        {'base': {'bytes': 100}, 'a': {'bytes': 100}, 'b': {'bytes': 200}, 'c': {'bytes': 300}},
+    )
+
+    assert check_thresholds(report, {'a': 1, 'b': 1.5}, 'base') == [('b', 2.0, 1.5)]
+
+
+def test_build_thresholds():
+    report = build_report({'base': {'bytes': 200}, 'a': {'bytes': 100}, 'b': {'bytes': 300}})
+    thresholds = build_thresholds(report, 'base', 1.2)
+
+    assert thresholds == {'a': 0.6, 'b': 1.8}
+    assert check_thresholds(report, thresholds, 'base') == []
+
+
+def test_measure_allocations():
+    tracemalloc.start()
+    try:
+        sizes = measure_allocations(lambda: bytearray(100000))
+        loop_sizes = measure_allocations(lambda: bytearray(1000), loops=10)
+    finally:
+        tracemalloc.stop()
+
+    assert 100000 <= sizes['retained'] <= sizes['peak'] < 110000
+    assert 1000 <= loop_sizes['retained'] < 1200
+
+
+def test_run_memory():
+    calls = []
+    results = run_memory(
+        [('a', lambda: {'retained': 1, 'peak': 2}), ('b', lambda: {'peak': 3})],
+        patterns=['a'],
+        on_result=lambda name, result: calls.append(name),
+    )
+
+    assert results == {'a.retained': {'bytes': 1}, 'a.peak': {'bytes': 2}}
+    assert calls == ['a.retained', 'a.peak']
+    assert not tracemalloc.is_tracing()
+
+
+def test_deep_getsizeof():
+    field = Book._meta.get_field('title')
+    shared = ['shared']
+    item = FilterItem(
+        field=field,
+        orm_route='title',
+        lookups=frozenset({'eq'}),
+        null_values=frozenset(),
+        distinct=False,
+        hidden=False,
+    )
+
+    seen = set()
+    size = deep_getsizeof({'a': item, 'b': shared, 'c': Book}, seen)
+    assert size > sys.getsizeof({}) + sys.getsizeof(item) + sys.getsizeof(shared)
+    assert id(field) not in seen
+    assert id(Book) not in seen
+
+    assert deep_getsizeof(shared, seen) == 0
+    assert deep_getsizeof([shared], seen) == sys.getsizeof([shared])
+
+
+def test_format_comparison():
+    lines = format_comparison([('a', 1.0, 2.0, 2.0, 'regression'), ('b', 1.0, 1.0, 1.0, 'same')])
+    lines = lines.splitlines()
+
+    assert lines[0].split() == ['benchmark', 'baseline', 'current', 'ratio']
+    assert lines[1].split() == ['a', '1.00', 's', '2.00', 's', '2.00x', 'regression']
+    assert lines[2].split() == ['b', '1.00', 's', '1.00', 's', '1.00x']
+
+
+def test_format_result():
+    result = {'median': 0.002, 'min': 0.0000015, 'loops': 8, 'repeat': 5}
+
+    assert format_result('a', result).split() == [
+        'a',
+        '2.00',
+        'ms',
+        '(min',
+        '1.50',
+        'us,',
+        '8',
+        'loops',
+        'x',
+        '5)',
+    ]
+
+
+def test_format_comparison_sizes():
+    lines = format_comparison([('a', 512, 2048, 4.0, 'regression')], formatter=format_size)
+
+    assert lines.splitlines()[1].split() == ['a', '512', 'B', '2.00', 'KiB', '4.00x', 'regression']
+
+
+def test_format_size():
+    assert format_size(3 * 1024 * 1024) == '3.00 MiB'
+    assert format_size(1536) == '1.50 KiB'
+    assert format_size(100) == '100 B'
+
+
+def test_format_duration():
+    assert format_duration(1.5) == '1.50 s'
+    assert format_duration(0.0015) == '1.50 ms'
+    assert format_duration(0.0000015) == '1.50 us'
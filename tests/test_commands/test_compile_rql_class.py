@@ -0,0 +1,156 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import sys
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db.models import Prefetch
+from django.db.models.options import Options
+
+from dj_rql.filter_cls import RQLFilterClass
+from dj_rql.qs import PR
+from tests.dj_rf.filters import SelectBooksFilterClass
+from tests.dj_rf.models import Book, Page
+from tests.test_filter_cls.utils import book_qs
+
+
+COMPILED_MODULE_NAME = '_rql_compiled_filters'
+
+
+class CompiledSelectBooksFilterClass(SelectBooksFilterClass):
+    COMPILED_SCHEMA = COMPILED_MODULE_NAME
+
+
+@pytest.fixture(scope='module')
+def compiled_module(tmp_path_factory):
+    module_dir = tmp_path_factory.mktemp('compiled')
+    module_path = str(module_dir / '{0}.py'.format(COMPILED_MODULE_NAME))
+    call_command(
+        'compile_rql_class',
+        'tests.dj_rf.filters.SelectBooksFilterClass',
+        output=module_path,
+    )
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.syspath_prepend(str(module_dir))
+        yield module_path
+
+    sys.modules.pop(COMPILED_MODULE_NAME, None)
+
+
+def test_compiled_module(compiled_module):
+    with open(compiled_module) as f:
+        code = f.read()
+
+    assert 'Generated by the `compile_rql_class` command' in code
+    assert "'id': FilterItem(field=tests.dj_rf.models.Book.id.field" in code
+    assert "dj_rql.qs.Annotation(anno_auto=models.F('id'))" in code
+
+
+def test_compiled_schema_loaded_without_building(compiled_module, mocker):
+    CompiledSelectBooksFilterClass(book_qs)
+    filter_names = set(SelectBooksFilterClass(book_qs).filters.keys())
+
+    get_field_spy = mocker.spy(Options, 'get_field')
+    build_spy = mocker.spy(CompiledSelectBooksFilterClass, '_build_filters')
+
+    instance = CompiledSelectBooksFilterClass(book_qs)
+    assert set(instance.filters.keys()) == filter_names
+
+    assert get_field_spy.call_count == 0
+    assert build_spy.call_count == 0
+
+
+@pytest.mark.parametrize(
+    'query',
+    (
+        '',
+        'title=abc&author.email=a@example.com',
+        'ordering(-author.email,d_id)&page.number=1',
+        'd_id=1&int_choice_field=1',
+        'select(author,-page)',
+        'anno_auto=1&select(-anno_auto)',
+        'like(title,*abc*)',
+    ),
+)
+def test_compiled_schema_apply_filters(compiled_module, query):
+    _, compiled_qs = CompiledSelectBooksFilterClass(book_qs).apply_filters(query)
+    _, qs = SelectBooksFilterClass(book_qs).apply_filters(query)
+
+    assert str(compiled_qs.query) == str(qs.query)
+    assert compiled_qs.select_data == qs.select_data
+
+
+def test_check_up_to_date(compiled_module):
+    call_command(
+        'compile_rql_class',
+        'tests.dj_rf.filters.SelectBooksFilterClass',
+        output=compiled_module,
+        check=True,
+    )
+
+
+def test_check_drift(tmp_path):
+    output = str(tmp_path / 'compiled.py')
+    call_command('compile_rql_class', 'tests.dj_rf.filters.BooksFilterClass', output=output)
+    with open(output) as f:
+        code = f.read()
+
+    with open(output, 'w') as f:
+        f.write(code.replace('tests.dj_rf.models.Book.title.field', "Book._meta.get_field('name')"))
+
+    with pytest.raises(CommandError) as e:
+        call_command(
+            'compile_rql_class',
+            'tests.dj_rf.filters.BooksFilterClass',
+            output=output,
+            check=True,
+        )
+
+    assert str(e.value) == (
+        'tests.dj_rf.filters.BooksFilterClass: compiled module {0} is out of date.'.format(output)
+    )
+
+
+def test_check_missing_module(tmp_path):
+    with pytest.raises(CommandError):
+        call_command(
+            'compile_rql_class',
+            'tests.dj_rf.filters.BooksFilterClass',
+            output=str(tmp_path / 'missing.py'),
+            check=True,
+        )
+
+
+def test_check_without_output():
+    with pytest.raises(CommandError) as e:
+        call_command('compile_rql_class', 'tests.dj_rf.filters.BooksFilterClass', check=True)
+
+    assert str(e.value) == 'Output module must be set for the check.'
+
+
+class PrefetchQuerysetFilterClass(RQLFilterClass):
+    MODEL = Book
+    SELECT = True
+    FILTERS = (
+        {
+            'namespace': 'pages',
+            'filters': ('number',),
+            'qs': PR(Prefetch('pages', queryset=Page.objects.all())),
+        },
+    )
+
+
+def test_not_compilable():
+    with pytest.raises(CommandError) as e:
+        call_command(
+            'compile_rql_class',
+            'tests.test_commands.test_compile_rql_class.PrefetchQuerysetFilterClass',
+        )
+
+    assert str(e.value) == (
+        'tests.test_commands.test_compile_rql_class.PrefetchQuerysetFilterClass: '
+        "Prefetch with a queryset can't be compiled: pages."
+    )
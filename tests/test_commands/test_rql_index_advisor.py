@@ -0,0 +1,104 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dj_rql.stats import UsageStats
+from tests.dj_rf.filters import IndexedItemFilterClass
+
+
+FILTER_CLASS = 'tests.dj_rf.filters.IndexedItemFilterClass'
+
+
+def test_text_report():
+    report = call_command('rql_index_advisor', FILTER_CLASS)
+
+    lines = report.splitlines()
+    assert lines[0] == '{0}: 4 recommended indexes.'.format(FILTER_CLASS)
+    assert 'dj_rf.IndexedItem composite (rating, name): ordering (rating,name);' in lines[1]
+
+
+def test_covered_report(tmp_path):
+    usage_path = tmp_path / 'usage.json'
+    usage_path.write_text(json.dumps({FILTER_CLASS: {'filter': {}, 'ordering': {}}}))
+
+    report = call_command('rql_index_advisor', FILTER_CLASS, usage=str(usage_path), min_count=1)
+
+    assert report == '{0}: all filters are covered by indexes.'.format(FILTER_CLASS)
+
+
+def test_json_report_with_usage(tmp_path):
+    collector = UsageStats()
+    collector.path = str(tmp_path)
+    collector.record_usage(IndexedItemFilterClass, (('filter', 'name', 'like'),))
+    collector.flush()
+
+    report = json.loads(
+        call_command(
+            'rql_index_advisor',
+            FILTER_CLASS,
+            usage=str(tmp_path),
+            min_count=1,
+            format='json',
+        ),
+    )
+
+    assert report == [
+        {
+            'model': 'dj_rf.IndexedItem',
+            'kind': 'pattern',
+            'fields': ['name'],
+            'name': 'dj_rf_index_name_4c5abc_pat',
+            'reasons': ['name (eq, in, like)'],
+            'weight': 1,
+        },
+    ]
+
+
+def test_usage_file(tmp_path):
+    usage_path = tmp_path / 'usage.json'
+    usage_path.write_text(json.dumps({FILTER_CLASS: {'filter': {}, 'ordering': {}}}))
+    output = tmp_path / 'report.json'
+
+    call_command(
+        'rql_index_advisor',
+        FILTER_CLASS,
+        usage=str(usage_path),
+        format='json',
+        output=str(output),
+    )
+
+    assert {item['weight'] for item in json.loads(output.read_text())} == {0}
+
+
+def test_usage_not_found(tmp_path):
+    with pytest.raises(CommandError) as e:
+        call_command('rql_index_advisor', FILTER_CLASS, usage=str(tmp_path / 'invalid.json'))
+
+    assert str(e.value).endswith('do not exist.')
+
+
+def test_invalid_filter_class():
+    with pytest.raises(CommandError):
+        call_command('rql_index_advisor', 'tests.dj_rf.filters.InvalidFilterClass')
+
+
+def test_migration():
+    code = call_command(
+        'rql_index_advisor',
+        FILTER_CLASS,
+        format='migration',
+        kind=['pattern', 'trigram'],
+    )
+
+    assert "class Migration(migrations.Migration):" in code
+    assert code.index('CREATE EXTENSION IF NOT EXISTS pg_trgm;') < code.index(
+        'migrations.AddIndex(',
+    )
+    assert code.count('migrations.AddIndex(') == 3
+    assert "opclasses=['gin_trgm_ops']" in code
+    compile(code, 'migration.py', 'exec')
@@ -0,0 +1,87 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tests.dj_rf.models import Book
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / 'corpus.jsonl'
+    records = [
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'title=A', 'shape': 's1'},
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'limit=1', 'shape': 's2'},
+    ]
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records) + '\n')
+    return str(path)
+
+
+@pytest.mark.django_db
+def test_replay_json(corpus_path):
+    Book.objects.create(title='A')
+
+    report = json.loads(call_command('rql_replay_queries', corpus_path, format='json', repeat=3))
+
+    assert report['queries'] == 6
+    assert report['errors'] == 0
+    assert set(report['shapes']) == {
+        'tests.dj_rf.filters.BooksFilterClass: s1',
+        'tests.dj_rf.filters.BooksFilterClass: s2',
+    }
+
+
+@pytest.mark.django_db
+def test_replay_text(corpus_path, tmp_path):
+    output = tmp_path / 'report.txt'
+    call_command('rql_replay_queries', corpus_path, top=1, output=str(output))
+
+    report = output.read_text()
+    assert report.startswith('Replayed queries: 2, errors: 0.')
+    assert report.count('tests.dj_rf.filters.BooksFilterClass: ') == 1
+    assert 'fetch' in report
+
+
+@pytest.mark.django_db
+def test_replay_text_failures(tmp_path):
+    corpus_path = tmp_path / 'corpus.jsonl'
+    corpus_path.write_text(
+        json.dumps({'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'a=b=c'}),
+    )
+
+    report = call_command('rql_replay_queries', str(corpus_path))
+
+    assert report.startswith('Replayed queries: 0, errors: 1.')
+    assert 'failed a=b=c: RQLFilterParsingError: RQL Parsing error. Bad filter query.' in report
+
+
+@pytest.mark.django_db
+def test_replay_filter_class(corpus_path):
+    report = json.loads(
+        call_command(
+            'rql_replay_queries',
+            corpus_path,
+            filter_class='tests.dj_rf.filters.SelectBooksFilterClass',
+            format='json',
+        ),
+    )
+
+    assert all(
+        key.startswith('tests.dj_rf.filters.SelectBooksFilterClass') for key in report['shapes']
+    )
+
+
+def test_replay_invalid_filter_class(corpus_path):
+    with pytest.raises(CommandError):
+        call_command('rql_replay_queries', corpus_path, filter_class='invalid.FilterClass')
+
+
+def test_replay_corpus_not_found(tmp_path):
+    with pytest.raises(CommandError) as e:
+        call_command('rql_replay_queries', str(tmp_path / 'invalid.jsonl'))
+
+    assert str(e.value).endswith('does not exist.')
@@ -0,0 +1,67 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dj_rql.stats import UsageStats
+from tests.dj_rf.filters import BooksFilterClass, SelectBooksFilterClass
+
+
+@pytest.fixture
+def stats_path(tmp_path):
+    collector = UsageStats()
+    collector.path = str(tmp_path)
+    collector.record_usage(BooksFilterClass, (('filter', 'title', 'eq'),))
+    collector.record_usage(SelectBooksFilterClass, (('ordering', '-id'),))
+    collector.flush()
+    return str(tmp_path)
+
+
+def test_dump_from_path(stats_path):
+    stats = json.loads(call_command('rql_usage_stats', path=stats_path))
+
+    assert set(stats) == {
+        'tests.dj_rf.filters.BooksFilterClass',
+        'tests.dj_rf.filters.SelectBooksFilterClass',
+    }
+    assert stats['tests.dj_rf.filters.BooksFilterClass']['filter']['title']['eq']['count'] == 1
+
+
+def test_dump_from_settings(stats_path, settings):
+    settings.RQL_USAGE_STATS = {'path': stats_path}
+    stats = json.loads(call_command('rql_usage_stats'))
+
+    assert len(stats) == 2
+
+
+def test_dump_filter_class(stats_path, tmp_path):
+    output = tmp_path / 'output.json'
+    call_command(
+        'rql_usage_stats',
+        path=stats_path,
+        filter_class=['tests.dj_rf.filters.SelectBooksFilterClass'],
+        output=str(output),
+    )
+
+    stats = json.loads(output.read_text())
+    assert list(stats) == ['tests.dj_rf.filters.SelectBooksFilterClass']
+    assert stats['tests.dj_rf.filters.SelectBooksFilterClass']['ordering']['-id']['count'] == 1
+
+
+def test_dump_path_not_set(settings):
+    settings.RQL_USAGE_STATS = {}
+    with pytest.raises(CommandError) as e:
+        call_command('rql_usage_stats')
+
+    assert str(e.value).startswith('Stats directory is not set')
+
+
+def test_dump_path_not_found(tmp_path):
+    with pytest.raises(CommandError) as e:
+        call_command('rql_usage_stats', path=str(tmp_path / 'invalid'))
+
+    assert str(e.value).endswith('does not exist.')
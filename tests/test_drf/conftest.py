@@ -19,3 +19,4 @@ def api_client():
 def clear_cache():
     _FilterClassCache.clear()
     RQLFilterBackend._CACHES = {}
+    RQLFilterBackend._CACHE_LOCKS = {}
@@ -1,6 +1,9 @@
 #
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
 import pytest
 from cachetools import LFUCache, LRUCache
 from django.db import connection
@@ -8,9 +11,12 @@ from django.test.utils import CaptureQueriesContext
 from rest_framework.reverse import reverse
 from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND
 
+from dj_rql.cache import MemoryBoundedCache
 from dj_rql.drf import RQLFilterBackend
-from dj_rql.drf.backend import _FilterClassCache
+from dj_rql.drf.backend import _FilterClassCache, _QueriesCacheLock
+from tests.dj_rf.filters import BooksFilterClass, SelectBooksFilterClass
 from tests.dj_rf.models import Book
+from tests.dj_rf.view import DRFViewSet, SelectViewSet
 
 
 @pytest.mark.django_db
@@ -228,3 +234,82 @@ def test_list_filtering_for_auto(api_client, clear_cache):
     response = api_client.get('{0}?{1}'.format(reverse('auto-list'), query))
     assert response.status_code == HTTP_200_OK
     assert response.data == [{'id': books[0].pk}]
+
+
+def test_queries_cache_single_flight():
+    cache_lock, cache = _QueriesCacheLock(), LRUCache(10)
+    started, release, calls = Event(), Event(), []
+
+    def apply():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'result'
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(cache_lock.get_or_apply, cache, 'key', apply)
+        started.wait(5)
+        waiters = [executor.submit(cache_lock.get_or_apply, cache, 'key', apply) for _ in range(4)]
+        release.set()
+
+        assert leader.result() == ('result', 0)
+        assert [waiter.result() for waiter in waiters] == [('result', None)] * 4
+
+    assert len(calls) == 1
+    assert cache['key'] == 'result'
+    assert cache_lock._in_flight == {}
+
+
+def test_queries_cache_single_flight_leader_failure():
+    cache_lock, cache = _QueriesCacheLock(), LRUCache(10)
+    started, release = Event(), Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(cache_lock.get_or_apply, cache, 'key', fail)
+        started.wait(5)
+        waiter = executor.submit(cache_lock.get_or_apply, cache, 'key', lambda: 'result')
+        release.set()
+
+        with pytest.raises(ValueError):
+            leader.result()
+
+        assert waiter.result() == ('result', 0)
+
+    assert cache_lock._in_flight == {}
+
+
+class _StrMemoryBoundedCache(MemoryBoundedCache):
+    MAX_ITEM_SIZE_RATIO = 1
+
+    def getsizeof(self, value):
+        return len(value)
+
+
+@pytest.mark.parametrize(
+    'cache,evictions',
+    (
+        (LRUCache(2, getsizeof=len), 1),
+        (_StrMemoryBoundedCache(2), 1),
+        (_StrMemoryBoundedCache(1), 0),
+    ),
+)
+def test_queries_cache_evictions(cache, evictions):
+    cache_lock = _QueriesCacheLock()
+    cache['a'] = 'a'
+
+    assert cache_lock.get_or_apply(cache, 'b', lambda: 'bb') == ('bb', evictions)
+    assert ('b' in cache) is bool(evictions)
+    assert ('a' in cache) is not bool(evictions)
+
+
+def test_queries_cache_locks(clear_cache):
+    books_lock = RQLFilterBackend._get_cache_lock(BooksFilterClass, DRFViewSet())
+    select_lock = RQLFilterBackend._get_cache_lock(SelectBooksFilterClass, SelectViewSet())
+
+    assert books_lock is not select_lock
+    assert RQLFilterBackend._get_cache_lock(BooksFilterClass, DRFViewSet()) is books_lock
@@ -0,0 +1,164 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from weakref import WeakSet
+
+import pytest
+from rest_framework.reverse import reverse
+
+from dj_rql.cache import MemoryBoundedCache
+from dj_rql.drf import RQLFilterBackend
+from tests.dj_rf.filters import BooksFilterClass
+from tests.dj_rf.models import Book
+from tests.test_filter_cls.utils import book_qs
+
+
+class WeightCache(MemoryBoundedCache):
+    def getsizeof(self, value):
+        return value
+
+
+def apply_filters(query):
+    return BooksFilterClass(book_qs).apply_filters(query)
+
+
+def test_memory_bounded_cache_size_estimation():
+    cache = MemoryBoundedCache(10 * 1024 * 1024)
+
+    small_size = cache.getsizeof(apply_filters('in(id,(1,2))'))
+    large_size = cache.getsizeof(apply_filters('in(id,({0}))'.format(','.join(['1'] * 1000))))
+
+    assert MemoryBoundedCache.QUERYSET_SIZE < small_size < 10 * 1024
+    assert large_size > 500 * 1024
+    assert cache.getsizeof(apply_filters('')) == MemoryBoundedCache.QUERYSET_SIZE
+
+
+def test_memory_bounded_cache_lru_eviction_by_size():
+    cache = WeightCache(100)
+    for key in 'abcd':
+        cache[key] = 25
+
+    assert cache['a'] == 25
+
+    cache['e'] = 25
+    assert set(cache._data) == {'a', 'c', 'd', 'e'}
+    assert cache.currsize == 100
+
+    cache['a'] = 10
+    assert cache.currsize == 85
+    assert len(cache) == 4
+
+    del cache['c']
+    assert 'c' not in cache
+    assert cache.currsize == 60
+
+    with pytest.raises(KeyError):
+        cache['c']
+
+
+def test_memory_bounded_cache_large_item_not_cached():
+    cache = WeightCache(100)
+    cache['a'] = 25
+    cache['b'] = 26
+
+    assert 'b' not in cache
+    assert cache.currsize == 25
+
+
+def test_memory_bounded_cache_global_maxsize(mocker):
+    mocker.patch.object(MemoryBoundedCache, '_INSTANCES', WeakSet())
+
+    class GlobalCache(WeightCache):
+        GLOBAL_MAXSIZE = 50
+        MAX_ITEM_SIZE_RATIO = 1
+
+    caches = [GlobalCache(100), GlobalCache(100)]
+    caches[0]['a'] = 20
+    caches[0]['b'] = 5
+    caches[0]['c'] = 20
+    assert set(caches[0]._data) == {'b', 'c'}
+
+    caches[1]['d'] = 20
+    caches[1]['e'] = 5
+    assert set(caches[1]._data) == {'d', 'e'}
+    assert GlobalCache._get_global_size() == 50
+
+    caches[1]['f'] = 26
+    assert set(caches[1]._data) == {'d', 'e'}
+    assert GlobalCache._get_global_size() <= GlobalCache.GLOBAL_MAXSIZE
+
+
+def test_memory_bounded_cache_global_maxsize_idle_cache(mocker):
+    mocker.patch.object(MemoryBoundedCache, '_INSTANCES', WeakSet())
+
+    class GlobalCache(WeightCache):
+        GLOBAL_MAXSIZE = 50
+        MAX_ITEM_SIZE_RATIO = 1
+
+    idle_cache = GlobalCache(100)
+    idle_cache['a'] = 20
+    idle_cache['b'] = 20
+
+    cache = GlobalCache(100)
+    cache['c'] = 20
+    assert set(idle_cache._data) == {'b'}
+    assert GlobalCache._get_global_size() == 40
+
+
+def test_memory_bounded_cache_global_maxsize_shares(mocker):
+    mocker.patch.object(MemoryBoundedCache, '_INSTANCES', WeakSet())
+
+    class GlobalCache(WeightCache):
+        GLOBAL_MAXSIZE = 50
+        MAX_ITEM_SIZE_RATIO = 1
+
+    caches = [GlobalCache(100), GlobalCache(10)]
+    caches[0]['a'] = 40
+    assert caches[0]._get_budget() == 40
+    assert caches[1]._get_budget() == 10
+
+    caches.append(GlobalCache(100))
+    caches[2]['b'] = 20
+    assert 'b' in caches[2]
+    assert 'a' not in caches[0]
+    assert GlobalCache._get_global_size() <= GlobalCache.GLOBAL_MAXSIZE
+
+    caches[0]['c'] = 5
+    assert set(caches[0]._data) == {'c'}
+    assert GlobalCache._get_global_size() == 25
+
+
+def test_memory_bounded_cache_global_maxsize_other_caches(mocker):
+    mocker.patch.object(MemoryBoundedCache, '_INSTANCES', WeakSet())
+
+    class GlobalCache(WeightCache):
+        GLOBAL_MAXSIZE = 50
+        MAX_ITEM_SIZE_RATIO = 1
+
+    local_cache = WeightCache(100)
+    local_cache['a'] = 20
+
+    cache = GlobalCache(100)
+    cache['b'] = 50
+    assert 'a' in local_cache
+    assert 'b' in cache
+    assert GlobalCache._get_global_size() == 50
+
+
+@pytest.mark.django_db
+def test_memory_bounded_cache_backend(api_client, clear_cache, mocker):
+    mocker.patch.object(BooksFilterClass, 'QUERIES_CACHE_BACKEND', MemoryBoundedCache)
+    mocker.patch.object(BooksFilterClass, 'QUERIES_CACHE_SIZE', 1024 * 1024)
+    book = Book.objects.create(title='F')
+
+    for _ in range(2):
+        response = api_client.get(reverse('book-list') + '?title=F')
+        assert response.data == [{'id': book.pk}]
+
+    cache = RQLFilterBackend._CACHES[
+        'tests.dj_rf.view.DRFViewSet+tests.dj_rf.filters.BooksFilterClass'
+    ]
+    assert isinstance(cache, MemoryBoundedCache)
+    assert len(cache) == 1
+    assert 0 < cache.currsize < 10 * 1024
@@ -0,0 +1,187 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+import pytest
+from django.core.cache import caches
+from django.db.models import F, Q
+from py_rql.exceptions import RQLFilterParsingError
+from rest_framework.reverse import reverse
+
+from dj_rql.cache import QueryPlansCache
+from dj_rql.drf import RQLFilterBackend
+from dj_rql.drf.backend import _FilterClassCache
+from dj_rql.filter_cls import RQLFilterClass
+from dj_rql.qs import AN
+from tests.dj_rf.filters import BooksFilterClass, SelectBooksFilterClass
+from tests.dj_rf.models import Author, Book
+
+
+@pytest.fixture
+def plans_cache(mocker, clear_cache):
+    caches['default'].clear()
+    mocker.patch.object(SelectBooksFilterClass, 'QUERIES_CACHE_BACKEND', QueryPlansCache)
+    yield caches['default']
+    caches['default'].clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'query',
+    (
+        'title=F',
+        'ordering(-d_id)',
+        'author.name=Jack&select(-id)',
+        'select(author)&limit=1',
+    ),
+)
+def test_query_plans_cache(api_client, plans_cache, mocker, query):
+    author = Author.objects.create(name='Jack')
+    Book.objects.create(title='F', author=author)
+    Book.objects.create(title='G', author=author)
+
+    apply_filters_spy = mocker.spy(RQLFilterClass, 'apply_filters')
+    apply_query_plan_spy = mocker.spy(RQLFilterClass, 'apply_query_plan')
+
+    url = '{0}?{1}'.format(reverse('select-list'), query)
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert len(plans_cache._cache) == 1
+
+    # Process caches are empty in another worker
+    _FilterClassCache.clear()
+    RQLFilterBackend._CACHES = {}
+
+    for _ in range(2):
+        cached_response = api_client.get(url)
+        assert cached_response.status_code == 200
+        assert cached_response.data == response.data
+        assert cached_response.get('Content-Range') == response.get('Content-Range')
+
+    assert apply_filters_spy.call_count == 1
+    assert apply_query_plan_spy.call_count == 2
+    assert len(plans_cache._cache) == 1
+
+
+@pytest.mark.django_db
+def test_query_plans_cache_queryset_in_key(api_client, plans_cache):
+    api_client.get(reverse('select-list') + '?title=F')
+    api_client.get(reverse('dynamicfiltercls-list') + '?title=F')
+    api_client.get(reverse('select-list') + '?title=G')
+
+    assert len(plans_cache._cache) == 2
+
+
+@pytest.mark.django_db
+def test_query_plans_cache_not_safe_method(api_client, plans_cache):
+    api_client.post(reverse('select-list') + '?title=F')
+
+    assert len(plans_cache._cache) == 0
+
+
+def test_query_plans_cache_key():
+    plans_cache = QueryPlansCache(10)
+    books_instance = BooksFilterClass(None)
+
+    key = plans_cache.make_key(books_instance, 'query')
+    assert key.startswith('dj_rql:')
+    assert key == plans_cache.make_key(BooksFilterClass(None), 'query')
+    assert key == QueryPlansCache().make_key(books_instance, 'query')
+
+    assert key != plans_cache.make_key(books_instance, 'other')
+    assert key != plans_cache.make_key(SelectBooksFilterClass(None), 'query')
+
+    class VersionedCache(QueryPlansCache):
+        VERSION = 2
+
+    assert key != VersionedCache().make_key(books_instance, 'query')
+
+
+def test_query_plans_cache_filter_class_version():
+    class Cls(RQLFilterClass):
+        MODEL = Book
+        FILTERS = ('id', 'title')
+
+    class ChangedCls(RQLFilterClass):
+        MODEL = Book
+        FILTERS = ('id', {'filter': 'title', 'source': 'author__name'})
+
+    ChangedCls.__qualname__ = Cls.__qualname__
+
+    key = QueryPlansCache().make_key(Cls(None), 'query')
+    assert key != QueryPlansCache().make_key(ChangedCls(None), 'query')
+
+
+@pytest.mark.parametrize(
+    'changed_attrs',
+    (
+        {'FILTERS': ('id', {'filter': 'title', 'ordering': True})},
+        {'FILTERS': ('id', {'filter': 'title', 'search': True})},
+        {'FILTERS': ('id', {'filter': 'title', 'hidden': True})},
+        {'FILTERS': ('id', {'filter': 'title', 'qs': AN(t=F('title'))})},
+        {'EXTENDED_SEARCH_ORM_ROUTES': ('author__name',)},
+        {'MAX_ORDERING_LENGTH_IN_QUERY': 1},
+        {'LAZY_NAMESPACES': True},
+    ),
+)
+def test_query_plans_cache_filter_class_version_config(changed_attrs):
+    class Cls(RQLFilterClass):
+        MODEL = Book
+        SELECT = True
+        FILTERS = ('id', 'title')
+
+    ChangedCls = type('Cls', (Cls,), changed_attrs)
+    ChangedCls.__qualname__ = Cls.__qualname__
+
+    key = QueryPlansCache().make_key(Cls(None), 'query')
+    assert key == QueryPlansCache().make_key(Cls(None), 'query')
+    assert key != QueryPlansCache().make_key(ChangedCls(None), 'query')
+
+
+def test_query_plans_cache_lazy_filter_class_version():
+    class Cls(RQLFilterClass):
+        MODEL = Book
+        LAZY_NAMESPACES = True
+        FILTERS = ('id', {'namespace': 'author', 'filters': ('name',)})
+
+    class ChangedCls(Cls):
+        FILTERS = ('id', {'namespace': 'author', 'filters': ('email',)})
+
+    ChangedCls.__qualname__ = Cls.__qualname__
+
+    filter_instance = Cls(None)
+    key = QueryPlansCache().make_key(filter_instance, 'query')
+
+    filter_instance.compile_filters()
+    assert key == QueryPlansCache().make_key(filter_instance, 'query')
+    assert key != QueryPlansCache().make_key(ChangedCls(None), 'query')
+
+
+def test_query_plan_ordering_validated():
+    filter_instance = SelectBooksFilterClass(Book.objects.all())
+    filter_instance.apply_filters('ordering(-d_id)')
+    query_plan = filter_instance.query_plan
+    assert query_plan.ordering_properties == ('-d_id',)
+
+    class ChangedCls(SelectBooksFilterClass):
+        ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY = {('author.email',)}
+
+    with pytest.raises(RQLFilterParsingError) as e:
+        ChangedCls(Book.objects.all()).apply_query_plan(query_plan)
+
+    assert e.value.details['error'] == 'Bad ordering filter: permutation not allowed.'
+
+
+def test_query_plans_cache_unpicklable_plan(plans_cache):
+    filter_instance = SelectBooksFilterClass(Book.objects.all())
+    filter_instance.apply_filters('title=F')
+    query_plan = filter_instance.query_plan
+    query_plan.q = Q(title=lambda: None)
+
+    QueryPlansCache().set(filter_instance, 'query', query_plan)
+    assert len(plans_cache._cache) == 0
+
+
+def test_query_plans_cache_incompatible_plan(plans_cache, mocker):
+    mocker.patch.object(plans_cache, 'get', side_effect=AttributeError)
+
+    assert QueryPlansCache().get(SelectBooksFilterClass(None), 'query') is None
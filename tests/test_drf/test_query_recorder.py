@@ -0,0 +1,173 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import json
+
+import pytest
+from django.apps import apps
+from django.db import OperationalError
+from django.db.models import QuerySet
+from rest_framework.reverse import reverse
+
+from dj_rql.drf.backend import RQLFilterBackend
+from dj_rql.drf.query_recorder import QueryRecorder, QueryReplay
+from tests.dj_rf.filters import BooksFilterClass
+from tests.dj_rf.models import Book
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    return str(tmp_path / 'corpus.jsonl')
+
+
+@pytest.fixture
+def recorder(corpus_path):
+    recorder = QueryRecorder(corpus_path)
+    recorder.connect()
+    yield recorder
+    recorder.disconnect()
+
+
+def read_corpus(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.django_db
+def test_queries_recorded(api_client, clear_cache, recorder, corpus_path):
+    for query in ('title=A&limit=10', 'title=B&limit=20', ''):
+        response = api_client.get(reverse('book-list') + '?' + query)
+        assert response.status_code == 200
+
+    records = read_corpus(corpus_path)
+    assert [record['query'] for record in records] == ['title=A&limit=10', 'title=B&limit=20', '']
+    assert records[0]['shape'] == records[1]['shape']
+    assert records[0]['filter_class'] == 'tests.dj_rf.filters.BooksFilterClass'
+    assert records[0]['view'] == 'tests.dj_rf.view.DRFViewSet'
+
+
+@pytest.mark.django_db
+def test_max_queries(api_client, clear_cache, corpus_path):
+    recorder = QueryRecorder(corpus_path, max_queries=1)
+    recorder.connect()
+    try:
+        for _ in range(3):
+            api_client.get(reverse('book-list') + '?title=A')
+    finally:
+        recorder.disconnect()
+
+    assert len(read_corpus(corpus_path)) == 1
+    assert RQLFilterBackend.QUERY_RECORDER is None
+
+
+@pytest.mark.django_db
+def test_not_sampled(api_client, clear_cache, corpus_path, mocker):
+    mocker.patch('dj_rql.drf.query_recorder.random', return_value=0.5)
+    recorder = QueryRecorder(corpus_path, sample_rate=0.5)
+    recorder.connect()
+    try:
+        api_client.get(reverse('book-list') + '?title=A')
+    finally:
+        recorder.disconnect()
+
+    with pytest.raises(FileNotFoundError):
+        read_corpus(corpus_path)
+
+
+@pytest.mark.django_db
+def test_replay():
+    Book.objects.create(title='A')
+    records = [
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'title=A', 'shape': 's'},
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'title=B', 'shape': 's'},
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'invalid(('},
+    ]
+
+    report = QueryReplay(repeat=2).run(records)
+
+    assert report['queries'] == 4
+    assert report['errors'] == 2
+    assert report['stages']['fetch']['count'] == 4
+    assert set(report['stages']['total']) == {'count', 'p50', 'p90', 'p99', 'max'}
+
+    shape = report['shapes']['tests.dj_rf.filters.BooksFilterClass: s']
+    assert shape['queries'] == 4
+    assert shape['errors'] == 0
+    assert shape['failures'] == {}
+
+    shape = report['shapes']['tests.dj_rf.filters.BooksFilterClass: invalid((']
+    assert shape['errors'] == 2
+    assert shape['failures'] == {
+        'invalid((': 'RQLFilterParsingError: RQL Parsing error. Bad filter query.',
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'query,error',
+    (
+        ('limit=abc', "ValueError: invalid literal for int() with base 10: 'abc'"),
+        ('limit=-1', 'ValueError: Limit and offset must not be negative.'),
+        ('limit=10&offset=-5', 'ValueError: Limit and offset must not be negative.'),
+    ),
+)
+def test_replay_invalid_limit_offset(query, error):
+    records = [
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': query, 'shape': 's'},
+        {'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'limit=1', 'shape': 's'},
+    ]
+
+    report = QueryReplay().run(records)
+
+    assert report['queries'] == 1
+    assert report['errors'] == 1
+    assert report['shapes']['tests.dj_rf.filters.BooksFilterClass: s']['failures'] == {
+        query: error,
+    }
+
+
+@pytest.mark.django_db
+def test_replay_db_error(mocker):
+    mocker.patch.object(QuerySet, 'count', side_effect=OperationalError('no such table'))
+    records = [{'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'title=A'}]
+
+    shape = QueryReplay().run(records)['shapes']['tests.dj_rf.filters.BooksFilterClass: title=A']
+
+    assert shape['failures'] == {'title=A': 'OperationalError: no such table'}
+
+
+@pytest.mark.django_db
+def test_replay_unexpected_error(mocker):
+    mocker.patch.object(QuerySet, 'count', side_effect=KeyError)
+    records = [{'filter_class': 'tests.dj_rf.filters.BooksFilterClass', 'query': 'title=A'}]
+
+    with pytest.raises(KeyError):
+        QueryReplay().run(records)
+
+
+@pytest.mark.django_db
+def test_replay_filter_class_override():
+    records = [{'filter_class': 'invalid.FilterClass', 'query': 'limit=5&offset=10'}]
+
+    report = QueryReplay(filter_class=BooksFilterClass).run(records)
+
+    assert report['queries'] == 1
+    assert list(report['shapes']) == ['tests.dj_rf.filters.BooksFilterClass: limit=5&offset=10']
+
+
+def test_percentile():
+    values = list(range(1, 101))
+
+    assert QueryReplay.percentile(values, 50) == 50
+    assert QueryReplay.percentile(values, 99) == 99
+    assert QueryReplay.percentile([1], 90) == 1
+
+
+def test_query_recorder_app_config(mocker, settings):
+    settings.RQL_QUERY_RECORDER = {'path': '/tmp/rql_queries.jsonl', 'sample_rate': 0.1}
+    connect = mocker.patch.object(QueryRecorder, 'connect')
+
+    apps.get_app_config('dj_rql').ready()
+
+    connect.assert_called_once_with()
@@ -0,0 +1,85 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import pytest
+from rest_framework.reverse import reverse
+
+from dj_rql.drf import RQLFilterBackend
+from tests.dj_rf.filters import BooksFilterClass
+from tests.dj_rf.models import Book
+
+
+DEFAULT_ID, REPLICA_ID = 1, 100
+
+
+@pytest.fixture
+def heavy_query_routing(mocker):
+    mocker.patch.object(RQLFilterBackend, 'HEAVY_QUERY_COST', 10)
+    mocker.patch.object(RQLFilterBackend, 'HEAVY_QUERY_DATABASE', 'replica')
+
+    Book.objects.create(id=DEFAULT_ID, title='default')
+    Book.objects.using('replica').create(id=REPLICA_ID, title='replica')
+
+
+def get_ids(api_client, query):
+    response = api_client.get(reverse('book-list') + '?' + query)
+    assert response.status_code == 200
+    return [book['id'] for book in response.data]
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+@pytest.mark.parametrize(
+    'query,database',
+    (
+        ('', 'default'),
+        ('like(title,*a*)', 'replica'),
+        ('like(title,*a*)&limit=10', 'replica'),
+        ('like(title,d*)', 'default'),
+        ('search=a', 'replica'),
+        ('limit=1&offset=2000', 'replica'),
+    ),
+)
+def test_heavy_queries_routed(api_client, clear_cache, heavy_query_routing, query, database):
+    ids = get_ids(api_client, query)
+
+    if database == 'default':
+        assert REPLICA_ID not in ids
+    else:
+        assert DEFAULT_ID not in ids
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_heavy_queries_routed_from_cache(api_client, clear_cache, heavy_query_routing):
+    for _ in range(2):
+        assert get_ids(api_client, 'like(title,*pli*)') == [REPLICA_ID]
+        assert get_ids(api_client, 'like(title,def*)') == [DEFAULT_ID]
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+@pytest.mark.parametrize('method', ('post', 'put', 'patch', 'delete'))
+def test_unsafe_methods_not_routed(rf, heavy_query_routing, method):
+    filter_instance = BooksFilterClass(Book.objects.all())
+    _, queryset = filter_instance.apply_filters('like(title,*a*)')
+    backend = RQLFilterBackend()
+
+    request = getattr(rf, method)('/')
+    assert backend.get_query_database(filter_instance, queryset, request, None) is None
+    assert backend.get_query_database(filter_instance, queryset, rf.get('/'), None) == 'replica'
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_routing_disabled(api_client, clear_cache, mocker):
+    mocker.patch.object(RQLFilterBackend, 'HEAVY_QUERY_COST', 10)
+    Book.objects.create(id=DEFAULT_ID, title='default')
+    Book.objects.using('replica').create(id=REPLICA_ID, title='replica')
+
+    assert get_ids(api_client, 'like(title,*a*)') == [DEFAULT_ID]
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+def test_query_database_hook(api_client, clear_cache, mocker):
+    mocker.patch.object(RQLFilterBackend, 'get_query_database', return_value='replica')
+    Book.objects.using('replica').create(id=REPLICA_ID, title='replica')
+
+    assert get_ids(api_client, 'title=replica') == [REPLICA_ID]
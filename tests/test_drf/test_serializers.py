@@ -6,6 +6,7 @@ from collections import OrderedDict
 
 import pytest
 
+from dj_rql.drf.serializers import _get_rql_select_mask
 from tests.dj_rf.models import (
     Author,
     Book,
@@ -98,3 +99,53 @@ def test_select_misconfiguration():
 
     data = SelectBookSerializer(book, context={'request': Request}).data
     assert data
+
+
+@pytest.mark.django_db
+def test_select_list_resolved_once(mocker):
+    author = Author.objects.create(name='auth')
+    books = [Book.objects.create(author=author) for _ in range(3)]
+    for book in books:
+        Page.objects.create(book=book, number=1, content='text')
+
+    select = OrderedDict()
+    select['github_stars'] = False
+    select['author_ref.name'] = False
+    select['pages.content'] = False
+
+    class Request:
+        rql_select = {
+            'depth': 0,
+            'select': select,
+        }
+
+    apply_spy = mocker.spy(SelectBookSerializer, 'apply_rql_select')
+
+    data = SelectBookSerializer(books, many=True, context={'request': Request}).data
+
+    assert apply_spy.call_count == 1
+    assert len(data) == 3
+    for item in data:
+        assert 'github_stars' not in item
+        assert item['author_ref'] == {'id': author.id}
+        assert list(item['pages'][0].keys()) == ['id']
+
+    assert Request.rql_select['select'] == select
+
+
+def test_select_mask_cached_per_select():
+    first_select = OrderedDict((('a', False), ('b.c', True), ('b.d.e', False)))
+    second_select = OrderedDict(first_select)
+
+    mask = _get_rql_select_mask(first_select)
+    assert mask is _get_rql_select_mask(second_select)
+    assert mask.excluded == ('a',)
+    assert mask.nested == (('b', (('c', True), ('d.e', False))),)
+
+
+def test_select_mask_excluded_before_deeper():
+    select = OrderedDict((('a.b', True), ('a', False), ('a.c', True)))
+
+    mask = _get_rql_select_mask(select)
+    assert mask.excluded == ('a',)
+    assert mask.nested == (('a', (('b', True),)),)
@@ -0,0 +1,116 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+import re
+
+import pytest
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from dj_rql.drf import RQLFilterBackend
+from dj_rql.drf.server_timing import ServerTiming, set_server_timing_header
+from dj_rql.signals import (
+    _NOOP_STAGE_TIMER,
+    Stages,
+    measure_stage,
+    query_cache_event,
+    stage_finished,
+)
+from tests.dj_rf.models import Book
+
+
+def get_metrics(response):
+    return [metric.split(';')[0] for metric in re.split(', ', response['Server-Timing'])]
+
+
+@pytest.mark.django_db
+def test_server_timing_header(api_client, clear_cache, mocker):
+    mocker.patch.object(RQLFilterBackend, 'SERVER_TIMING_SAMPLE_RATE', 1)
+    Book.objects.create()
+    url = reverse('select-list') + '?ordering(-d_id)&limit=10'
+
+    response = api_client.get(url)
+    assert get_metrics(response) == [
+        'rql-parse',
+        'rql-transform',
+        'rql-ordering',
+        'rql-select',
+        'rql-optimizations',
+        'rql-count',
+        'rql-fetch',
+        'rql-serialization',
+        'rql-cache',
+    ]
+    assert 'rql-cache;desc=miss' in response['Server-Timing']
+    assert re.search(r'rql-parse;dur=\d+\.\d{3}', response['Server-Timing'])
+
+    response = api_client.get(url)
+    assert get_metrics(response) == ['rql-count', 'rql-fetch', 'rql-serialization', 'rql-cache']
+    assert 'rql-cache;desc=hit' in response['Server-Timing']
+
+
+@pytest.mark.django_db
+def test_server_timing_content_range_pagination(api_client, clear_cache, mocker):
+    mocker.patch.object(RQLFilterBackend, 'SERVER_TIMING_SAMPLE_RATE', 1)
+
+    response = api_client.get(reverse('book-list') + '?limit=0')
+    assert response['Content-Range'] == 'items 0-0/0'
+    assert get_metrics(response) == [
+        'rql-parse',
+        'rql-transform',
+        'rql-ordering',
+        'rql-count',
+        'rql-cache',
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('sample_rate', (0, 0.5))
+def test_server_timing_not_sampled(api_client, clear_cache, mocker, sample_rate):
+    mocker.patch.object(RQLFilterBackend, 'SERVER_TIMING_SAMPLE_RATE', sample_rate)
+    mocker.patch('dj_rql.drf.backend.random', return_value=0.5)
+
+    response = api_client.get(reverse('select-list') + '?limit=10')
+    assert response.status_code == 200
+    assert 'Server-Timing' not in response
+
+
+@pytest.mark.django_db
+def test_server_timing_no_global_receivers(api_client, clear_cache, mocker, rf):
+    mocker.patch.object(RQLFilterBackend, 'SERVER_TIMING_SAMPLE_RATE', 1)
+
+    response = api_client.get(reverse('select-list') + '?limit=10')
+    assert 'rql-parse' in get_metrics(response)
+    assert not stage_finished.receivers
+    assert not query_cache_event.receivers
+
+    assert measure_stage(RQLFilterBackend, Stages.PARSE, request=rf.get('/')) is _NOOP_STAGE_TIMER
+
+
+def test_server_timing_render():
+    server_timing = ServerTiming()
+    assert server_timing.render() == ''
+
+    server_timing.add('serialization', 0.001)
+    server_timing.add('serialization', 0.0005)
+    assert server_timing.render() == 'rql-serialization;dur=1.500'
+
+    server_timing.cache = 'hit'
+    assert server_timing.render() == 'rql-serialization;dur=1.500, rql-cache;desc=hit'
+
+
+def test_server_timing_existing_header(rf):
+    request = rf.get('/')
+    request.rql_server_timing = ServerTiming()
+    request.rql_server_timing.add('parse', 0.002)
+    response = Response(headers={'Server-Timing': 'db;dur=5'})
+
+    set_server_timing_header(response, request)
+    assert response['Server-Timing'] == 'db;dur=5, rql-parse;dur=2.000'
+
+
+def test_server_timing_not_started(rf):
+    response = Response()
+
+    set_server_timing_header(response, rf.get('/'))
+    assert 'Server-Timing' not in response
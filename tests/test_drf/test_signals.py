@@ -0,0 +1,160 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+import pytest
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from dj_rql.drf.paginations import RQLContentRangeLimitOffsetPagination
+from dj_rql.drf.serializers import RQLListSerializer
+from dj_rql.signals import (
+    _NOOP_STAGE_TIMER,
+    QueryCacheEvents,
+    Stages,
+    measure_stage,
+    query_cache_event,
+    stage_finished,
+)
+from tests.dj_rf.filters import BooksFilterClass, SelectBooksFilterClass
+from tests.dj_rf.models import Author, Book
+from tests.dj_rf.serializers import AuthorSerializer, SelectBookSerializer
+from tests.dj_rf.view import DRFViewSet
+
+
+@pytest.fixture
+def stages():
+    received = []
+
+    def receiver(sender, stage, duration, request, **kwargs):
+        assert duration >= 0
+        received.append((sender, stage, request is not None))
+
+    stage_finished.connect(receiver)
+    yield received
+    stage_finished.disconnect(receiver)
+
+
+@pytest.fixture
+def cache_events():
+    received = []
+
+    def receiver(sender, event, count, view, **kwargs):
+        received.append((sender, event, count, type(view)))
+
+    query_cache_event.connect(receiver)
+    yield received
+    query_cache_event.disconnect(receiver)
+
+
+@pytest.mark.django_db
+def test_stages(api_client, clear_cache, stages):
+    author = Author.objects.create(name='Jack')
+    Book.objects.create(author=author)
+    Book.objects.create(author=author)
+
+    response = api_client.get(reverse('select-list') + '?ordering(-d_id)&select(author)&limit=10')
+    assert response.status_code == 200
+
+    # Serializers, that are created manually in method fields, are measured separately
+    assert stages == [
+        (SelectBooksFilterClass, Stages.PARSE, True),
+        (SelectBooksFilterClass, Stages.TRANSFORM, True),
+        (SelectBooksFilterClass, Stages.ORDERING, True),
+        (SelectBooksFilterClass, Stages.SELECT, True),
+        (SelectBooksFilterClass, Stages.OPTIMIZATIONS, True),
+        (RQLContentRangeLimitOffsetPagination, Stages.COUNT, True),
+        (RQLContentRangeLimitOffsetPagination, Stages.FETCH, True),
+        (AuthorSerializer, Stages.SERIALIZATION, False),
+        (AuthorSerializer, Stages.SERIALIZATION, False),
+        (SelectBookSerializer, Stages.SERIALIZATION, True),
+    ]
+
+
+@pytest.mark.django_db
+def test_stages_custom_list_serializer(stages, mocker):
+    class ListSerializer(serializers.ListSerializer):
+        pass
+
+    mocker.patch.object(
+        AuthorSerializer.Meta,
+        'list_serializer_class',
+        ListSerializer,
+        create=True,
+    )
+    authors = [Author.objects.create(name='Jack'), Author.objects.create(name='John')]
+
+    assert type(SelectBookSerializer(many=True)) is RQLListSerializer
+    assert type(AuthorSerializer(many=True)) is ListSerializer
+    assert len(AuthorSerializer(authors, many=True).data) == 2
+    assert stages == [(AuthorSerializer, Stages.SERIALIZATION, False)] * 2
+
+
+@pytest.mark.django_db
+def test_stages_custom_rql_list_serializer(stages, mocker):
+    class ListSerializer(RQLListSerializer):
+        pass
+
+    mocker.patch.object(
+        AuthorSerializer.Meta,
+        'list_serializer_class',
+        ListSerializer,
+        create=True,
+    )
+    authors = [Author.objects.create(name='Jack'), Author.objects.create(name='John')]
+
+    serializer = AuthorSerializer(authors, many=True, allow_empty=False)
+
+    assert type(serializer) is ListSerializer
+    assert not serializer.allow_empty
+    assert len(serializer.data) == 2
+    assert stages == [(AuthorSerializer, Stages.SERIALIZATION, False)]
+
+
+@pytest.mark.django_db
+def test_stages_cached_query(api_client, clear_cache, stages):
+    api_client.get(reverse('book-list') + '?title=F')
+    stages.clear()
+
+    api_client.get(reverse('book-list') + '?title=F')
+    assert stages == []
+
+
+def test_stage_failed(stages):
+    with pytest.raises(ValueError):
+        with measure_stage(BooksFilterClass, Stages.PARSE, request=object()):
+            raise ValueError
+
+    assert stages == []
+
+
+def test_no_receivers(mocker):
+    mocker.patch.object(stage_finished, 'receivers', [])
+    perf_counter = mocker.patch('dj_rql.signals.perf_counter')
+
+    with measure_stage(BooksFilterClass, Stages.PARSE) as timer:
+        pass
+
+    assert timer is _NOOP_STAGE_TIMER
+    perf_counter.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_query_cache_events(api_client, clear_cache, cache_events, mocker):
+    mocker.patch.object(BooksFilterClass, 'QUERIES_CACHE_SIZE', 1)
+
+    for query in ('title=F', 'title=F', 'title=G'):
+        api_client.get('{0}?{1}'.format(reverse('book-list'), query))
+
+    assert cache_events == [
+        (BooksFilterClass, QueryCacheEvents.MISS, 1, DRFViewSet),
+        (BooksFilterClass, QueryCacheEvents.HIT, 1, DRFViewSet),
+        (BooksFilterClass, QueryCacheEvents.MISS, 1, DRFViewSet),
+        (BooksFilterClass, QueryCacheEvents.EVICTION, 1, DRFViewSet),
+    ]
+
+
+@pytest.mark.django_db
+def test_query_cache_events_not_cached(api_client, clear_cache, cache_events):
+    api_client.get(reverse('auto-list') + '?id=1')
+
+    assert cache_events == []
@@ -0,0 +1,134 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+import logging
+
+import pytest
+from django.apps import apps
+from py_rql.parser import RQLParser
+from rest_framework.reverse import reverse
+
+from dj_rql.drf._utils import normalize_query
+from dj_rql.drf.slow_queries import SlowQueryLog
+from dj_rql.signals import Stages
+from tests.dj_rf.models import Book
+
+
+@pytest.fixture
+def slow_query_log():
+    logs = []
+
+    def connect(**kwargs):
+        log = SlowQueryLog(**kwargs)
+        log.connect()
+        logs.append(log)
+        return log
+
+    yield connect
+    SlowQueryLog.disconnect()
+
+
+def get_records(caplog):
+    return [r.rql_slow_query for r in caplog.records if r.name == 'dj_rql.slow_queries']
+
+
+@pytest.mark.django_db
+def test_slow_queries_logged(api_client, clear_cache, slow_query_log, caplog):
+    slow_query_log(threshold=0)
+    Book.objects.create(title='F')
+
+    with caplog.at_level(logging.WARNING, logger='dj_rql.slow_queries'):
+        response = api_client.get(reverse('select-list') + '?title=F&limit=10')
+
+    assert response.status_code == 200
+
+    records = get_records(caplog)
+    assert [r['stage'] for r in records] == [Stages.COUNT, Stages.FETCH]
+    for record in records:
+        assert record['rql'] == 'title=?&limit=?'
+        assert record['filter_class'] == 'tests.dj_rf.filters.SelectBooksFilterClass'
+        assert record['duration'] >= 0
+        assert '"dj_rf_book"."title" = F' in record['sql']
+        assert 'explain' not in record
+
+    assert 'LIMIT 1' in records[1]['sql']
+    assert caplog.records[0].getMessage().startswith('Slow RQL query count (')
+
+
+@pytest.mark.django_db
+def test_slow_queries_explain(api_client, clear_cache, slow_query_log, caplog):
+    slow_query_log(threshold=0, explain=True)
+    Book.objects.create()
+
+    with caplog.at_level(logging.WARNING, logger='dj_rql.slow_queries'):
+        api_client.get(reverse('book-list') + '?limit=10')
+
+    records = get_records(caplog)
+    assert len(records) == 2
+    assert all(record['explain'] for record in records)
+
+
+@pytest.mark.django_db
+def test_slow_queries_threshold(api_client, clear_cache, slow_query_log, caplog):
+    slow_query_log(threshold=60)
+
+    with caplog.at_level(logging.WARNING, logger='dj_rql.slow_queries'):
+        api_client.get(reverse('book-list') + '?limit=10')
+
+    assert get_records(caplog) == []
+
+
+@pytest.mark.django_db
+def test_slow_queries_sampling(api_client, clear_cache, slow_query_log, caplog, mocker):
+    slow_query_log(threshold=0, sample_rate=0.5)
+    mocker.patch('dj_rql.drf.slow_queries.random', return_value=0.7)
+
+    with caplog.at_level(logging.WARNING, logger='dj_rql.slow_queries'):
+        api_client.get(reverse('book-list') + '?limit=10')
+
+    assert get_records(caplog) == []
+
+
+def test_slow_queries_rate_limit(mocker):
+    log = SlowQueryLog(rate_limit=2)
+    monotonic = mocker.patch('dj_rql.drf.slow_queries.monotonic', return_value=100)
+
+    assert [log._is_allowed_by_rate_limit() for _ in range(3)] == [True, True, False]
+
+    monotonic.return_value = 159
+    assert not log._is_allowed_by_rate_limit()
+
+    monotonic.return_value = 160
+    assert log._is_allowed_by_rate_limit()
+
+
+def test_slow_queries_not_evaluation_stages(mocker):
+    logger = mocker.patch('dj_rql.drf.slow_queries.logger')
+
+    SlowQueryLog(threshold=0).record(None, Stages.PARSE, 10, queryset=Book.objects.all())
+    logger.warning.assert_not_called()
+
+
+def test_slow_queries_app_config(mocker, settings):
+    settings.RQL_SLOW_QUERY_LOG = {'threshold': 0.5, 'explain': True}
+    connect = mocker.patch.object(SlowQueryLog, 'connect', autospec=True)
+
+    apps.get_app_config('dj_rql').ready()
+
+    log = connect.call_args[0][0]
+    assert (log.threshold, log.explain, log.rate_limit) == (0.5, True, 10)
+
+
+@pytest.mark.parametrize(
+    'query,expected',
+    (
+        ('', ''),
+        ('and(eq(title,abc),in(id,(1,2)))&limit=10', 'and(eq(title,?),in(id,(?,?)))&limit=?'),
+        ('title="a,b"&ordering(-id)&select(author)', 'title=?&ordering(-id)&select(author)'),
+        ('author=t(name=Jack)', 'author=t(name=?)'),
+        ('ilike(title,*a*)&title=null()', 'ilike(title,?)&title=?'),
+    ),
+)
+def test_normalize_query(query, expected):
+    rql_ast = RQLParser.parse_query(query) if query else None
+    assert normalize_query(query, rql_ast) == expected
@@ -0,0 +1,188 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.apps import apps
+from py_rql.exceptions import RQLFilterParsingError
+from rest_framework.reverse import reverse
+
+from dj_rql.stats import UsageStats, merge_usage_stats, usage_stats
+from tests.dj_rf.filters import BooksFilterClass
+from tests.dj_rf.models import Book
+
+
+BOOKS_FILTER_CLASS = 'tests.dj_rf.filters.BooksFilterClass'
+
+
+@pytest.fixture
+def collector():
+    usage_stats.reset()
+    usage_stats.enable()
+    yield usage_stats
+    usage_stats.disable()
+    usage_stats.reset()
+
+
+def assert_counts(items, expected):
+    assert {k: v['count'] for k, v in items.items()} == expected
+
+
+@pytest.mark.django_db
+def test_usage_counted_for_cached_queries(api_client, clear_cache, collector):
+    query = '?in(title,(A,B))&eq(author.email,C)&title=A&ordering(-published.at)&limit=0'
+    for _ in range(3):
+        response = api_client.get(reverse('book-list') + query)
+        assert response.status_code == 200
+
+    stats = collector.dump()[BOOKS_FILTER_CLASS]
+    assert stats['queries'] == 3
+    assert set(stats['filter']) == {'title', 'author.email'}
+    assert_counts(stats['filter']['title'], {'in': 3, 'eq': 3})
+    assert_counts(stats['filter']['author.email'], {'eq': 3})
+    assert_counts(stats['ordering'], {'-published.at': 3})
+    assert stats['select'] == {}
+
+
+@pytest.mark.django_db
+def test_usage_select(api_client, clear_cache, collector):
+    response = api_client.get(reverse('select-list') + '?select(+author,-page)')
+    assert response.status_code == 200
+
+    stats = collector.dump()['tests.dj_rf.filters.SelectBooksFilterClass']
+    assert_counts(stats['select'], {'author': 1, '-page': 1})
+    assert stats['filter'] == {}
+
+
+@pytest.mark.django_db
+def test_usage_latency(api_client, clear_cache, collector):
+    Book.objects.create(title='A')
+
+    response = api_client.get(reverse('book-list') + '?title=A&limit=10')
+    assert response.status_code == 200
+
+    stats = collector.dump()[BOOKS_FILTER_CLASS]
+    latency = stats['filter']['title']['eq']['latency']
+    assert latency['count'] == 2
+    assert latency['sum'] >= 0
+    assert sum(latency['buckets']) == 2
+    assert len(latency['buckets']) == len(UsageStats.LATENCY_BUCKETS) + 1
+    assert stats['latency'] == latency
+
+
+@pytest.mark.django_db
+def test_usage_without_query(api_client, clear_cache, collector):
+    response = api_client.get(reverse('book-list'))
+    assert response.status_code == 200
+
+    stats = collector.dump()[BOOKS_FILTER_CLASS]
+    assert stats['queries'] == 1
+    assert stats['filter'] == stats['ordering'] == stats['select'] == {}
+
+
+@pytest.mark.django_db
+def test_usage_bad_query_not_counted(api_client, clear_cache, collector):
+    with pytest.raises(RQLFilterParsingError):
+        api_client.get(reverse('book-list') + '?ordering(invalid)')
+
+    assert collector.dump() == {}
+
+
+def test_usage_disabled(clear_cache):
+    instance = BooksFilterClass(Book.objects.all())
+    _, qs = instance.apply_filters('title=A')
+
+    assert qs.rql_usage == ()
+    assert instance.query_plan.usage == ()
+    assert usage_stats.dump() == {}
+
+
+def test_usage_query_plan(collector):
+    instance = BooksFilterClass(Book.objects.all())
+    instance.apply_filters('and(title=A,title=B,out(id,(1,2)),ilike(author.email,*a))')
+    query_plan = instance.query_plan
+
+    assert query_plan.usage == (
+        ('filter', 'title', 'eq'),
+        ('filter', 'id', 'out'),
+        ('filter', 'author.email', 'ilike'),
+    )
+
+    _, qs = BooksFilterClass(Book.objects.all()).apply_query_plan(query_plan)
+    assert qs.rql_usage == query_plan.usage
+
+
+def test_usage_null_lookup(collector):
+    instance = BooksFilterClass(Book.objects.all())
+    instance.apply_filters('and(eq(author.email,null()),ne(title,null()),title=A)')
+
+    assert instance.query_plan.usage == (
+        ('filter', 'author.email', 'null'),
+        ('filter', 'title', 'null'),
+        ('filter', 'title', 'eq'),
+    )
+
+
+def test_flush_and_load(tmp_path):
+    collector = UsageStats()
+    collector.enable(path=str(tmp_path), flush_interval=0)
+    try:
+        collector.record_usage(BooksFilterClass, (('filter', 'id', 'eq'),))
+    finally:
+        collector.disable()
+
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1
+    assert files[0].name.startswith(UsageStats.FILE_PREFIX)
+
+    (tmp_path / 'rql_usage_other.json').write_text(files[0].read_text())
+    (tmp_path / 'unknown.json').write_text('{}')
+
+    stats = UsageStats.load(str(tmp_path))[BOOKS_FILTER_CLASS]
+    assert stats['queries'] == 2
+    assert stats['filter']['id']['eq']['count'] == 2
+
+
+def test_flush_concurrent(tmp_path):
+    collector = UsageStats()
+    collector.path = str(tmp_path)
+    collector.record_usage(BooksFilterClass, ())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: collector.flush(), range(20)))
+
+    assert [f.name for f in tmp_path.iterdir()] == ['rql_usage_{0}.json'.format(os.getpid())]
+    assert UsageStats.load(str(tmp_path))[BOOKS_FILTER_CLASS]['queries'] == 1
+
+
+def test_flush_without_path():
+    collector = UsageStats()
+    collector.record_usage(BooksFilterClass, ())
+    collector.flush()
+
+    assert collector.dump()[BOOKS_FILTER_CLASS]['queries'] == 1
+
+
+def test_merge_usage_stats():
+    stats = {'a': {'count': 1, 'sum': 0.5, 'buckets': [1, 0]}}
+    other_stats = {
+        'a': {'count': 2, 'sum': 1.0, 'buckets': [0, 2]},
+        'b': {'count': 1, 'sum': 0.0, 'buckets': [1, 0]},
+    }
+
+    assert merge_usage_stats(stats, other_stats) == {
+        'a': {'count': 3, 'sum': 1.5, 'buckets': [1, 2]},
+        'b': {'count': 1, 'sum': 0.0, 'buckets': [1, 0]},
+    }
+
+
+def test_usage_stats_app_config(mocker, settings):
+    settings.RQL_USAGE_STATS = {'path': '/tmp/rql_usage', 'flush_interval': 10}
+    enable = mocker.patch.object(usage_stats, 'enable')
+
+    apps.get_app_config('dj_rql').ready()
+
+    enable.assert_called_once_with(path='/tmp/rql_usage', flush_interval=10)
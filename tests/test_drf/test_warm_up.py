@@ -0,0 +1,198 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+import pytest
+from django.apps import apps
+from django.core.signals import request_started
+from rest_framework.reverse import reverse
+
+from dj_rql.drf import RQLFilterBackend
+from dj_rql.drf.backend import _FilterClassCache
+from dj_rql.drf.warm_up import (
+    WARM_UP_DISPATCH_UID,
+    warm_up,
+    warm_up_filter_classes,
+    warm_up_on_first_request,
+    warm_up_on_start,
+    warm_up_query_caches,
+)
+from tests.dj_rf.models import Book
+from tests.dj_rf.view import DynamicFilterClsViewSet
+
+
+def test_warm_up_filter_classes(clear_cache):
+    assert warm_up_filter_classes() == 6
+    assert sorted(_FilterClassCache.CACHE.keys()) == [
+        'tests.dj_rf.view.AutoViewSet+tests.dj_rf.view.Cls',
+        'tests.dj_rf.view.DRFViewSet+tests.dj_rf.filters.BooksFilterClass',
+        'tests.dj_rf.view.DjangoFiltersViewSet+tests.dj_rf.filters.BooksFilterClass',
+        'tests.dj_rf.view.DynamicFilterClsViewSet+tests.dj_rf.filters.SelectBooksFilterClass',
+        'tests.dj_rf.view.DynamicFilterClsViewSet'
+        '+tests.dj_rf.filters.SelectDetailedBooksFilterClass',
+        'tests.dj_rf.view.SelectViewSet+tests.dj_rf.filters.SelectBooksFilterClass',
+    ]
+    assert RQLFilterBackend._CACHES == {}
+
+
+@pytest.mark.django_db
+def test_warm_up_filter_instances_reused(api_client, clear_cache, mocker):
+    warm_up_filter_classes()
+    cache = dict(_FilterClassCache.CACHE)
+
+    build_spy = mocker.spy(RQLFilterBackend, '_get_filter_instance')
+    response = api_client.get(reverse('book-list') + '?title=F')
+    assert response.status_code == 200
+
+    assert build_spy.call_count == 1
+    assert _FilterClassCache.CACHE == cache
+
+
+def test_warm_up_filter_class_failure_is_skipped(clear_cache, mocker):
+    mocker.patch.object(
+        DynamicFilterClsViewSet,
+        'get_rql_filter_class',
+        side_effect=AttributeError,
+    )
+    log = mocker.patch('dj_rql.drf.warm_up.logger')
+
+    assert warm_up_filter_classes() == 4
+    assert not any('DynamicFilterClsViewSet' in key for key in _FilterClassCache.CACHE)
+    assert log.warning.call_count == 3
+
+
+@pytest.mark.django_db
+def test_warm_up_query_caches(api_client, clear_cache, django_assert_num_queries):
+    book = Book.objects.create(title='F')
+    queries = [
+        '# Common queries',
+        '',
+        reverse('book-list') + '?title=F',
+        reverse('select-list') + '?select(-id)',
+        reverse('dynamicfiltercls-detail', [book.pk]) + '?title=F',
+        reverse('nofiltercls-list') + '?title=F',
+    ]
+
+    assert warm_up_query_caches(queries) == 3
+    assert {key: len(cache) for key, cache in RQLFilterBackend._CACHES.items()} == {
+        'tests.dj_rf.view.DRFViewSet+tests.dj_rf.filters.BooksFilterClass': 1,
+        'tests.dj_rf.view.SelectViewSet+tests.dj_rf.filters.SelectBooksFilterClass': 1,
+        'tests.dj_rf.view.DynamicFilterClsViewSet'
+        '+tests.dj_rf.filters.SelectDetailedBooksFilterClass': 1,
+    }
+
+    cache = RQLFilterBackend._CACHES[
+        'tests.dj_rf.view.DRFViewSet+tests.dj_rf.filters.BooksFilterClass'
+    ]
+    response = api_client.get(reverse('book-list') + '?title=F')
+    assert response.data == [{'id': book.pk}]
+    assert cache.currsize == 1
+
+
+@pytest.mark.django_db
+def test_warm_up_query_failure_is_skipped(clear_cache, mocker):
+    log = mocker.patch('dj_rql.drf.warm_up.logger')
+
+    assert warm_up_query_caches(['/unknown/', reverse('book-list') + '?title=F']) == 1
+    assert log.warning.call_count == 1
+
+
+@pytest.mark.django_db
+def test_warm_up_queries_file(clear_cache, tmp_path):
+    queries_file = tmp_path / 'queries.txt'
+    queries_file.write_text('{0}?title=F\n'.format(reverse('book-list')))
+
+    assert warm_up(queries_file=str(queries_file)) == 7
+    assert len(RQLFilterBackend._CACHES) == 1
+
+
+def test_app_config_warm_up_disabled(clear_cache, mocker):
+    start_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_start')
+    connect_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_first_request')
+
+    apps.get_app_config('dj_rql').ready()
+    start_mock.assert_not_called()
+    connect_mock.assert_not_called()
+
+
+def test_app_config_warm_up_enabled(clear_cache, mocker, settings):
+    settings.RQL_WARM_UP = True
+    settings.RQL_WARM_UP_QUERIES_FILE = 'queries.txt'
+    start_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_start')
+    connect_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_first_request')
+
+    apps.get_app_config('dj_rql').ready()
+    start_mock.assert_called_once_with(queries_file='queries.txt')
+    connect_mock.assert_not_called()
+
+
+def test_app_config_warm_up_on_first_request(clear_cache, mocker, settings):
+    settings.RQL_WARM_UP = 'first_request'
+    start_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_start')
+    connect_mock = mocker.patch('dj_rql.drf.warm_up.warm_up_on_first_request')
+
+    apps.get_app_config('dj_rql').ready()
+    start_mock.assert_not_called()
+    connect_mock.assert_called_once_with(queries_file=None)
+
+
+@pytest.mark.parametrize(
+    'argv,is_warmed',
+    (
+        ([], True),
+        (['gunicorn', 'project.wsgi'], True),
+        (['/usr/bin/uwsgi', '--ini', 'uwsgi.ini'], True),
+        (['manage.py', 'runserver'], True),
+        (['/app/manage.py', 'migrate'], False),
+        (['manage.py'], False),
+        (['/usr/bin/django-admin', 'shell'], False),
+        (['/usr/lib/python3/site-packages/django/__main__.py', 'check'], False),
+    ),
+)
+def test_warm_up_on_start(clear_cache, mocker, argv, is_warmed):
+    warm_up_mock = mocker.patch('dj_rql.drf.warm_up.warm_up', return_value=7)
+
+    assert warm_up_on_start(queries_file='queries.txt', argv=argv) == (7 if is_warmed else None)
+    assert warm_up_mock.call_count == int(is_warmed)
+
+
+def test_warm_up_on_start_filter_classes(clear_cache):
+    assert warm_up_on_start(argv=['gunicorn']) == 6
+    assert len(_FilterClassCache.CACHE) == 6
+
+
+def test_warm_up_on_start_failure(clear_cache, mocker):
+    mocker.patch('dj_rql.drf.warm_up.warm_up', side_effect=OSError)
+    log = mocker.patch('dj_rql.drf.warm_up.logger')
+
+    assert warm_up_on_start(queries_file='missing.txt', argv=['gunicorn']) is None
+    assert log.warning.call_count == 1
+
+
+@pytest.mark.django_db
+def test_warm_up_on_first_request(api_client, clear_cache, mocker):
+    warm_up_mock = mocker.patch('dj_rql.drf.warm_up.warm_up')
+    warm_up_on_first_request(queries_file='queries.txt')
+    warm_up_mock.assert_not_called()
+
+    for _ in range(2):
+        assert api_client.get(reverse('book-list')).status_code == 200
+
+    warm_up_mock.assert_called_once_with(queries_file='queries.txt', urlconf=None)
+    assert not request_started.disconnect(dispatch_uid=WARM_UP_DISPATCH_UID)
+
+
+@pytest.mark.django_db
+def test_warm_up_on_first_request_failure(api_client, clear_cache, mocker):
+    mocker.patch('dj_rql.drf.warm_up.warm_up', side_effect=OSError)
+    log = mocker.patch('dj_rql.drf.warm_up.logger')
+    warm_up_on_first_request(queries_file='missing.txt')
+
+    assert api_client.get(reverse('book-list')).status_code == 200
+    assert log.warning.call_count == 1
+
+
+def test_filter_classes_built_concurrently(clear_cache):
+    first_lock = _FilterClassCache.get_lock('first')
+
+    assert _FilterClassCache.get_lock('first') is first_lock
+    assert _FilterClassCache.get_lock('second') is not first_lock
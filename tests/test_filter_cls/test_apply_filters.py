@@ -2,6 +2,7 @@
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
 
+import pickle
 from functools import partial
 
 import pytest
@@ -11,9 +12,9 @@ from django.utils.timezone import now
 from py_rql.constants import RQL_NULL, FilterLookups, ListOperators
 from py_rql.exceptions import RQLFilterLookupError, RQLFilterParsingError, RQLFilterValueError
 
-from dj_rql.filter_cls import RQLFilterClass
-from tests.dj_rf.filters import BooksFilterClass
-from tests.dj_rf.models import Author, Book, Publisher
+from dj_rql.filter_cls import NestedAutoRQLFilterClass, RQLFilterClass
+from tests.dj_rf.filters import BooksFilterClass, SelectBooksFilterClass
+from tests.dj_rf.models import Author, AutoMain, Book, Publisher
 from tests.test_filter_cls.utils import book_qs
 
 
@@ -711,3 +712,124 @@ def test_complex_nested_queries(query):
     other_book2 = Book.objects.create(amazon_rating=4.5, author=other_author, title="Madame Bovary")
 
     assert apply_filters(query) == [other_book, other_book2]
+
+
+class LazySelectBooksFilterClass(SelectBooksFilterClass):
+    LAZY_NAMESPACES = True
+
+
+@pytest.mark.parametrize(
+    'query',
+    (
+        '',
+        'author.email=a@example.com',
+        'and(page.number=1,author.publisher.id=2)',
+        'author=t(email=a@example.com)',
+        'ordering(-author.email,d_id)',
+        'select(author)',
+        'select(-page)',
+        'select(author,-author.publisher)',
+        'select(author.publisher.id)',
+        'author_publisher.id=1&select(-author_publisher)',
+    ),
+)
+def test_lazy_namespaces_apply_filters(query):
+    lazy_instance = LazySelectBooksFilterClass(book_qs)
+    _, lazy_qs = LazySelectBooksFilterClass(book_qs, instance=lazy_instance).apply_filters(query)
+    _, qs = SelectBooksFilterClass(book_qs).apply_filters(query)
+
+    assert str(lazy_qs.query) == str(qs.query)
+    assert lazy_qs.select_data == qs.select_data
+    assert lazy_qs._prefetch_related_lookups == qs._prefetch_related_lookups
+
+
+def test_lazy_namespaces_search():
+    instance = LazySelectBooksFilterClass(book_qs)
+    _, qs = instance.apply_filters('search=abc')
+
+    assert set(instance.schema.lazy_namespaces.keys()) == {
+        'page',
+        'author_publisher',
+        'author.publisher',
+    }
+    assert '"dj_rf_author"."email" LIKE %abc%' in str(qs.query)
+    assert str(qs.query) == str(
+        SelectBooksFilterClass(book_qs).apply_filters('search=abc')[1].query
+    )
+
+
+def test_lazy_namespaces_hidden_not_compiled():
+    instance = LazySelectBooksFilterClass(book_qs)
+    instance.apply_filters('select(-page)')
+
+    assert set(instance.schema.lazy_namespaces.keys()) == {'author', 'page', 'author_publisher'}
+
+
+def test_lazy_namespaces_not_referenced_not_compiled():
+    class Cls(NestedAutoRQLFilterClass):
+        MODEL = AutoMain
+        DEPTH = 3
+        LAZY_NAMESPACES = True
+
+    instance = Cls(AutoMain.objects.all())
+    lazy_namespaces = set(instance.schema.lazy_namespaces.keys())
+    filter_names = set(instance.filters.keys())
+
+    instance.apply_filters('common_str=a')
+    assert set(instance.schema.lazy_namespaces.keys()) == lazy_namespaces
+    assert set(instance.filters.keys()) == filter_names
+
+    instance.apply_filters('select(parent.common_str)')
+    compiled_lazy_namespaces = set(instance.schema.lazy_namespaces.keys())
+    assert 'parent' not in compiled_lazy_namespaces
+    assert lazy_namespaces - {'parent'} <= compiled_lazy_namespaces
+    assert 'parent.common_str' in instance.filters
+
+
+@pytest.mark.parametrize(
+    'query',
+    (
+        '',
+        'title=abc',
+        'and(page.number=1,author.publisher.id=2)',
+        'author=t(email=a@example.com)&limit=10',
+        'ordering(-author.email,d_id)',
+        'ordering(d_id)&select(-page)',
+        'select(author,-author.publisher)',
+        'author_publisher.id=1&select(-author_publisher)',
+    ),
+)
+@pytest.mark.parametrize('filter_cls', (SelectBooksFilterClass, LazySelectBooksFilterClass))
+def test_apply_query_plan(filter_cls, query):
+    rql_ast, qs = SelectBooksFilterClass(book_qs).apply_filters(query)
+
+    filter_instance = filter_cls(book_qs)
+    filter_instance.apply_filters(query)
+    query_plan = pickle.loads(pickle.dumps(filter_instance.query_plan))
+
+    plan_rql_ast, plan_qs = filter_cls(book_qs).apply_query_plan(query_plan)
+    assert plan_rql_ast == rql_ast
+    assert str(plan_qs.query) == str(qs.query)
+    assert plan_qs.select_data == qs.select_data
+    assert plan_qs._prefetch_related_lookups == qs._prefetch_related_lookups
+
+
+def test_apply_query_plan_search():
+    filter_instance = SelectBooksFilterClass(book_qs)
+    _, qs = filter_instance.apply_filters('search=abc')
+    query_plan = pickle.loads(pickle.dumps(filter_instance.query_plan))
+
+    _, plan_qs = SelectBooksFilterClass(book_qs).apply_query_plan(query_plan)
+    assert str(plan_qs.query) == str(qs.query)
+
+
+def test_apply_query_plan_distinct():
+    filter_instance = BooksFilterClass(book_qs)
+    filter_instance.apply_filters('ordering(published.at)')
+    query_plan = filter_instance.query_plan
+
+    assert query_plan.distinct
+    assert query_plan.ordering == ('published_at',)
+
+    _, qs = BooksFilterClass(book_qs).apply_query_plan(query_plan)
+    assert qs.query.distinct
@@ -0,0 +1,167 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import pytest
+from py_rql.constants import FilterLookups as FL
+from py_rql.exceptions import RQLFilterLookupError, RQLFilterParsingError
+
+from dj_rql import indexes
+from dj_rql._compiler import FilterSchemaCompiler
+from dj_rql.indexes import get_cached_model_indexes
+from tests.dj_rf.filters import IndexedItemFilterClass
+from tests.dj_rf.models import IndexedItem, Publisher
+
+
+class IndexPolicyFilterClass(IndexedItemFilterClass):
+    INDEX_POLICY = True
+    INDEX_POLICY_OVERRIDES = {'publisher.name': {FL.EQ}}
+    ALLOWED_ORDERING_PERMUTATIONS_IN_QUERY = None
+
+
+def get_instance(filter_cls=IndexPolicyFilterClass):
+    return filter_cls(IndexedItem.objects.all())
+
+
+def apply_filters(query, filter_cls=IndexPolicyFilterClass):
+    return get_instance(filter_cls).apply_filters(query)[1]
+
+
+def test_lookups_restricted():
+    filters = get_instance().filters
+
+    assert filters['id']['lookups'] == FL.numeric() - {FL.NE, FL.OUT}
+    assert filters['id']['index_restricted'] == {FL.NE, FL.OUT}
+    assert filters['name']['lookups'] == {FL.EQ, FL.IN}
+    assert filters['code']['lookups'] == {FL.EQ, FL.IN}
+    assert 'index_restricted' not in filters['code']
+    assert filters['description']['lookups'] == {FL.LIKE}
+    assert filters['description']['prefix_lookups'] == {FL.LIKE}
+    assert filters['rating']['lookups'] == set()
+    assert filters['rating']['index_restricted'] == FL.numeric() | {'ordering'}
+    assert filters['publisher.name']['lookups'] == {FL.EQ}
+
+
+def test_model_indexes_cached(mocker):
+    get_cached_model_indexes.cache_clear()
+    get_model_indexes = mocker.spy(indexes, 'get_model_indexes')
+
+    get_instance()
+    get_instance()
+
+    assert [c.args for c in get_model_indexes.call_args_list] == [(IndexedItem,), (Publisher,)]
+
+
+@pytest.mark.django_db
+def test_negative_lookups_override():
+    class Cls(IndexPolicyFilterClass):
+        INDEX_POLICY_OVERRIDES = {'id': {FL.NE, FL.OUT}}
+
+    assert get_instance(Cls).filters['id']['lookups'] == FL.numeric()
+    assert list(apply_filters('and(ne(id,1),out(id,(2,3)))', Cls)) == []
+
+
+def test_ordering_and_search_restricted():
+    instance = get_instance()
+
+    assert instance.ordering_filters == {'name', 'created_at'}
+    assert instance.search_filters == set()
+
+
+def test_policy_is_disabled_by_default():
+    instance = get_instance(IndexedItemFilterClass)
+
+    assert instance.filters['rating']['lookups'] == FL.numeric()
+    assert 'index_restricted' not in instance.filters['rating']
+    assert instance.ordering_filters == {'name', 'rating', 'created_at'}
+
+
+def test_override_all():
+    class Cls(IndexPolicyFilterClass):
+        INDEX_POLICY_OVERRIDES = {'rating': True}
+
+    instance = get_instance(Cls)
+
+    assert instance.filters['rating']['lookups'] == FL.numeric()
+    assert 'rating' in instance.ordering_filters
+    assert instance.filters['publisher.name']['lookups'] == set()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'query',
+    (
+        'eq(id,1)',
+        'in(id,(1,2))',
+        'ge(id,1)',
+        'name=abc',
+        'in(code,(a,b))',
+        'like(description,abc*)',
+        'like(description,abc)',
+        'eq(publisher.name,abc)',
+        'ordering(-created_at,name)',
+    ),
+)
+def test_allowed_queries(query):
+    assert list(apply_filters(query)) == []
+
+
+@pytest.mark.parametrize(
+    'query,filter_name,lookup',
+    (
+        ('ne(id,1)', 'id', FL.NE),
+        ('out(id,(1,2))', 'id', FL.OUT),
+        ('eq(rating,1)', 'rating', FL.EQ),
+        ('eq(rating,null())', 'rating', FL.NULL),
+        ('ilike(name,abc*)', 'name', FL.I_LIKE),
+        ('like(publisher.name,abc)', 'publisher.name', FL.LIKE),
+    ),
+)
+def test_restricted_lookups(query, filter_name, lookup):
+    with pytest.raises(RQLFilterLookupError) as e:
+        apply_filters(query)
+
+    assert e.value.details['filter'] == filter_name
+    assert e.value.details['lookup'] == lookup
+    assert e.value.details['error'] == "Lookup can't use an index."
+
+
+@pytest.mark.parametrize('value', ('*abc', 'a*c', '*abc*', '*'))
+def test_leading_wildcard(value):
+    with pytest.raises(RQLFilterLookupError) as e:
+        apply_filters('like(description,{0})'.format(value))
+
+    assert e.value.details['error'] == "Pattern with a leading wildcard can't use an index."
+
+
+def test_restricted_ordering():
+    with pytest.raises(RQLFilterLookupError) as e:
+        apply_filters('ordering(rating)')
+
+    assert e.value.details == {
+        'filter': 'rating',
+        'lookup': 'ordering',
+        'error': "Ordering can't use an index.",
+    }
+
+
+def test_not_ordering_filter():
+    with pytest.raises(RQLFilterParsingError):
+        apply_filters('ordering(code)')
+
+
+def test_compiled_schema():
+    code = FilterSchemaCompiler(IndexPolicyFilterClass).render()
+
+    assert "'ne', 'null', 'ordering', 'out'})" in code
+    assert "prefix_lookups=frozenset({'like'})" in code
+
+
+def test_invalid_overrides():
+    class Cls(IndexPolicyFilterClass):
+        INDEX_POLICY_OVERRIDES = [('rating', True)]
+
+    with pytest.raises(AssertionError) as e:
+        get_instance(Cls)
+
+    assert str(e.value) == 'Index policy overrides must be a dict.'
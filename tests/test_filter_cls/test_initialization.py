@@ -2,14 +2,23 @@
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
 
+import pickle
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
+
 import pytest
 from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.options import Options
+from django.test.utils import isolate_apps
 from py_rql.constants import RESERVED_FILTER_NAMES, RQL_NULL, FilterLookups as FL
 
+from dj_rql._dataclasses import FilterItem
 from dj_rql.filter_cls import AutoRQLFilterClass, NestedAutoRQLFilterClass, RQLFilterClass
 from dj_rql.utils import assert_filter_cls
 from tests.data import get_book_filter_cls_ordering_data, get_book_filter_cls_search_data
-from tests.dj_rf.filters import AUTHOR_FILTERS, BooksFilterClass
+from tests.dj_rf.filters import AUTHOR_FILTERS, BooksFilterClass, SelectBooksFilterClass
 from tests.dj_rf.models import Author, AutoMain, Book
 
 
@@ -632,3 +641,346 @@ def test_nested_auto_building_filters_depth_3_described_and_exclusions():
         'self.self.self.id',
     }.issubset(filter_set)
     assert {'parent.parent.id', 'related1.id', 'common_int'}.isdisjoint(filter_set)
+
+
+def test_compiled_schema_shared_between_instances():
+    instance = BooksFilterClass(empty_qs)
+    request_instance = BooksFilterClass(empty_qs, instance=instance)
+
+    assert request_instance.schema is instance.schema
+    assert request_instance.filters is instance.schema.filters
+    assert request_instance.select_tree is instance.schema.select_tree
+    assert request_instance.ordering_filters is instance.schema.ordering_filters
+    assert request_instance.search_filters is instance.schema.search_filters
+    assert request_instance.default_exclusions is instance.schema.default_exclusions
+
+
+def test_compiled_schema_sets_extendable():
+    class Cls(BooksFilterClass):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.ordering_filters |= {'github_stars'}
+
+    instance = Cls(empty_qs)
+    request_instance = Cls(empty_qs, instance=instance)
+
+    assert 'github_stars' in request_instance.ordering_filters
+    assert 'github_stars' not in instance.schema.ordering_filters
+    assert 'github_stars' not in BooksFilterClass(empty_qs, instance=instance).ordering_filters
+
+
+def test_compiled_schema_sets_frozen():
+    instance = BooksFilterClass(empty_qs)
+    request_instance = BooksFilterClass(empty_qs, instance=instance)
+
+    assert isinstance(request_instance.ordering_filters, frozenset)
+    assert isinstance(request_instance.search_filters, frozenset)
+    assert isinstance(request_instance.default_exclusions, frozenset)
+    assert request_instance.__dict__.keys().isdisjoint(BooksFilterClass._SCHEMA_ATTRIBUTES)
+
+    with pytest.raises(AttributeError):
+        request_instance.ordering_filters.add('github_stars')
+
+
+def test_compiled_schema_extensions_kept_on_lazy_compilation():
+    class Cls(LazySelectBooksFilterClass):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.ordering_filters |= {'github_stars'}
+
+    instance = Cls(empty_qs)
+    request_instance = Cls(empty_qs, instance=instance)
+    request_instance.compile_filters(['author.email'])
+
+    assert {'github_stars', 'author.email'}.issubset(request_instance.ordering_filters)
+    assert {'github_stars', 'author.email'}.issubset(instance.ordering_filters)
+    assert 'author.email' in instance.schema.ordering_filters
+    assert 'github_stars' not in instance.schema.ordering_filters
+
+
+def test_compiled_schema_immutable():
+    schema = BooksFilterClass(empty_qs).schema
+
+    with pytest.raises(AttributeError) as e:
+        schema.filters = {}
+
+    assert str(e.value) == 'Compiled filter schema is immutable.'
+
+    with pytest.raises(AttributeError):
+        del schema.select_tree
+
+
+def test_filter_items_share_lookups():
+    class Cls(NestedAutoRQLFilterClass):
+        MODEL = AutoMain
+        DEPTH = 2
+
+    filters = Cls(AutoMain.objects.none()).filters
+    items = [item for item in filters.values() if not isinstance(item, list)]
+
+    assert len({id(item['lookups']) for item in items}) == len({item['lookups'] for item in items})
+    assert len({id(item['null_values']) for item in items}) == 1
+    assert not hasattr(items[0], '__dict__')
+
+
+def test_filter_item_dict_compatible():
+    item = BooksFilterClass(empty_qs).filters['id']
+
+    assert item == {
+        'field': Book._meta.pk,
+        'orm_route': 'id',
+        'lookups': FL.numeric(),
+        'null_values': {RQL_NULL},
+        'distinct': False,
+        'hidden': False,
+    }
+    assert 'use_repr' not in item
+    assert item.get('custom') is None
+
+    item_copy = copy(item)
+    item_copy['oa'] = {}
+    assert isinstance(item_copy, dict)
+
+    with pytest.raises(AttributeError):
+        item.orm_route = 'author'
+
+
+def test_filter_item_copies():
+    item = BooksFilterClass(empty_qs).filters['author.email']
+
+    item_copy = item.copy()
+    assert isinstance(item_copy, dict)
+    assert item_copy == item
+
+    item_deepcopy = deepcopy(item)
+    assert isinstance(item_deepcopy, dict)
+    assert item_deepcopy == item
+    assert item_deepcopy['lookups'] is not item['lookups']
+
+
+def test_filter_item_pickle():
+    item = BooksFilterClass(empty_qs).filters['author.email']
+
+    unpickled_item = pickle.loads(pickle.dumps(item))
+    assert isinstance(unpickled_item, FilterItem)
+    assert unpickled_item == item
+
+
+def test_select_tree_deepcopy():
+    select_tree = SelectBooksFilterClass(empty_qs).select_tree
+
+    tree_copy = deepcopy(select_tree)
+    assert isinstance(tree_copy['author'], dict)
+    assert isinstance(tree_copy['author']['fields']['email'], dict)
+    assert tree_copy.keys() == select_tree.keys()
+    assert tree_copy['author']['fields']['email']['path'] == 'author.email'
+
+
+def test_filter_item_assignment():
+    item = BooksFilterClass(empty_qs).filters['id'].copy()
+    item = FilterItem(**item)
+
+    item['hidden'] = True
+    item['use_repr'] = True
+    del item['use_repr']
+
+    assert item['hidden'] is True
+    assert 'use_repr' not in item
+
+    with pytest.raises(KeyError):
+        item['unknown'] = True
+
+    with pytest.raises(KeyError):
+        del item['openapi']
+
+
+def test_filter_items_memory_footprint():
+    field = Book._meta.pk
+
+    def build_items(item_cls):
+        return [
+            item_cls(
+                field=field,
+                orm_route='author__id',
+                lookups=FL.numeric(),
+                null_values={RQL_NULL},
+                distinct=False,
+                hidden=False,
+            )
+            for _ in range(1000)
+        ]
+
+    def get_allocated_size(item_cls):
+        tracemalloc.start()
+        items = build_items(item_cls)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        assert len(items) == 1000
+        return size
+
+    assert get_allocated_size(FilterItem) * 4 < get_allocated_size(dict)
+
+
+def _build_synthetic_models(apps, count=50):
+    synthetic_models = []
+    for index in range(count):
+        attrs = {
+            '__module__': __name__,
+            'Meta': type('Meta', (), {'apps': apps, 'app_label': 'dj_rf'}),
+            'name': models.CharField(max_length=16),
+            'value': models.IntegerField(),
+        }
+        for offset in (1, 2):
+            attrs['next{0}'.format(offset)] = models.ForeignKey(
+                'Synthetic{0}'.format((index + offset) % count),
+                on_delete=models.CASCADE,
+                related_name='previous{0}'.format(offset),
+            )
+
+        synthetic_models.append(type('Synthetic{0}'.format(index), (models.Model,), attrs))
+
+    return synthetic_models
+
+
+@pytest.mark.parametrize(
+    'depth,namespaces_count,introspections_count',
+    ((1, 4, 5), (2, 16, 17), (3, 52, 45), (4, 160, 95)),
+)
+def test_nested_auto_subtrees_shared(mocker, depth, namespaces_count, introspections_count):
+    with isolate_apps('tests.dj_rf') as apps:
+        synthetic_models = _build_synthetic_models(apps)
+
+        class Cls(NestedAutoRQLFilterClass):
+            MODEL = synthetic_models[0]
+            DEPTH = depth
+            SELECT = False
+
+        spy = mocker.spy(Options, 'get_fields')
+        filters = Cls(None).filters
+
+    namespaces = {f_name.rsplit('.', 1)[0] for f_name in filters if '.' in f_name}
+    assert len(namespaces) == namespaces_count
+    assert filters['previous1.name']['orm_route'] == 'previous1__name'
+
+    # Without shared subtrees every namespace path (and the root model) is introspected
+    assert spy.call_count == introspections_count
+
+
+def _get_comparable_filters(filters):
+    return {
+        f_name: [dict(i) for i in item] if isinstance(item, list) else dict(item)
+        for f_name, item in filters.items()
+    }
+
+
+@pytest.mark.parametrize('select', (True, False))
+def test_nested_auto_built_subtrees_copied(mocker, select):
+    with isolate_apps('tests.dj_rf') as apps:
+        synthetic_models = _build_synthetic_models(apps)
+
+        class Cls(NestedAutoRQLFilterClass):
+            MODEL = synthetic_models[0]
+            DEPTH = 4
+            SELECT = select
+
+        copy_spy = mocker.spy(Cls, '_copy_subtree')
+        instance = Cls(None)
+        assert copy_spy.call_count > 0
+        assert instance._built_subtrees == {}
+
+        mocker.patch.object(
+            Cls,
+            '_build_namespace_filters',
+            RQLFilterClass._build_namespace_filters,
+        )
+        built_instance = Cls(None)
+
+    assert list(instance.filters) == list(built_instance.filters)
+    assert _get_comparable_filters(instance.filters) == _get_comparable_filters(
+        built_instance.filters,
+    )
+    assert instance.filters['next1.next2.previous1.name']['orm_route'] == (
+        'next1__next2__previous1__name'
+    )
+    assert instance.ordering_filters == built_instance.ordering_filters
+    assert instance.search_filters == built_instance.search_filters
+    assert _get_comparable_select_tree(instance.select_tree) == _get_comparable_select_tree(
+        built_instance.select_tree,
+    )
+
+
+class LazySelectBooksFilterClass(SelectBooksFilterClass):
+    LAZY_NAMESPACES = True
+
+
+def test_lazy_namespaces_not_compiled():
+    instance = LazySelectBooksFilterClass(empty_qs)
+
+    assert set(instance.schema.lazy_namespaces.keys()) == {'author', 'page', 'author_publisher'}
+    assert 'author.email' not in instance.filters
+    assert 'author.email' not in instance.ordering_filters
+    assert instance.select_tree['author']['fields'] == {}
+    assert instance.select_tree['author']['hidden']
+
+
+def test_lazy_namespaces_compiled_on_filter_use():
+    instance = LazySelectBooksFilterClass(empty_qs)
+    schema = instance.schema
+    request_instance = LazySelectBooksFilterClass(empty_qs, instance=instance)
+
+    assert request_instance.get_filter_base_item('author.publisher.id')['orm_route'] == (
+        'author__publisher__id'
+    )
+
+    assert set(instance.schema.lazy_namespaces.keys()) == {'page', 'author_publisher'}
+    assert instance.schema is request_instance.schema
+    assert {'author.email', 'author.publisher.id'}.issubset(instance.filters.keys())
+    assert 'author.email' in instance.ordering_filters
+    assert 'publisher' in instance.select_tree['author']['fields']
+
+    # Previously published schema is not changed
+    assert 'author.email' not in schema.filters
+    assert schema.select_tree['author']['fields'] == {}
+
+
+def _get_comparable_select_tree(select_tree):
+    return {
+        name: dict(
+            node,
+            fields=_get_comparable_select_tree(node['fields']),
+            qs=node['qs'] and (type(node['qs']), node['qs'].relations),
+        )
+        for name, node in select_tree.items()
+    }
+
+
+def test_lazy_namespaces_compile_all():
+    lazy_instance = LazySelectBooksFilterClass(empty_qs)
+    lazy_instance.compile_filters()
+
+    instance = SelectBooksFilterClass(empty_qs)
+    assert not lazy_instance.schema.lazy_namespaces
+    assert lazy_instance.filters == instance.filters
+    assert lazy_instance.ordering_filters == instance.ordering_filters
+    assert lazy_instance.search_filters == instance.search_filters
+    assert lazy_instance.default_exclusions == instance.default_exclusions
+    assert lazy_instance.annotations == instance.annotations
+    assert _get_comparable_select_tree(lazy_instance.select_tree) == _get_comparable_select_tree(
+        instance.select_tree,
+    )
+
+
+def test_lazy_namespaces_concurrent_compilation():
+    instance = LazySelectBooksFilterClass(empty_qs)
+    filter_names = ('author.email', 'page.number', 'author_publisher.id') * 10
+
+    def get_filter_item(filter_name):
+        request_instance = LazySelectBooksFilterClass(empty_qs, instance=instance)
+        return request_instance.get_filter_base_item(filter_name)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(get_filter_item, filter_names))
+
+    assert set(instance.schema.lazy_namespaces.keys()) == {'author.publisher'}
+    assert set(filter_names).issubset(instance.filters.keys())
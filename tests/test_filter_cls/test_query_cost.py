@@ -0,0 +1,76 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+import pytest
+from django.db.models import Q
+
+from dj_rql._dataclasses import QueryPlan
+from tests.dj_rf.filters import BooksFilterClass
+from tests.test_filter_cls.utils import book_qs
+
+
+def get_cost(query):
+    instance = BooksFilterClass(book_qs)
+    instance.apply_filters(query)
+    return instance.get_query_cost()
+
+
+@pytest.mark.parametrize(
+    'query,cost',
+    (
+        ('', 0),
+        ('title=a', 1),
+        ('in(title,(a,b,c))', 3),
+        ('like(title,abc*)', 2),
+        ('like(title,*abc)', 10),
+        ('ilike(title,*abc*)', 10),
+        ('eq(author.publisher.id,1)', 1 + 2 * 2),
+        # Distinct filter with a join
+        ('eq(author.email,x)', 1 + 2 + 10),
+        ('ordering(-published.at)', 1 + 10),
+        ('limit=10&offset=5000', 50),
+        ('and(title=a,title=b)&offset=100', 2 + 1),
+    ),
+)
+def test_query_cost(query, cost):
+    assert get_cost(query) == pytest.approx(cost)
+
+
+def test_search_cost_is_higher_than_filters():
+    assert get_cost('search=abc') > 10 * get_cost('title=abc')
+
+
+def test_query_cost_of_query_plan():
+    instance = BooksFilterClass(book_qs)
+    instance.apply_filters('title=a')
+    query_plan = instance.query_plan
+
+    instance.apply_filters('')
+    assert instance.get_query_cost() == 0
+    assert instance.get_query_cost(query_plan) == 1
+
+
+def test_query_cost_joins_and_lists():
+    instance = BooksFilterClass(book_qs)
+    instance.apply_filters('title=a')
+    query_plan = instance.query_plan
+
+    q = Q(pages__number__in=[1, 2, 3, 4, 5]) | Q(author__publisher__name__icontains='a')
+    query_plan = QueryPlan(query_plan.rql_ast, frozenset(), q, ('author__name',), False, ())
+
+    # Lookups, list values, ordering, to-many join (pages) and joins (author, author__publisher)
+    assert instance.get_query_cost(query_plan) == pytest.approx(1 + 10 + 0.5 + 1 + 5 + 2 * 2)
+
+
+def test_query_cost_weights():
+    class Cls(BooksFilterClass):
+        QUERY_COST_WEIGHTS = dict(BooksFilterClass.QUERY_COST_WEIGHTS, lookup=7)
+
+    instance = Cls(book_qs)
+    instance.apply_filters('title=a')
+    assert instance.get_query_cost() == 7
+
+
+def test_query_cost_without_query():
+    assert BooksFilterClass(book_qs).get_query_cost() == 0
@@ -2,9 +2,16 @@
 #  Copyright © 2025 CloudBlue. All rights reserved.
 #
 
+import django
 import pytest
 from django.core.exceptions import FieldError
-from django.db.models import CharField, IntegerField, Value
+from django.db.models import (
+    CharField,
+    IntegerField,
+    Prefetch,
+    Q,
+    Value,
+)
 from py_rql.exceptions import RQLFilterParsingError
 
 from dj_rql.fields import SelectField
@@ -17,7 +24,7 @@ from dj_rql.qs import (
     PR,
     SR,
 )
-from tests.dj_rf.models import Author, Book
+from tests.dj_rf.models import Author, Book, Page
 from tests.test_filter_cls.utils import book_qs
 
 
@@ -820,3 +827,267 @@ def test_deselect_namespace():
 
     _, qs = Cls(book_qs).apply_filters('select(-ns,-ns2)')
     assert not qs.query.select_related
+
+
+class PrefetchOnlyCls(SelectFilterCls):
+    FILTERS = (
+        'id',
+        {
+            'namespace': 'pages',
+            'qs': PR('pages'),
+            'prefetch_only': True,
+            'filters': (
+                'number',
+                {
+                    'filter': 'text',
+                    'source': 'content',
+                },
+                {
+                    'namespace': 'book',
+                    'qs': NSR('book'),
+                    'filters': ('id', 'title'),
+                },
+            ),
+        },
+    )
+
+
+def _get_single_prefetch(qs):
+    assert len(qs._prefetch_related_lookups) == 1
+
+    prefetch = qs._prefetch_related_lookups[0]
+    assert isinstance(prefetch, Prefetch)
+    assert prefetch.prefetch_to == 'pages'
+    return prefetch
+
+
+def test_prefetch_only_select_data():
+    _, qs = PrefetchOnlyCls(book_qs).apply_filters('select(-pages.text,-pages.book)')
+
+    prefetch_qs = _get_single_prefetch(qs).queryset
+    assert prefetch_qs.query.deferred_loading == ({'uuid', 'book', 'number'}, False)
+    assert not prefetch_qs.query.select_related
+
+
+def test_prefetch_only_nested_select_related_pushed_down():
+    _, qs = PrefetchOnlyCls(book_qs).apply_filters('')
+
+    prefetch_qs = _get_single_prefetch(qs).queryset
+    assert prefetch_qs.query.deferred_loading == (
+        {'uuid', 'book', 'number', 'content'},
+        False,
+    )
+    assert prefetch_qs.query.select_related == {'book': {}}
+
+
+def test_prefetch_only_extra_fields():
+    class Cls(SelectFilterCls):
+        FILTERS = (
+            {
+                'namespace': 'pages',
+                'qs': PR('pages'),
+                'prefetch_only': ('content',),
+                'filters': ('number',),
+            },
+        )
+
+    _, qs = Cls(book_qs).apply_filters('select(-pages.number)')
+
+    prefetch_qs = _get_single_prefetch(qs).queryset
+    assert prefetch_qs.query.deferred_loading == ({'uuid', 'book', 'content'}, False)
+
+
+def test_prefetch_only_wrong_optimization():
+    class Cls(SelectFilterCls):
+        FILTERS = (
+            {
+                'namespace': 'pages',
+                'qs': SR('pages'),
+                'prefetch_only': True,
+                'filters': ('number',),
+            },
+        )
+
+    with pytest.raises(AssertionError) as e:
+        Cls(book_qs)
+
+    assert str(e.value) == "pages: prefetch options require a 'PrefetchRelated' optimization."
+
+
+@pytest.mark.django_db
+def test_prefetch_only_queries(django_assert_num_queries):
+    book = Book.objects.create(title='title')
+    Page.objects.create(book=book, number=1, content='text')
+
+    _, qs = PrefetchOnlyCls(book_qs).apply_filters('select(-pages.text)')
+
+    with django_assert_num_queries(2):
+        page = list(qs)[0].pages.all()[0]
+        assert page.number == 1
+        assert page.book.title == 'title'
+
+    assert page.get_deferred_fields() == {'content'}
+
+
+class FilterPrefetchCls(SelectFilterCls):
+    FILTERS = (
+        'id',
+        'title',
+        {
+            'namespace': 'pages',
+            'qs': PR('pages'),
+            'filter_prefetch': True,
+            'filters': ('number', 'content'),
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    'query,expected_q',
+    (
+        ('', Q()),
+        ('title=abc', Q()),
+        ('pages.number=gt=1', Q(number__gt=1)),
+        ('pages.number=gt=1&title=abc&pages.content=x', Q(number__gt=1) & Q(content__exact='x')),
+        ('pages=t(number=gt=1,content=x)', Q(number__gt=1) & Q(content__exact='x')),
+        ('or(pages.number=gt=1,pages.number=1)', Q(number__gt=1) | Q(number__exact=1)),
+        ('or(pages.number=gt=1,title=abc)', Q()),
+        ('not(pages.number=1)', ~Q(number__exact=1)),
+    ),
+)
+def test_filter_prefetch_q(query, expected_q):
+    _, qs = FilterPrefetchCls(book_qs).apply_filters(query)
+
+    prefetch = _get_single_prefetch(qs)
+    assert not prefetch.queryset.query.deferred_loading[0]
+    assert str(prefetch.queryset.query) == str(Page.objects.filter(expected_q).query)
+
+
+@pytest.mark.django_db
+def test_filter_prefetch_queries(django_assert_num_queries):
+    book = Book.objects.create()
+    Book.objects.create()
+    for number in range(1, 4):
+        Page.objects.create(book=book, number=number)
+
+    _, qs = FilterPrefetchCls(book_qs).apply_filters('pages.number=ge=2')
+
+    with django_assert_num_queries(2):
+        books = list(qs.distinct())
+        assert len(books) == 1
+        assert sorted(p.number for p in books[0].pages.all()) == [2, 3]
+
+
+class PrefetchLimitCls(SelectFilterCls):
+    FILTERS = (
+        'id',
+        {
+            'namespace': 'pages',
+            'qs': PR('pages'),
+            'prefetch_limit': 2,
+            'prefetch_ordering': ('-number',),
+            'filters': ('number',),
+        },
+    )
+
+
+@pytest.mark.skipif(django.VERSION < (4, 2), reason='Window filtering requires Django 4.2.')
+@pytest.mark.django_db
+def test_prefetch_limit_queries(django_assert_num_queries):
+    books = [Book.objects.create() for _ in range(2)]
+    for book in books:
+        for number in range(1, 4):
+            Page.objects.create(book=book, number=number)
+
+    _, qs = PrefetchLimitCls(book_qs).apply_filters('')
+
+    with django_assert_num_queries(2) as ctx:
+        for book in qs:
+            assert [p.number for p in book.pages.all()] == [3, 2]
+
+    assert 'ROW_NUMBER() OVER (PARTITION BY' in ctx.captured_queries[1]['sql']
+
+
+@pytest.mark.parametrize(
+    'options,error',
+    (
+        ({'prefetch_limit': 0}, "pages: 'prefetch_limit' must be a positive integer."),
+        ({'prefetch_limit': '1'}, "pages: 'prefetch_limit' must be a positive integer."),
+        (
+            {'prefetch_limit': 1, 'prefetch_ordering': ()},
+            "pages: 'prefetch_ordering' must be a list of field names.",
+        ),
+        (
+            {'prefetch_limit': 1, 'source': 'author', 'qs': PR('author')},
+            "pages: 'prefetch_limit' is supported only for reverse foreign keys.",
+        ),
+    ),
+)
+def test_prefetch_limit_misconfiguration(options, error):
+    item = {'namespace': 'pages', 'qs': PR('pages'), 'filters': ()}
+    item.update(options)
+
+    class Cls(SelectFilterCls):
+        FILTERS = (item,)
+
+    with pytest.raises(AssertionError) as e:
+        Cls(book_qs)
+
+    assert str(e.value) == error
+
+
+def test_prefetch_limit_old_django(mocker):
+    mocker.patch.object(django, 'VERSION', (4, 1, 0, 'final', 0))
+
+    with pytest.raises(AssertionError) as e:
+        PrefetchLimitCls(book_qs)
+
+    assert str(e.value) == "pages: 'prefetch_limit' requires Django 4.2 or later."
+
+
+def test_select_plan_cached_per_select(mocker):
+    filter_instance = PrefetchOnlyCls(book_qs)
+    build_spy = mocker.spy(PrefetchOnlyCls, '_build_select_data')
+
+    filter_instance.apply_filters('select(-pages.text)')
+    request_instance = PrefetchOnlyCls(book_qs, instance=filter_instance)
+    request_instance.apply_filters('select(-pages.text)')
+    _, qs = request_instance.apply_filters('select(+pages,-pages.text)')
+
+    assert build_spy.call_count == 2
+    assert list(filter_instance.schema.select_plans.keys()) == [
+        ('-pages.text',),
+        ('pages', '-pages.text'),
+    ]
+    assert qs.select_data['select'] == {'pages': True, 'pages.text': False}
+
+
+def test_select_plan_prefetch_built_per_request():
+    first_qs = FilterPrefetchCls(book_qs).apply_filters('pages.number=1')[1]
+    second_qs = FilterPrefetchCls(book_qs).apply_filters('pages.number=2')[1]
+
+    first_prefetch = _get_single_prefetch(first_qs)
+    second_prefetch = _get_single_prefetch(second_qs)
+    assert first_prefetch.queryset is not second_prefetch.queryset
+    assert str(first_prefetch.queryset.query) == str(Page.objects.filter(number=1).query)
+    assert str(second_prefetch.queryset.query) == str(Page.objects.filter(number=2).query)
+
+
+def test_select_plan_select_data_not_shared():
+    filter_instance = PrefetchOnlyCls(book_qs)
+
+    filter_instance.apply_filters('select(-pages.text)')[1].select_data['select']['id'] = False
+    _, qs = filter_instance.apply_filters('select(-pages.text)')
+
+    assert qs.select_data['select'] == {'pages.text': False}
+
+
+def test_select_plans_cache_bounded():
+    class Cls(PrefetchOnlyCls):
+        SELECT_PLANS_CACHE_SIZE = 2
+
+    filter_instance = Cls(book_qs)
+    for select in ('-pages', '-id', '-pages.text'):
+        filter_instance.apply_filters('select({0})'.format(select))
+
+    assert list(filter_instance.schema.select_plans.keys()) == [('-pages.text',)]
@@ -0,0 +1,131 @@
+#
+#  Copyright © 2025 CloudBlue. All rights reserved.
+#
+
+from dj_rql.indexes import (
+    IndexAdvisor,
+    IndexKinds,
+    IndexRecommendation,
+    ModelIndex,
+    build_index,
+    get_model_indexes,
+    is_indexed,
+)
+from tests.dj_rf.filters import BooksFilterClass, IndexedItemFilterClass
+from tests.dj_rf.models import Book, IndexedItem, Publisher
+
+
+def get_recommendations(usage=None, **kwargs):
+    instance = IndexedItemFilterClass(IndexedItem.objects.all())
+    return {
+        (r.model, r.kind, r.fields): r
+        for r in IndexAdvisor(instance, usage=usage).recommend(**kwargs)
+    }
+
+
+def test_get_model_indexes():
+    indexes = {index.fields: index for index in get_model_indexes(IndexedItem)}
+
+    assert set(indexes) == {
+        ('id',),
+        ('name',),
+        ('code',),
+        ('publisher',),
+        ('-created_at', 'rating'),
+        ('description',),
+    }
+    assert indexes[('description',)].opclasses == ('text_pattern_ops',)
+
+
+def test_is_indexed():
+    indexes = [
+        ModelIndex('a', ('-created_at', 'rating'), ()),
+        ModelIndex('b', ('name',), ('varchar_pattern_ops',)),
+    ]
+
+    assert is_indexed(indexes, ('created_at',))
+    assert is_indexed(indexes, ('-created_at', 'rating'))
+    assert is_indexed(indexes, ('created_at', '-rating'))
+    assert not is_indexed(indexes, ('created_at', 'rating'))
+    assert not is_indexed(indexes, ('rating',))
+    assert not is_indexed(indexes, ('name',))
+    assert is_indexed(indexes, ('name',), {'varchar_pattern_ops'})
+    assert not is_indexed(indexes, ('name',), {'gin_trgm_ops'})
+
+
+def test_recommendations():
+    recommendations = get_recommendations()
+
+    assert set(recommendations) == {
+        (IndexedItem, IndexKinds.COMPOSITE, ('rating', 'name')),
+        (IndexedItem, IndexKinds.TRIGRAM, ('name',)),
+        (Publisher, IndexKinds.PATTERN, ('name',)),
+        (Publisher, IndexKinds.TRIGRAM, ('name',)),
+    }
+
+    composite = recommendations[(IndexedItem, IndexKinds.COMPOSITE, ('rating', 'name'))]
+    assert composite.reasons == (
+        'ordering (rating,name)',
+        'rating (eq, ge, gt, in, le, lt, null)',
+        'ordering (rating)',
+    )
+    assert composite.weight is None
+
+
+def test_recommendations_kinds():
+    recommendations = get_recommendations(kinds=[IndexKinds.BTREE])
+
+    assert list(recommendations) == [(IndexedItem, IndexKinds.BTREE, ('rating',))]
+
+
+def test_recommendations_usage():
+    usage = {
+        'filter': {
+            'name': {'like': {'count': 5}, 'eq': {'count': 2}, 'ilike': {'count': 1}},
+            'rating': {'gt': {'count': 3}},
+        },
+        'ordering': {'rating': {'count': 4}, '-rating': {'count': 1}, 'name': {'count': 2}},
+    }
+
+    recommendations = list(get_recommendations(usage=usage, min_count=2).values())
+
+    assert [(r.model, r.kind, r.weight) for r in recommendations] == [
+        (IndexedItem, IndexKinds.COMPOSITE, 10),
+        (IndexedItem, IndexKinds.PATTERN, 7),
+    ]
+
+
+def test_recommendations_unused_pattern_lookups():
+    usage = {'filter': {'name': {'eq': {'count': 2}}, 'publisher.name': {'like': {'count': 1}}}}
+
+    recommendations = get_recommendations(usage=usage, kinds=[IndexKinds.PATTERN])
+
+    assert list(recommendations) == [(Publisher, IndexKinds.PATTERN, ('name',))]
+
+
+def test_recommendations_skip_custom_and_dynamic_filters():
+    instance = BooksFilterClass(Book.objects.all())
+    recommendations = IndexAdvisor(instance).recommend()
+
+    reasons = {reason.split(' ')[0] for r in recommendations for reason in r.reasons}
+    assert 'author.email' in reasons
+    assert not reasons & {'custom_filter', 'ordering_filter', 'anno_int', 'select_author'}
+
+
+def test_build_index():
+    index = build_index(
+        IndexRecommendation(IndexedItem, IndexKinds.PATTERN, ('description',), (), None),
+    )
+    assert index.opclasses == ['text_pattern_ops']
+    assert index.name.endswith('_pat')
+    assert len(index.name) <= 30
+
+    index = build_index(IndexRecommendation(IndexedItem, IndexKinds.TRIGRAM, ('name',), (), None))
+    assert type(index).__name__ == 'GinIndex'
+    assert index.opclasses == ['gin_trgm_ops']
+
+    index = build_index(
+        IndexRecommendation(IndexedItem, IndexKinds.COMPOSITE, ('-created_at', 'name'), (), None),
+    )
+    assert index.fields == ['-created_at', 'name']
+    assert index.name.endswith('_idx')
@@ -3,21 +3,29 @@
 #
 
 import pytest
-from django.db.models import IntegerField, Prefetch, Value
+from django.db.models import (
+    IntegerField,
+    Prefetch,
+    QuerySet,
+    Value,
+)
 
 from dj_rql.qs import (
     NPR,
     NSR,
+    PR,
+    SR,
     Annotation,
     Chain,
     DBOptimization,
     NestedPrefetchRelated,
     NestedSelectRelated,
+    OptimizationPlan,
     PrefetchRelated,
     SelectRelated,
     _NestedOptimizationMixin,
 )
-from tests.dj_rf.models import Book
+from tests.dj_rf.models import Author, Book, Page
 
 
 default_qs = Book.objects.all()
@@ -156,3 +164,103 @@ def test_chain_bad_relations():
 def test_nested_optimization_mixin_rebuild_nested():
     with pytest.raises(NotImplementedError):
         _NestedOptimizationMixin()._rebuild_nested(None)
+
+
+def test_plan_select_related_merged():
+    qs = (
+        OptimizationPlan()
+        .add(SelectRelated('author'), NSR('author__publisher'), SelectRelated('author'))
+        .apply(default_qs)
+    )
+    assert qs.query.select_related == {'author': {'publisher': {}}}
+
+
+def test_plan_to_one_prefetch_joined():
+    qs = OptimizationPlan().add(NPR('author__publisher', 'pages')).apply(default_qs)
+    assert qs.query.select_related == {'author': {'publisher': {}}}
+    assert qs._prefetch_related_lookups == ('pages',)
+
+
+def test_plan_to_one_prefetch_deferred_queryset():
+    qs = OptimizationPlan().add(PrefetchRelated('author')).apply(default_qs.only('title'))
+    assert not qs.query.select_related
+    assert qs._prefetch_related_lookups == ('author',)
+
+
+def test_plan_prefetch_lookups_deduplicated():
+    p_obj = Prefetch('pages', queryset=Page.objects.only('uuid', 'book'))
+    plan = OptimizationPlan().add(PR('pages'), NPR('pages', 'pages__book'), PR(p_obj))
+
+    qs = plan.apply(default_qs)
+    assert qs._prefetch_related_lookups == (p_obj, 'pages__book')
+
+
+def test_plan_prefetched_with_queryset_not_joined():
+    p_obj = Prefetch('author', queryset=Author.objects.all())
+    qs = OptimizationPlan().add(PR(p_obj, 'author__publisher')).apply(default_qs)
+    assert not qs.query.select_related
+    assert qs._prefetch_related_lookups == (p_obj, 'author__publisher')
+
+
+def test_plan_annotations_combined(mocker):
+    spy = mocker.spy(QuerySet, 'annotate')
+    first_anno = Annotation(a=Value(1, IntegerField()))
+
+    qs = (
+        OptimizationPlan()
+        .add(first_anno, Chain(Annotation(b=Value(2, IntegerField())), NSR('author')))
+        .add(Annotation(a=Value(3, IntegerField())))
+        .apply(default_qs)
+    )
+
+    assert spy.call_count == 1
+    assert list(qs.query.annotations.keys()) == ['a', 'b']
+    assert qs.query.annotations['a'].value == 1
+    assert qs.query.select_related == {'author': {}}
+
+
+def test_plan_custom_optimization_applied():
+    class Distinct(DBOptimization):
+        def apply(self, queryset):
+            return queryset.distinct()
+
+    qs = OptimizationPlan().add(Distinct('z'), SR('author')).apply(default_qs)
+    assert qs.query.distinct
+    assert qs.query.select_related == {'author': {}}
+
+
+def test_plan_same_prefetch_objects_deduplicated():
+    p_qs = Page.objects.all()
+    p_obj = Prefetch('pages', queryset=p_qs)
+
+    qs = OptimizationPlan().add(PR(p_obj), PR(Prefetch('pages', queryset=p_qs))).apply(default_qs)
+    assert qs._prefetch_related_lookups == (p_obj,)
+
+
+def test_plan_conflicting_prefetch_objects():
+    plan = OptimizationPlan().add(PR(Prefetch('pages', queryset=Page.objects.all())))
+
+    with pytest.raises(ValueError) as e:
+        plan.add(PR(Prefetch('pages', queryset=Page.objects.only('uuid', 'book'))))
+
+    assert str(e.value) == "'pages' lookup was already added with a different Prefetch."
+
+
+def test_plan_custom_optimizations_order_kept():
+    calls = []
+
+    class Custom(DBOptimization):
+        def apply(self, queryset):
+            calls.append((self.main_relation, bool(queryset.query.annotations)))
+            return queryset
+
+    qs = (
+        OptimizationPlan()
+        .add(Custom('first'), Annotation(a=Value(1, IntegerField())), SR('author'))
+        .add(Custom('second'), Annotation(b=Value(2, IntegerField())))
+        .apply(default_qs)
+    )
+
+    assert calls == [('first', False), ('second', True)]
+    assert list(qs.query.annotations.keys()) == ['a', 'b']
+    assert qs.query.select_related == {'author': {}}